@@ -6,6 +6,7 @@
     gettext # manipulate .pot/.po files
     just    # run stuff in the justfile
     icu     # for language aware string sorting
+    qpdf    # linearize pdfs served from the site
   ];
 
   languages.python =
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import appdirs
+import datetime
+import hashlib
+import numpy as np
+
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+from stp import __project__
+from stp.database import CDataBase, CTournamentDataBase, STAGE
+
+class SMatchRow(NamedTuple): # tag = mrow
+	strTourn: str
+	id: int
+	date: datetime.date		# in the tournament's timezone
+	stage: STAGE
+	venue: int
+	strTeamHome: str
+	strTeamAway: str
+	scoreHome: int
+	scoreAway: int
+	scoreHomeTiebreaker: int
+	scoreAwayTiebreaker: int
+
+class CMatchIndex: # tag = mindex
+	""" every match of every tournament in one columnar table, with row lists by team and a date sort
+	order, so queries never have to load a tournament. the table is cached on disk and
+	rebuilt when any tournament's book (or results sidecar) changes. """
+
+	s_pathCache = Path(appdirs.user_cache_dir(__project__)) / 'dbq-index.npz'
+
+	# bump when the columns change
+
+	s_nVersion = 1
+
+	def __init__(self, fRebuild: bool = False) -> None:
+		lStrTourn = CDataBase.LStrNameTournament()
+		strKey = self.StrKey(lStrTourn)
+
+		mpStrA: Optional[dict[str, np.ndarray]] = None if fRebuild else self.MpStrALoad(strKey)
+
+		if mpStrA is None:
+			mpStrA = self.MpStrABuild(lStrTourn)
+			mpStrA['key'] = np.array(strKey)
+			self.SaveMpStrA(mpStrA)
+
+		self.lStrTourn: list[str] = mpStrA['tourn-names'].tolist()
+		self.lStrTeam: list[str] = mpStrA['team-names'].tolist()
+		self.mpStrTeamUpperITeam: dict[str, int] = {strTeam.upper(): iTeam for iTeam, strTeam in enumerate(self.lStrTeam)}
+
+		self.aITourn: np.ndarray = mpStrA['tourn']
+		self.aId: np.ndarray = mpStrA['id']
+		self.aDay: np.ndarray = mpStrA['day']				# days since the epoch
+		self.aStage: np.ndarray = mpStrA['stage']
+		self.aVenue: np.ndarray = mpStrA['venue']
+		self.aITeamHome: np.ndarray = mpStrA['team-home']	# -1 for not known yet
+		self.aITeamAway: np.ndarray = mpStrA['team-away']
+		self.aScoreHome: np.ndarray = mpStrA['score-home']	# -1 for not played yet
+		self.aScoreAway: np.ndarray = mpStrA['score-away']
+		self.aScoreHomeTiebreaker: np.ndarray = mpStrA['tiebreaker-home']
+		self.aScoreAwayTiebreaker: np.ndarray = mpStrA['tiebreaker-away']
+		self.aFSameLetters: np.ndarray = mpStrA['same-letters']
+
+		self.cRow: int = len(self.aId)
+
+		# indexes
+
+		self.aIRowByDay: np.ndarray = np.argsort(self.aDay, kind='stable')
+		self.aDaySorted: np.ndarray = self.aDay[self.aIRowByDay]
+
+		self.mpITeamAIRow: dict[int, np.ndarray] = {}
+		aITeamBoth = np.concatenate((self.aITeamHome, self.aITeamAway))
+		aIRowBoth = np.concatenate((np.arange(self.cRow), np.arange(self.cRow)))
+		aISort = np.argsort(aITeamBoth, kind='stable')
+		for iTeam, aIRow in zip(*self.TuLKeyLARows(aITeamBoth[aISort], aIRowBoth[aISort])):
+			if iTeam >= 0:
+				self.mpITeamAIRow[iTeam] = np.unique(aIRow)
+
+	@staticmethod
+	def TuLKeyLARows(aKeySorted: np.ndarray, aIRow: np.ndarray) -> tuple[list[int], list[np.ndarray]]:
+		""" split rows by runs of the same (sorted) key """
+
+		aIStart = np.flatnonzero(np.r_[True, aKeySorted[1:] != aKeySorted[:-1]])
+		return aKeySorted[aIStart].tolist(), np.split(aIRow, aIStart[1:])
+
+	@classmethod
+	def StrKey(cls, lStrTourn: list[str]) -> str:
+		""" changes whenever a book or results sidecar is added, removed or touched """
+
+		sha = hashlib.sha256(f'{cls.s_nVersion}'.encode())
+
+		for strName in lStrTourn:
+			db = CDataBase(strName)
+			lPath = sorted(db.pathFile.iterdir()) if db.pathFile.is_dir() else [db.pathFile]
+			if db.pathResults.exists():
+				lPath.append(db.pathResults)
+			for path in lPath:
+				stat = path.stat()
+				sha.update(f'{path}\0{stat.st_size}\0{stat.st_mtime_ns}\0'.encode())
+
+		return sha.hexdigest()
+
+	@classmethod
+	def MpStrALoad(cls, strKey: str) -> Optional[dict[str, np.ndarray]]:
+		try:
+			with np.load(cls.s_pathCache, allow_pickle=False) as npz:
+				mpStrA = {strName: npz[strName] for strName in npz.files}
+		except (OSError, ValueError):
+			return None
+
+		if str(mpStrA.get('key', '')) != strKey:
+			return None
+
+		return mpStrA
+
+	@classmethod
+	def SaveMpStrA(cls, mpStrA: dict[str, np.ndarray]) -> None:
+		try:
+			cls.s_pathCache.parent.mkdir(parents=True, exist_ok=True)
+			pathTemp = cls.s_pathCache.with_suffix('.tmp.npz')
+			np.savez(pathTemp, **mpStrA)
+			pathTemp.replace(cls.s_pathCache)
+		except OSError as exc:
+			print(f"warning: can't cache match index to {cls.s_pathCache}: {exc}")
+
+	@staticmethod
+	def MpStrABuild(lStrTourn: list[str]) -> dict[str, np.ndarray]:
+		lStrTeam: list[str] = []
+		mpStrTeamITeam: dict[str, int] = {}
+
+		def ITeam(strTeam: str) -> int:
+			if not strTeam:
+				return -1
+			iTeam = mpStrTeamITeam.get(strTeam)
+			if iTeam is None:
+				iTeam = mpStrTeamITeam[strTeam] = len(lStrTeam)
+				lStrTeam.append(strTeam)
+			return iTeam
+
+		lAITourn: list[np.ndarray] = []
+		lADay: list[np.ndarray] = []
+		lLITeamHome: list[list[int]] = []
+		lLITeamAway: list[list[int]] = []
+		lLFSameLetters: list[list[bool]] = []
+
+		mpStrLA: dict[str, list[np.ndarray]] = {strName: [] for strName in ('id', 'stage', 'venue', 'score-home', 'score-away', 'tiebreaker-home', 'tiebreaker-away')}
+
+		for iTourn, tourn in enumerate(CTournamentDataBase.LTournFromLStrName(lStrTourn)):
+			mstore = tourn.mstore
+			cMatch = len(mstore.aId)
+
+			lAITourn.append(np.full(cMatch, iTourn, dtype=np.int16))
+			lADay.append(tourn.mtimes.LoctFromZoneinfo(ZoneInfo(tourn.StrTimezone())).aDate.astype(np.int32))
+
+			mpStrLA['id'].append(mstore.aId)
+			mpStrLA['stage'].append(mstore.aStage)
+			mpStrLA['venue'].append(mstore.aVenue)
+			mpStrLA['score-home'].append(mstore.aScoreHome)
+			mpStrLA['score-away'].append(mstore.aScoreAway)
+			mpStrLA['tiebreaker-home'].append(mstore.aScoreHomeTiebreaker)
+			mpStrLA['tiebreaker-away'].append(mstore.aScoreAwayTiebreaker)
+
+			lLITeamHome.append([ITeam(strTeam) for strTeam in mstore.lStrTeamHome])
+			lLITeamAway.append([ITeam(strTeam) for strTeam in mstore.lStrTeamAway])
+
+			# the original dbq query: teams whose codes are anagrams (eg LAF v FLA)
+
+			lLFSameLetters.append([
+				bool(strTeamHome) and bool(strTeamAway) and set(strTeamHome) == set(strTeamAway)
+					for strTeamHome, strTeamAway in zip(mstore.lStrTeamHome, mstore.lStrTeamAway)])
+
+		mpStrA: dict[str, np.ndarray] = {strName: np.concatenate(lA) for strName, lA in mpStrLA.items()}
+
+		mpStrA['tourn'] = np.concatenate(lAITourn)
+		mpStrA['day'] = np.concatenate(lADay)
+		mpStrA['team-home'] = np.array([iTeam for lITeam in lLITeamHome for iTeam in lITeam], dtype=np.int32)
+		mpStrA['team-away'] = np.array([iTeam for lITeam in lLITeamAway for iTeam in lITeam], dtype=np.int32)
+		mpStrA['same-letters'] = np.array([fSame for lFSame in lLFSameLetters for fSame in lFSame], dtype=bool)
+		mpStrA['tourn-names'] = np.array(lStrTourn, dtype=str)
+		mpStrA['team-names'] = np.array(lStrTeam, dtype=str)
+
+		return mpStrA
+
+	def AIRowFromDays(self, dayMin: Optional[int], dayMax: Optional[int]) -> np.ndarray:
+		""" rows from dayMin through dayMax (inclusive, either may be open) """
+
+		iMin = 0 if dayMin is None else np.searchsorted(self.aDaySorted, dayMin, side='left')
+		iMax = len(self.aDaySorted) if dayMax is None else np.searchsorted(self.aDaySorted, dayMax, side='right')
+
+		return self.aIRowByDay[iMin:iMax]
+
+	def AIRowFromTeams(self, iterStrTeam: Iterable[str]) -> np.ndarray:
+		""" rows where any of the teams (in any case) plays """
+
+		lAIRow = [self.mpITeamAIRow.get(self.mpStrTeamUpperITeam.get(strTeam.upper(), -1), np.zeros(0, dtype=np.intp)) for strTeam in iterStrTeam]
+		return np.unique(np.concatenate(lAIRow)) if lAIRow else np.zeros(0, dtype=np.intp)
+
+	def Mrow(self, iRow: int) -> SMatchRow:
+		def StrTeam(iTeam: int) -> str:
+			return self.lStrTeam[iTeam] if iTeam >= 0 else ''
+
+		return SMatchRow(
+				self.lStrTourn[self.aITourn[iRow]],
+				int(self.aId[iRow]),
+				datetime.date(1970, 1, 1) + datetime.timedelta(days=int(self.aDay[iRow])),
+				STAGE(int(self.aStage[iRow])),
+				int(self.aVenue[iRow]),
+				StrTeam(int(self.aITeamHome[iRow])),
+				StrTeam(int(self.aITeamAway[iRow])),
+				int(self.aScoreHome[iRow]),
+				int(self.aScoreAway[iRow]),
+				int(self.aScoreHomeTiebreaker[iRow]),
+				int(self.aScoreAwayTiebreaker[iRow]))
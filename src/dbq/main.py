@@ -2,17 +2,172 @@
 
 from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
 
-from stp.database import CDataBase, CTournamentDataBase
+import argparse
+import csv
+import datetime
+import json
+import numpy as np
+import sys
+
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+from stp.database import STAGE
+
+from .index import CMatchIndex, SMatchRow
+
+# every filter narrows the matches (filters AND together); repeating a filter widens it (values OR together)
+
+g_mpStrStageLStage: dict[str, list[STAGE]] = {stage.name.lower(): [stage] for stage in STAGE}
+g_mpStrStageLStage['knockout'] = [stage for stage in STAGE if stage != STAGE.Group]
+
+def DayFromStr(strDate: str) -> int:
+	try:
+		return (datetime.date.fromisoformat(strDate) - datetime.date(1970, 1, 1)).days
+	except ValueError:
+		sys.exit(f"error: bad date '{strDate}' (expected YYYY-MM-DD)")
+
+def TuScoreFromStr(strScore: str) -> tuple[int, int]:
+	lStr = strScore.replace(':', '-').split('-')
+	if len(lStr) != 2 or not all(strPart.strip().isdigit() for strPart in lStr):
+		sys.exit(f"error: bad score '{strScore}' (expected eg 2-1)")
+	return int(lStr[0]), int(lStr[1])
+
+def AIRowQuery(mindex: CMatchIndex, args: argparse.Namespace) -> np.ndarray:
+	""" rows matching every filter in args, in tournament then match order """
+
+	aFSel = np.ones(mindex.cRow, dtype=bool)
+
+	def Narrow(aIRow: np.ndarray) -> None:
+		aFRows = np.zeros(mindex.cRow, dtype=bool)
+		aFRows[aIRow] = True
+		aFSel[:] &= aFRows
+
+	if args.tournament:
+		lITourn = [iTourn for iTourn, strTourn in enumerate(mindex.lStrTourn) if any(strPart in strTourn for strPart in args.tournament)]
+		aFSel &= np.isin(mindex.aITourn, lITourn)
+
+	if args.team:
+		Narrow(mindex.AIRowFromTeams(args.team))
+
+	if args.vs:
+		aIRowVs = mindex.AIRowFromTeams(args.vs)
+		if args.team:
+			# both sides have to be covered, so ARG vs ARG doesn't count
+			setITeam = {mindex.mpStrTeamUpperITeam.get(strTeam.upper(), -2) for strTeam in args.team}
+			setITeamVs = {mindex.mpStrTeamUpperITeam.get(strTeam.upper(), -2) for strTeam in args.vs}
+			aFHome = np.isin(mindex.aITeamHome, list(setITeam))
+			aFAway = np.isin(mindex.aITeamAway, list(setITeam))
+			aFHomeVs = np.isin(mindex.aITeamHome, list(setITeamVs))
+			aFAwayVs = np.isin(mindex.aITeamAway, list(setITeamVs))
+			aFSel &= (aFHome & aFAwayVs) | (aFAway & aFHomeVs)
+		else:
+			Narrow(aIRowVs)
+
+	if args.date_from or args.date_to:
+		Narrow(mindex.AIRowFromDays(
+					DayFromStr(args.date_from) if args.date_from else None,
+					DayFromStr(args.date_to) if args.date_to else None))
+
+	if args.stage:
+		lStage: list[STAGE] = []
+		for strStage in args.stage:
+			lStageAdd = g_mpStrStageLStage.get(strStage.lower())
+			if lStageAdd is None:
+				sys.exit(f"error: unknown stage '{strStage}' (expected one of {', '.join(g_mpStrStageLStage)})")
+			lStage += lStageAdd
+		aFSel &= np.isin(mindex.aStage, [int(stage) for stage in lStage])
+
+	if args.venue:
+		aFSel &= np.isin(mindex.aVenue, args.venue)
+
+	if args.score:
+		aFScore = np.zeros(mindex.cRow, dtype=bool)
+		for strScore in args.score:
+			scoreA, scoreB = TuScoreFromStr(strScore)
+			aFScore |= (mindex.aScoreHome == scoreA) & (mindex.aScoreAway == scoreB)
+			aFScore |= (mindex.aScoreHome == scoreB) & (mindex.aScoreAway == scoreA)
+		aFSel &= aFScore
+
+	if args.played:
+		aFSel &= (mindex.aScoreHome >= 0) & (mindex.aScoreAway >= 0)
+
+	if args.same_letters:
+		aFSel &= mindex.aFSameLetters
+
+	return np.flatnonzero(aFSel)
+
+def StrScore(mrow: SMatchRow) -> str:
+	if mrow.scoreHome < 0 or mrow.scoreAway < 0:
+		return 'v'
+
+	strScore = f'{mrow.scoreHome}-{mrow.scoreAway}'
+
+	if mrow.scoreHomeTiebreaker >= 0 and mrow.scoreAwayTiebreaker >= 0:
+		strScore += f' ({mrow.scoreHomeTiebreaker}-{mrow.scoreAwayTiebreaker})'
+
+	return strScore
+
+def MpStrValFromMrow(mrow: SMatchRow) -> dict[str, Any]:
+	""" columns named like the matches table """
+
+	return {
+		'tournament': mrow.strTourn,
+		'match': mrow.id,
+		'date': mrow.date.isoformat(),
+		'stage': mrow.stage.name.lower(),
+		'venue': mrow.venue,
+		'home-team': mrow.strTeamHome,
+		'away-team': mrow.strTeamAway,
+		'home-score': mrow.scoreHome if mrow.scoreHome >= 0 else None,
+		'away-score': mrow.scoreAway if mrow.scoreAway >= 0 else None,
+		'home-tiebreaker': mrow.scoreHomeTiebreaker if mrow.scoreHomeTiebreaker >= 0 else None,
+		'away-tiebreaker': mrow.scoreAwayTiebreaker if mrow.scoreAwayTiebreaker >= 0 else None,
+	}
+
+def WriteLMrow(lMrow: list[SMatchRow], strFormat: str, file: TextIO) -> None:
+	match strFormat:
+		case 'text':
+			for mrow in lMrow:
+				print(f"{mrow.strTourn}: {mrow.strTeamHome or '?'} {StrScore(mrow)} {mrow.strTeamAway or '?'}... {mrow.date.isoformat()} (match {mrow.id}, {mrow.stage.name.lower()}, venue {mrow.venue})", file=file)
+		case 'csv':
+			lMpStrVal = [MpStrValFromMrow(mrow) for mrow in lMrow]
+			writer = csv.DictWriter(file, fieldnames=list(MpStrValFromMrow(lMrow[0]).keys()) if lMrow else ['tournament'])
+			writer.writeheader()
+			writer.writerows(lMpStrVal)
+		case 'json':
+			json.dump([MpStrValFromMrow(mrow) for mrow in lMrow], file, indent='\t')
+			file.write('\n')
+		case _:
+			assert False
 
 def main():
-	for strName in CDataBase.LStrNameTournament():
-		tourn = CTournamentDataBase.TournFromStrName(strName)
-		for match in tourn.mpIdMatch.values():
-			if not match.strTeamHome:
-				continue
-			if not match.strTeamAway:
-				continue
-			if set(match.strTeamHome) != set(match.strTeamAway):
-				continue
-
-			print(f"{strName}: {match.strTeamHome}v{match.strTeamAway}... {match.tStart.strftime('%Y-%m-%d')}")
+	parser = argparse.ArgumentParser(description="Query matches across every tournament in the database.")
+	parser.add_argument('-t', '--tournament', action='append', help="Tournament name, or part of one (eg 2022, euro)")
+	parser.add_argument('--team', action='append', help="Team code (eg arg), either side")
+	parser.add_argument('--vs', action='append', help="Opponent team code; with --team, only matches between the two")
+	parser.add_argument('--venue', type=int, action='append', help="Venue number (per tournament)")
+	parser.add_argument('--stage', action='append', help=f"Stage ({', '.join(g_mpStrStageLStage)})")
+	parser.add_argument('--from', dest='date_from', help="On or after date (YYYY-MM-DD, tournament local)")
+	parser.add_argument('--to', dest='date_to', help="On or before date (YYYY-MM-DD, tournament local)")
+	parser.add_argument('--score', action='append', help="Final score, either way round (eg 2-1)")
+	parser.add_argument('--played', action='store_true', help="Only matches with results")
+	parser.add_argument('--same-letters', action='store_true', help="Only matches between teams whose codes use the same letters (eg LAF v FLA)")
+	parser.add_argument('-f', '--format', choices=['text', 'csv', 'json'], help="Output format (default text, or from --output's suffix)")
+	parser.add_argument('-o', '--output', type=Path, help="Write to a file instead of stdout")
+	parser.add_argument('--rebuild', action='store_true', help="Rebuild the cached index")
+
+	args = parser.parse_args()
+
+	strFormat: Optional[str] = args.format
+	if strFormat is None:
+		strFormat = args.output.suffix.lower().lstrip('.') if args.output and args.output.suffix.lower() in ('.csv', '.json') else 'text'
+
+	mindex = CMatchIndex(args.rebuild)
+	lMrow = [mindex.Mrow(iRow) for iRow in AIRowQuery(mindex, args)]
+
+	if args.output:
+		with args.output.open('w', newline='', encoding='utf-8') as file:
+			WriteLMrow(lMrow, strFormat, file)
+	else:
+		WriteLMrow(lMrow, strFormat, sys.stdout)
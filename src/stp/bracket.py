@@ -2,7 +2,7 @@ from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo,
 
 import arrow
 
-from typing import TYPE_CHECKING, assert_never
+from typing import TYPE_CHECKING, NamedTuple, assert_never
 
 from bolay import CBlot
 from bolay import JH, JV, SPoint, SRect, RectBoundingBox, SHaloArgs
@@ -14,6 +14,7 @@ from .group import CGroupBlot
 from .calendar import CDayBlot, CElimBlot, CMatchBlot
 
 if TYPE_CHECKING:
+	from .database import CTournamentDataBase
 	from .page import CPage
 
 class CFinalBlot(CBlot): # tag = finalb
@@ -254,6 +255,15 @@ class CFinalBlot(CBlot): # tag = finalb
 					oltbLabelForm = self.Oltb(rectLabelForm, self.page.Fontkey('final.form.label'), self.s_dYFontForm)
 					oltbLabelForm.DrawText(strLabel, colorBlack, JH.Center)
 
+class SBracketLayout(NamedTuple): # tag = bracklay
+	cCol: int
+	cRow: int
+	dX: float
+	dY: float
+	dYMidGrid: float
+	lTuXYIdMatch: tuple[tuple[float, float, int], ...]
+	mpStageRect: dict[STAGE, SRect]		# bounding box of each stage's blots
+
 class CBracketBlot(CBlot): # tag = bracketb
 
 	s_dXStageGap = CElimBlot.s_dX / 8
@@ -262,6 +272,10 @@ class CBracketBlot(CBlot): # tag = bracketb
 	s_dYFontStage = CElimBlot.s_dYDate
 	s_dYStageLabel = s_dYFontStage * 2.0
 
+	# layouts by (tournament, match ids, left to right). see BracklayCompute.
+
+	s_mpTuKeyBracklay: dict[tuple[str, tuple[int, ...], bool], SBracketLayout] = {}
+
 	def __init__(self, page: CPage, setMatch: set[CMatch]) -> None:
 		self.page = page
 		self.tourn = page.tourn
@@ -270,32 +284,60 @@ class CBracketBlot(CBlot): # tag = bracketb
 
 		super().__init__(self.pdf)
 
+		# geometry only depends on the tournament, its matches here and text direction; pages that share
+		# those share a layout, and only the blots and stage labels are rebuilt.
+
+		tuKey = (self.tourn.strName, tuple(sorted(match.id for match in setMatch)), self.page.FIsLeftToRight())
+
+		bracklay = self.s_mpTuKeyBracklay.get(tuKey)
+		if bracklay is None:
+			bracklay = self.s_mpTuKeyBracklay[tuKey] = self.BracklayCompute(self.tourn, setMatch, self.page.FIsLeftToRight())
+
+		self.cCol: int = bracklay.cCol
+		self.cRow: int = bracklay.cRow
+
+		self.dX = bracklay.dX
+		self.dY = bracklay.dY
+		self.dYMidGrid = bracklay.dYMidGrid
+
+		self.lTuXYElimb: list[tuple[float, float, CElimBlot]] = [(x, y, CElimBlot(self.page, self.tourn.mpIdMatch[idMatch])) for x, y, idMatch in bracklay.lTuXYIdMatch]
+
+		self.mpStageTuRectStr: dict[STAGE, tuple[SRect, str]] = {}
+
+		for stage, rectStage in bracklay.mpStageRect.items():
+			strKey = 'stage.' + stage.name.lower()
+			strStage = self.page.StrTranslation(strKey)
+
+			self.mpStageTuRectStr[stage] = (rectStage.Copy(), strStage)
+
+	@classmethod
+	def BracklayCompute(cls, tourn: CTournamentDataBase, setMatch: set[CMatch], fLeftToRight: bool) -> SBracketLayout:
 		lStage: list[STAGE] = list(sorted(set([match.stage for match in setMatch])))
-		mpStageCRow: dict[STAGE, int] = {stage:len(self.tourn.mpStageSetMatch[stage].intersection(setMatch)) // 2 for stage in lStage}
+		mpStageCRow: dict[STAGE, int] = {stage:len(tourn.mpStageSetMatch[stage].intersection(setMatch)) // 2 for stage in lStage}
 
-		self.cCol: int = len(lStage) * 2
-		self.cRow: int = max(mpStageCRow.values())
+		cCol: int = len(lStage) * 2
+		cRow: int = max(mpStageCRow.values())
 
-		dXGrid = self.cCol * CElimBlot.s_dX + (self.cCol - 1) * self.s_dXStageGap
-		dYGrid = self.cRow * CElimBlot.s_dY + (self.cRow - 1) * self.s_dYStageGap
+		dXGrid = cCol * CElimBlot.s_dX + (cCol - 1) * cls.s_dXStageGap
+		dYGrid = cRow * CElimBlot.s_dY + (cRow - 1) * cls.s_dYStageGap
 
-		self.dX = dXGrid
-		self.dY = self.s_dYStageLabel + dYGrid				# earliest stage label pops up above grid
-		self.dYMidGrid = self.s_dYStageLabel + dYGrid / 2.0	# so CCalElim can center bracket with groups
+		dX = dXGrid
+		dY = cls.s_dYStageLabel + dYGrid				# earliest stage label pops up above grid
+		dYMidGrid = cls.s_dYStageLabel + dYGrid / 2.0	# so CCalElim can center bracket with groups
 
 		# figure out offsets for bracket layout
 
-		dXCell = CElimBlot.s_dX + self.s_dXStageGap
-		dYCell = CElimBlot.s_dY + self.s_dYStageGap
+		dXCell = CElimBlot.s_dX + cls.s_dXStageGap
+		dYCell = CElimBlot.s_dY + cls.s_dYStageGap
 
-		mpColX: dict[int, float] = {col : col * dXCell for col in range(self.cCol)}
+		mpColX: dict[int, float] = {col : col * dXCell for col in range(cCol)}
 
 		mpStageRowY: dict[tuple[STAGE, int], float] = {}
 		dYElimbGridMax = (dYGrid - CElimBlot.s_dY) / 2
 		dYElimbGridPerStage = dYElimbGridMax / (len(lStage) - 1)
 
 		for iStage, (stage, cRowStage) in enumerate(mpStageCRow.items()):
-			if cRowStage >= self.cRow:
+			if cRowStage >= cRow:
 				dYStageMin = 0
 				dYGridStage = dYCell
 			else:
@@ -310,68 +352,61 @@ class CBracketBlot(CBlot): # tag = bracketb
 					dYGridStage = 0
 
 			for row in range(cRowStage):
-				mpStageRowY[(stage, row)] = self.s_dYStageLabel + dYStageMin + row * dYGridStage
+				mpStageRowY[(stage, row)] = cls.s_dYStageLabel + dYStageMin + row * dYGridStage
 
 		# allot blots to rows and columns
 
-		setMatchElimLeft = self.tourn.setMatchElimHalfHome if self.page.FIsLeftToRight() else self.tourn.setMatchElimHalfAway
+		setMatchElimLeft = tourn.setMatchElimHalfHome if fLeftToRight else tourn.setMatchElimHalfAway
 
-		self.lTuXYElimb: list[tuple[float, float, CElimBlot]] = []
+		lTuXYIdMatch: list[tuple[float, float, int]] = []
 		mpStageLRect: dict[STAGE, list[SRect]] = {}
 
 		for colLeft, stage in enumerate(lStage):
-			setMatch = self.tourn.mpStageSetMatch[stage]
+			setMatch = tourn.mpStageSetMatch[stage]
 			setMatchLeft = setMatch.intersection(setMatchElimLeft)
 			setMatchRight = setMatch - setMatchLeft
-			tuTuColSetMatchCol = ((colLeft, setMatchLeft), (self.cCol-(1+colLeft), setMatchRight))
+			tuTuColSetMatchCol = ((colLeft, setMatchLeft), (cCol-(1+colLeft), setMatchRight))
 			for col, setMatchCol in tuTuColSetMatchCol:
 				x = mpColX[col]
 				for row, matchCol in enumerate(sorted(setMatchCol, key=lambda match: match.sortElim)):
 					y = mpStageRowY[(stage, row)]
-					elimb = CElimBlot(self.page, matchCol)
-					self.lTuXYElimb.append((x, y, elimb))
-					rectElimb = SRect(x, y, elimb.s_dX, elimb.s_dY)
+					lTuXYIdMatch.append((x, y, matchCol.id))
+					rectElimb = SRect(x, y, CElimBlot.s_dX, CElimBlot.s_dY)
 					mpStageLRect.setdefault(stage, []).append(rectElimb)
 
-		if self.tourn.matchThird:
-			elimbThird = CElimBlot(self.page, self.tourn.matchThird)
-
+		if tourn.matchThird:
 			# center directly below semis, with vertical midpoint even with
 			# bottom of last quarters row.
 
-			xThird = (dXGrid - elimbThird.s_dX) / 2
+			xThird = (dXGrid - CElimBlot.s_dX) / 2
 			yThird = mpStageRowY[(STAGE.Quarters, 1)] + (CElimBlot.s_dY / 2)
 
 			# small tournaments may need top push the third place match down further.
 			# bottom of semis (plus margin for the label) is a hard limit.
 
-			yThird = max(yThird, mpStageRowY[(STAGE.Semis, 0)] + CElimBlot.s_dY + 2 * self.s_dYStageLabel)
+			yThird = max(yThird, mpStageRowY[(STAGE.Semis, 0)] + CElimBlot.s_dY + 2 * cls.s_dYStageLabel)
 
 			# be honest
 
-			self.dY = max(self.dY, yThird + CElimBlot.s_dY)
+			dY = max(dY, yThird + CElimBlot.s_dY)
 
-			self.lTuXYElimb.append((xThird, yThird, elimbThird))
+			lTuXYIdMatch.append((xThird, yThird, tourn.matchThird.id))
 
-			rectElimbThird = SRect(xThird, yThird, elimbThird.s_dX, elimbThird.s_dY)
+			rectElimbThird = SRect(xThird, yThird, CElimBlot.s_dX, CElimBlot.s_dY)
 			mpStageLRect.setdefault(STAGE.Third, []).append(rectElimbThird)
 
-		self.mpStageTuRectStr: dict[STAGE, tuple[SRect, str]] = {}
-
-		for stage, lRect in mpStageLRect.items():
-			rectStage = RectBoundingBox(lRect)
-			strKey = 'stage.' + stage.name.lower()
-			strStage = self.page.StrTranslation(strKey)
+		mpStageRect: dict[STAGE, SRect] = {stage: RectBoundingBox(lRect) for stage, lRect in mpStageLRect.items()}
 
-			self.mpStageTuRectStr[stage] = (rectStage, strStage)
+		return SBracketLayout(cCol, cRow, dX, dY, dYMidGrid, tuple(lTuXYIdMatch), mpStageRect)
 
 	def Draw(self, pos: SPoint) -> None:
 
-		for x, y, elimb in self.lTuXYElimb:
+		with self.pdf.FillBatch():
+			for x, y, elimb in self.lTuXYElimb:
 
-			posDayb = SPoint(pos.x + x, pos.y + y)
+				posDayb = SPoint(pos.x + x, pos.y + y)
 
-			elimb.Draw(posDayb)
+				elimb.Draw(posDayb)
 
 		for stage, (rectStageLocal, strStage) in self.mpStageTuRectStr.items():
 
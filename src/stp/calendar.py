@@ -91,7 +91,7 @@ class CMatchBlot(CBlot): # tag = dayb
 				rectStripe = rectStripe.Copy().Shift(dX=rectStripe.dX)
 
 		for rc in lRc:
-			self.FillBox(rc.rect, rc.color)
+			self.pdf.FillRect(rc.rect, rc.color)
 
 	def DrawInfo(self) -> None:
 
@@ -402,6 +402,8 @@ class CDayBlot(CBlot): # tag = dayb
 
 	s_dYFontLabel = s_dYFontTime * 1.3
 
+	s_mpFontkeyDYTime: dict[SFontKey, float] = {}
+
 	def __init__(self, page: CPage, tDay: arrow.Arrow, iterMatch: Optional[Iterable[CMatch]] = None) -> None:
 		self.page = page
 		self.tourn = page.tourn
@@ -413,16 +415,23 @@ class CDayBlot(CBlot): # tag = dayb
 		super().__init__(self.pdf)
 
 		if iterMatch:
-			self.lMatch = sorted(iterMatch, key=lambda match: (match.tStart, match.strSeedHome))
+			self.lMatch = sorted(iterMatch, key=lambda match: (match.secStart, match.strSeedHome))
 
 			for match in self.lMatch:
 				assert self.tDay.date() == self.page.DateDisplay(match)
 		else:
 			self.lMatch = []
 
-		vekTime = VEK.BaseCap # assuming times across all languages are within the baseline ... cap height
+		# the time font only varies by script, so measure it once per font
+
+		fontkeyTime = self.page.Fontkey('match.time')
+		dYTime = self.s_mpFontkeyDYTime.get(fontkeyTime)
 
-		self.dYTime = CFontInstance(self.pdf, self.page.Fontkey('match.time'), self.s_dYFontTime, vekTime).dYGlyphs
+		if dYTime is None:
+			vekTime = VEK.BaseCap # assuming times across all languages are within the baseline ... cap height
+			dYTime = self.s_mpFontkeyDYTime[fontkeyTime] = CFontInstance(self.pdf, fontkeyTime, self.s_dYFontTime, vekTime).dYGlyphs
+
+		self.dYTime = dYTime
 
 	def Draw(self, pos: SPoint, daybl: CDayBlotList, tPrev: Optional[arrow.Arrow] = None) -> None:
 
@@ -471,7 +480,7 @@ class CDayBlot(CBlot): # tag = dayb
 			if not matchbTop.dYTimeAndGap:
 				continue
 
-			if matchbTop.match.tStart != matchbBottom.match.tStart:
+			if matchbTop.match.secStart != matchbBottom.match.secStart:
 				continue
 
 			dYToSplit = matchbBottom.dYTimeAndGap
@@ -500,17 +509,20 @@ class CDayBlot(CBlot): # tag = dayb
 class CDayBlotList: # tag = daybl
 	def __init__(self, lDayb: list[CDayBlot]):
 		self.lDayb = lDayb
+		self.dXDayb, self.dYDayb = self.TuDxDyDayb(max([len(dayb.lMatch) for dayb in lDayb]))
 
-		self.dXDayb = CDayBlot.s_dXMin
-		self.dYDayb = CDayBlot.s_dYMin
-
-		cMatchMax = max([len(dayb.lMatch) for dayb in lDayb])
+	@staticmethod
+	def TuDxDyDayb(cMatchMax: int) -> tuple[float, float]:
+		dXDayb = CDayBlot.s_dXMin
+		dYDayb = CDayBlot.s_dYMin
 
 		if cMatchMax >= 5:
-			self.dXDayb *= 1.1
-			self.dYDayb *= 1.3
+			dXDayb *= 1.1
+			dYDayb *= 1.3
 		elif cMatchMax <= 2:
-			self.dYDayb *= 0.60
+			dYDayb *= 0.60
+
+		return dXDayb, dYDayb
 
 class CElimBlot(CDayBlot): # tag = elimb
 
@@ -581,6 +593,19 @@ class SDayHeader(NamedTuple): # tag = dayhead
 	strWeekday: str
 	fontkey: SFontKey
 
+class SCalendarLayout(NamedTuple): # tag = calay
+	dateCalMin: datetime.date
+	weekdayFirst: int
+	weekdayLast: int
+	colBreak: int
+	dXBreak: float
+	dXDayb: float
+	dYDayb: float
+	dX: float
+	dY: float
+	lXDayhead: tuple[float, ...]	# by column
+	lDPosDay: tuple[SPoint, ...]	# by day, from dateCalMin
+
 class CCalendarBlot(CBlot): # tag = calb
 
 	s_dYDayOfWeek = CDayBlot.s_dYDate * 2
@@ -588,6 +613,10 @@ class CCalendarBlot(CBlot): # tag = calb
 	s_dYFontStage = CDayBlot.s_dYFontTime
 	s_dYStageLabel = s_dYFontStage * 2.0
 
+	# layouts by (tournament, (display date, match id)s, first weekday, right to left). see CalayCompute.
+
+	s_mpTuKeyCalay: dict[tuple[str, tuple[tuple[datetime.date, int], ...], int, bool], SCalendarLayout] = {}
+
 	def __init__(self, page: CPage, setMatch: set[CMatch]) -> None:
 		self.page = page
 		self.tourn = page.tourn
@@ -597,8 +626,56 @@ class CCalendarBlot(CBlot): # tag = calb
 		super().__init__(self.pdf)
 
 		# added DateDisplay for 2025 CWC... unclear if this breaks previous tourneys (prob 2023 NZ womens WC?)
+		# geometry only depends on which matches land on which display dates, the locale's first day of
+		# the week and text direction, so pages that share those share a layout.
+
+		tuTuDateId = tuple(sorted((self.page.DateDisplay(match), match.id) for match in setMatch))
+		tuKey = (self.tourn.strName, tuTuDateId, self.page.locale.first_week_day, self.page.FIsRightToLeft())
+
+		calay = self.s_mpTuKeyCalay.get(tuKey)
+		if calay is None:
+			calay = self.s_mpTuKeyCalay[tuKey] = self.CalayCompute(tuTuDateId, self.page.locale.first_week_day, self.page.FIsRightToLeft())
+
+		self.weekdayFirst: int = calay.weekdayFirst
+		self.weekdayLast: int = calay.weekdayLast
+		self.colBreak: int = calay.colBreak
+		self.dXBreak: float = calay.dXBreak
+
+		lDayb: list[CDayBlot] = []
+
+		for iDay in range(len(calay.lDPosDay)):
+			tDay = arrow.get(calay.dateCalMin + datetime.timedelta(days=iDay))
+			setMatchDate = self.page.mpDateSetMatch.get(tDay.date(), set()).intersection(setMatch)
+			lDayb.append(CDayBlot(self.page, tDay, iterMatch = setMatchDate))
+
+		self.daybl = CDayBlotList(lDayb)
+		assert (self.daybl.dXDayb, self.daybl.dYDayb) == (calay.dXDayb, calay.dYDayb)
+
+		self.dX = calay.dX
+		self.dY = calay.dY
+
+		# build a list of the days of the week and their positions/fonts
 
-		setDate: set[datetime.date] = {self.page.DateDisplay(match) for match in setMatch}
+		self.lDayhead: list[SDayHeader] = []
+
+		mpWeekdayStr = babel.dates.get_day_names('abbreviated', locale=self.page.locale)
+
+		for col, x in enumerate(calay.lXDayhead):
+			strDayOfWeek = mpWeekdayStr[(col + self.weekdayFirst) % 7]
+			strFontkey = 'calendar.day-of-week'
+			if self.colBreak and (col == self.colBreak or col == self.colBreak - 1):
+				strFontkey = 'calendar.day-of-week-broken'
+			fontkey = self.page.Fontkey(strFontkey)
+
+			self.lDayhead.append(SDayHeader(x, strDayOfWeek, fontkey))
+
+		# all day blots and their relative positions
+
+		self.lDayinst: list[SDayInstance] = [SDayInstance(dPos, dayb) for dPos, dayb in zip(calay.lDPosDay, self.daybl.lDayb)]
+
+	@classmethod
+	def CalayCompute(cls, tuTuDateId: tuple[tuple[datetime.date, int], ...], weekdayFirstLocale: int, fRightToLeft: bool) -> SCalendarLayout:
+		setDate: set[datetime.date] = {date for date, _ in tuTuDateId}
 
 		dateMatchesMin: datetime.date = min(setDate)
 		dateMatchesMax: datetime.date = max(setDate)
@@ -610,19 +687,19 @@ class CCalendarBlot(CBlot): # tag = calb
 
 		# ensure dateMin/dateMax are on week boundries
 
-		self.weekdayFirst: int = self.page.locale.first_week_day
-		self.weekdayLast = (self.weekdayFirst + 6) % 7
-		self.colBreak: int = 0
-		self.dXBreak: float = 0
+		weekdayFirst: int = weekdayFirstLocale
+		weekdayLast = (weekdayFirst + 6) % 7
+		colBreak: int = 0
+		dXBreak: float = 0
 
-		if dateCalMin.weekday() != self.weekdayFirst:
+		if dateCalMin.weekday() != weekdayFirst:
 			# arrow.shift(weekday) always goes forward in time
-			dateCalMin = arrow.get(dateCalMin).shift(weeks=-1).shift(weekday=self.weekdayFirst).date()
+			dateCalMin = arrow.get(dateCalMin).shift(weeks=-1).shift(weekday=weekdayFirst).date()
 
 		# and always go all the way to saturday
 
-		if dateCalMax.weekday() != self.weekdayLast:
-			dateCalMax = arrow.get(dateCalMax).shift(weekday=self.weekdayLast).date()
+		if dateCalMax.weekday() != weekdayLast:
+			dateCalMax = arrow.get(dateCalMax).shift(weekday=weekdayLast).date()
 
 		cDayCal: int = (dateCalMax - dateCalMin).days + 1
 		assert cDayCal % 7 == 0
@@ -635,67 +712,48 @@ class CCalendarBlot(CBlot): # tag = calb
 			# eliminate a weeks worth of match-less days. the first match of the tournament will be
 			# in the far left column no matter what day its on.
 
-			self.weekdayFirst = dateMatchesMin.weekday()
-			self.weekdayLast = (self.weekdayFirst + 6) % 7
-			self.colBreak = (7 + self.page.locale.first_week_day - self.weekdayFirst) % 7
-			assert(self.colBreak)
-			self.dXBreak = 8 * CDayBlot.s_dSLineOuter
+			weekdayFirst = dateMatchesMin.weekday()
+			weekdayLast = (weekdayFirst + 6) % 7
+			colBreak = (7 + weekdayFirstLocale - weekdayFirst) % 7
+			assert(colBreak)
+			dXBreak = 8 * CDayBlot.s_dSLineOuter
 
 			dateCalMin = dateMatchesMin
 			dateCalMax = dateMatchesMax
 
-			if dateCalMax.weekday() != self.weekdayLast:
-				dateCalMax = arrow.get(dateCalMax).shift(weekday=self.weekdayLast).date()
+			if dateCalMax.weekday() != weekdayLast:
+				dateCalMax = arrow.get(dateCalMax).shift(weekday=weekdayLast).date()
 
 			cDayCal = (dateCalMax - dateCalMin).days + 1
 			assert cDayCal % 7 == 0
 			cWeekCal = cDayCal // 7
 			assert cWeekCal == cWeekMatches
 
-		lDayb: list[CDayBlot] = []
+		mpDateCMatch: dict[datetime.date, int] = {}
+		for date, _ in tuTuDateId:
+			mpDateCMatch[date] = mpDateCMatch.get(date, 0) + 1
 
-		for tDay in arrow.Arrow.range('day', arrow.get(dateCalMin), arrow.get(dateCalMax)):
-			setMatchDate = self.page.mpDateSetMatch.get(tDay.date(), set()).intersection(setMatch)
-			lDayb.append(CDayBlot(self.page, tDay, iterMatch = setMatchDate))
+		dXDayb, dYDayb = CDayBlotList.TuDxDyDayb(max(mpDateCMatch.values()))
 
-		self.daybl = CDayBlotList(lDayb)
+		dX = dXBreak + 7 * dXDayb
+		dY = cls.s_dYStageLabel + cls.s_dYDayOfWeek + cWeekCal * dYDayb
 
-		self.dX = self.dXBreak + 7 * self.daybl.dXDayb
-		self.dY = self.s_dYStageLabel + self.s_dYDayOfWeek + cWeekCal * self.daybl.dYDayb
-
-		# build a list of the days of the week and their positions/fonts
-
-		self.lDayhead: list[SDayHeader] = []
-
-		mpWeekdayStr = babel.dates.get_day_names('abbreviated', locale=self.page.locale)
+		lXDayhead: list[float] = []
 
 		for col in range(7):
-			x = col * self.daybl.dXDayb
+			x = col * dXDayb
 
-			if col >= self.colBreak:
-				x += self.dXBreak
+			if col >= colBreak:
+				x += dXBreak
 
-			if self.page.FIsRightToLeft():
-				x = self.dX - (x + self.daybl.dXDayb)
+			if fRightToLeft:
+				x = dX - (x + dXDayb)
 
-			strDayOfWeek = mpWeekdayStr[(col + self.weekdayFirst) % 7]
-			strFontkey = 'calendar.day-of-week'
-			if self.colBreak and (col == self.colBreak or col == self.colBreak - 1):
-				strFontkey = 'calendar.day-of-week-broken'
-			fontkey = self.page.Fontkey(strFontkey)
-
-			self.lDayhead.append(SDayHeader(x, strDayOfWeek, fontkey))
+			lXDayhead.append(x)
 
-		# build a list of all day blots and their relative positions
+		lDPosDay = [SPoint(lXDayhead[iDay % 7], (iDay // 7) * dYDayb) for iDay in range(cDayCal)]
 
-
-		self.lDayinst: list[SDayInstance] = []
-		for iDay, dayb in enumerate(self.daybl.lDayb):
-			col = iDay % 7
-			row = iDay // 7
-
-			dPos = SPoint(self.lDayhead[col].x, row * self.daybl.dYDayb)
-			self.lDayinst.append(SDayInstance(dPos, dayb))
+		return SCalendarLayout(dateCalMin, weekdayFirst, weekdayLast, colBreak, dXBreak, dXDayb, dYDayb, dX, dY, tuple(lXDayhead), tuple(lDPosDay))
 
 	def Draw(self, pos: SPoint) -> None:
 
@@ -741,14 +799,17 @@ class CCalendarBlot(CBlot): # tag = calb
 
 		rectDays = SRect(x = pos.x, y = yDaysMin, dX = self.dX, dY = dYDays)
 
+		# match fills sit inside their days, under everything else, so they can all go down first
+
 		tPrev: Optional[arrow.Arrow] = None
-		for dayinst in self.lDayinst:
+		with self.pdf.FillBatch():
+			for dayinst in self.lDayinst:
 
-			posDayb = SPoint(rectDays.x + dayinst.dPos.x, rectDays.y + dayinst.dPos.y)
+				posDayb = SPoint(rectDays.x + dayinst.dPos.x, rectDays.y + dayinst.dPos.y)
 
-			dayinst.dayb.Draw(posDayb, self.daybl, tPrev)
+				dayinst.dayb.Draw(posDayb, self.daybl, tPrev)
 
-			tPrev = dayinst.dayb.tDay
+				tPrev = dayinst.dayb.tDay
 
 		# border
 
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import hashlib
+
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, DecodedStreamObject, DictionaryObject, EncodedStreamObject, IndirectObject
+from pypdf.generic import NameObject, NumberObject, StreamObject
+
+# the -all pdf is written as its unwound pdfs arrive: each one is read, its pages and everything they
+# reference go out with fresh object numbers, and the reader is dropped. only the xref offsets and the
+# content hashes of what's been written stay in memory, so memory doesn't grow with the page count.
+
+def StrHashPdfObj(obj: Any, mpTuIdStrHash: dict[tuple[int, int], str]) -> str:
+	""" content hash of a pdf object and everything it references, so equal objects from different
+	files compare equal """
+
+	if isinstance(obj, IndirectObject):
+		tuId = (obj.idnum, obj.generation)
+		strHash = mpTuIdStrHash.get(tuId)
+		if strHash is None:
+			mpTuIdStrHash[tuId] = '<cycle>'
+			strHash = mpTuIdStrHash[tuId] = StrHashPdfObj(obj.get_object(), mpTuIdStrHash)
+		return strHash
+
+	sha = hashlib.sha256()
+
+	if isinstance(obj, DictionaryObject):
+		for key in sorted(obj.keys()):
+			if key in ('/Length', '/Filter', '/DecodeParms'):
+				continue
+			sha.update(f'{key}\0{StrHashPdfObj(obj.raw_get(key), mpTuIdStrHash)}\0'.encode())
+		if isinstance(obj, StreamObject):
+			sha.update(obj.get_data())
+	elif isinstance(obj, ArrayObject):
+		for objItem in obj:
+			sha.update(f'{StrHashPdfObj(objItem, mpTuIdStrHash)}\0'.encode())
+	else:
+		sha.update(repr(obj).encode())
+
+	return sha.hexdigest()
+
+class CCollatedPdf: # tag = colpdf
+	""" a pdf written page by page from other pdfs. any object identical to one already written (fonts,
+	their font files, images, icc profiles, shared artwork forms) is pointed at the earlier copy. it's
+	written next to pathOutput and only lands there when Close finishes it. """
+
+	# page attributes a page can inherit from the page tree; written onto each page instead
+
+	s_tuStrKeyInherited = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+
+	# these belong to one page, so copies stay copies
+
+	s_setStrTypeUnique = {'/Page', '/Pages', '/Annot'}
+
+	def __init__(self, pathOutput: Path) -> None:
+		self.pathOutput = pathOutput
+		self.pathTemp = pathOutput.with_name(f'{pathOutput.name}.tmp')
+		self.file: Optional[BinaryIO] = None
+		self.lCbObj: list[int] = []			# file offset of each object, by object number - 1
+		self.lIdPage: list[int] = []
+		self.mpStrHashId: dict[str, int] = {}
+		self.idRoot = 0
+		self.idPages = 0
+		self.idInfo: Optional[int] = None
+		self.cDedup = 0
+
+	def IdReserve(self) -> int:
+		self.lCbObj.append(0)
+		return len(self.lCbObj)
+
+	def WriteObj(self, id: int, obj: Any) -> None:
+		assert self.file
+		self.lCbObj[id - 1] = self.file.tell()
+		self.file.write(f'{id} 0 obj\n'.encode())
+		obj.write_to_stream(self.file)
+		self.file.write(b'\nendobj\n')
+
+	def Append(self, path: Path) -> None:
+		""" add every page of the pdf at path """
+
+		if self.file is None:
+			self.pathOutput.parent.mkdir(parents=True, exist_ok=True)
+			self.file = self.pathTemp.open('wb')
+			self.file.write(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+			self.idRoot = self.IdReserve()
+			self.idPages = self.IdReserve()
+
+		reader = PdfReader(path)
+		mpIdSrcIdDst: dict[int, int] = {}
+		mpTuIdStrHash: dict[tuple[int, int], str] = {}
+
+		# number the pages (and send the page tree to ours) first, so references to them land right
+
+		lTuPageIdDst: list[tuple[Any, int]] = []
+		for page in reader.pages:
+			assert page.indirect_reference
+			idDst = mpIdSrcIdDst[page.indirect_reference.idnum] = self.IdReserve()
+			lTuPageIdDst.append((page, idDst))
+
+			refParent = page.raw_get('/Parent') if '/Parent' in page else None
+			while isinstance(refParent, IndirectObject) and refParent.idnum not in mpIdSrcIdDst:
+				mpIdSrcIdDst[refParent.idnum] = self.idPages
+				dictParent = refParent.get_object()
+				refParent = dictParent.raw_get('/Parent') if '/Parent' in dictParent else None
+
+		for page, idDst in lTuPageIdDst:
+			dictPage = DictionaryObject({key: val for key, val in page.items() if key != '/Parent'})
+
+			for strKey in self.s_tuStrKeyInherited:
+				dictNode = page
+				while strKey not in dictNode and '/Parent' in dictNode:
+					dictNode = dictNode['/Parent']
+				if strKey in dictNode:
+					dictPage[NameObject(strKey)] = dictNode.raw_get(strKey)
+
+			dictPageDst = self.ObjRemapped(dictPage, mpIdSrcIdDst, mpTuIdStrHash)
+			dictPageDst[NameObject('/Parent')] = IndirectObject(self.idPages, 0, None)
+			self.WriteObj(idDst, dictPageDst)
+			self.lIdPage.append(idDst)
+
+		if self.idInfo is None and isinstance(refInfo := reader.trailer.raw_get('/Info'), IndirectObject):
+			self.idInfo = self.IdCopy(refInfo, mpIdSrcIdDst, mpTuIdStrHash)
+
+	def IdCopy(self, ref: IndirectObject, mpIdSrcIdDst: dict[int, int], mpTuIdStrHash: dict[tuple[int, int], str]) -> int:
+		""" the number, in our file, of the object ref points at. written now unless it (or an identical
+		object) already was. """
+
+		idDst = mpIdSrcIdDst.get(ref.idnum)
+		if idDst is not None:
+			return idDst
+
+		obj = ref.get_object()
+		fUnique = isinstance(obj, DictionaryObject) and (obj.get('/Type') in self.s_setStrTypeUnique or '/P' in obj)
+
+		strHash = '' if fUnique else StrHashPdfObj(ref, mpTuIdStrHash)
+
+		if strHash in self.mpStrHashId:
+			self.cDedup += 1
+			idDst = mpIdSrcIdDst[ref.idnum] = self.mpStrHashId[strHash]
+			return idDst
+
+		idDst = mpIdSrcIdDst[ref.idnum] = self.IdReserve()
+		if not fUnique:
+			self.mpStrHashId[strHash] = idDst
+
+		self.WriteObj(idDst, self.ObjRemapped(obj, mpIdSrcIdDst, mpTuIdStrHash))
+
+		return idDst
+
+	def ObjRemapped(self, obj: Any, mpIdSrcIdDst: dict[int, int], mpTuIdStrHash: dict[tuple[int, int], str]) -> Any:
+		""" copy of obj with references renumbered for our file. streams keep their encoded bytes. """
+
+		if isinstance(obj, IndirectObject):
+			return IndirectObject(self.IdCopy(obj, mpIdSrcIdDst, mpTuIdStrHash), 0, None)
+
+		if isinstance(obj, DictionaryObject):
+			if isinstance(obj, StreamObject):
+				dictDst: DictionaryObject = EncodedStreamObject() if '/Filter' in obj else DecodedStreamObject()
+				dictDst._data = obj._data	# type: ignore[attr-defined]
+			else:
+				dictDst = DictionaryObject()
+			for key, val in obj.items():
+				if key == '/Length' and isinstance(dictDst, StreamObject):
+					continue		# written from the data
+				dictDst[NameObject(key)] = self.ObjRemapped(val, mpIdSrcIdDst, mpTuIdStrHash)
+			return dictDst
+
+		if isinstance(obj, ArrayObject):
+			return ArrayObject([self.ObjRemapped(val, mpIdSrcIdDst, mpTuIdStrHash) for val in obj])
+
+		return obj
+
+	def Close(self) -> None:
+		""" write the page tree, catalog, xref and trailer, then move the finished file to pathOutput """
+
+		if self.file is None:
+			return
+
+		self.WriteObj(self.idPages, DictionaryObject({
+			NameObject('/Type'): NameObject('/Pages'),
+			NameObject('/Kids'): ArrayObject([IndirectObject(idPage, 0, None) for idPage in self.lIdPage]),
+			NameObject('/Count'): NumberObject(len(self.lIdPage)),
+		}))
+
+		self.WriteObj(self.idRoot, DictionaryObject({
+			NameObject('/Type'): NameObject('/Catalog'),
+			NameObject('/Pages'): IndirectObject(self.idPages, 0, None),
+		}))
+
+		cbXref = self.file.tell()
+		self.file.write(f'xref\n0 {len(self.lCbObj) + 1}\n0000000000 65535 f \n'.encode())
+		self.file.write(''.join(f'{cbObj:010d} 00000 n \n' for cbObj in self.lCbObj).encode())
+
+		trailer = DictionaryObject({
+			NameObject('/Size'): NumberObject(len(self.lCbObj) + 1),
+			NameObject('/Root'): IndirectObject(self.idRoot, 0, None),
+		})
+		if self.idInfo is not None:
+			trailer[NameObject('/Info')] = IndirectObject(self.idInfo, 0, None)
+
+		self.file.write(b'trailer\n')
+		trailer.write_to_stream(self.file)
+		self.file.write(f'\nstartxref\n{cbXref}\n%%EOF\n'.encode())
+
+		self.file.close()
+		self.file = None
+
+		self.pathTemp.replace(self.pathOutput)
+
+	def Abort(self) -> None:
+		""" drop the partly written file. nothing to do once Close has finished. """
+
+		if self.file is not None:
+			self.file.close()
+			self.file = None
+
+		self.pathTemp.unlink(missing_ok=True)
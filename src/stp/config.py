@@ -112,6 +112,11 @@ class SDocumentArgs(BaseModel): # tag = doca
 	fAllTournaments:	bool		= Field(default=False,			alias='all_tournaments')
 	fDefault:			bool		= Field(default=False,			alias='default')
 	coloring:			COLORING    = Field(default=COLORING.Srgb,	alias='coloring')
+	fLinearize:			bool		= Field(default=False,			alias='linearize')	# fast web view, for pdfs served from the site
+	fPreviews:			bool		= Field(default=False,			alias='previews')	# thumbnail and preview images, for the grid site
+	mpStrFmtKbBudget:	dict[str, int]	= Field(default={},			alias='size_budget')	# KB per paper format; over budget warns
+	fSizeBudgetStrict:	bool		= Field(default=False,			alias='size_budget_strict')	# over budget fails instead
+	fSizeReport:		bool		= Field(default=False,			alias='size_report')	# print where each pdf's bytes go
 
 	def PathOutput(self, strName: str, lPage: list[CPage] = []) -> Path:
 		pathDirOutput = Path.cwd()
@@ -170,6 +175,8 @@ def ParseArgs() -> Tap:
 		jobs: int = 0  # Parallel worker count; 0 = os.cpu_count(), 1 = serial.
 		profile: bool = False  # Enable cProfile instrumentation; writes profiles/run-<ts>.prof.
 		profile_dump: Optional[str] = None  # Dump top cumulative-time stats from this .prof file and exit.
+		results: Optional[str] = None  # Apply a results patch (.csv/.json) and only rebuild the documents it changes.
+		size_report: bool = False  # Print each pdf's size by fonts, images, icc profile and content.
 
 		def configure(self):
 			self.add_argument('-t', '--tournament')
@@ -192,7 +199,12 @@ def DocaUnwind(doca: SDocumentArgs, pagea: SPageArgs) -> SDocumentArgs:
 			file_suffix='',
 			auto_file_suffix=True,
 			unwind_pages=False,
-			grid_member=doca.fFillGrid)
+			grid_member=doca.fFillGrid,
+			linearize=doca.fLinearize,
+			previews=doca.fPreviews,
+			size_budget=doca.mpStrFmtKbBudget,
+			size_budget_strict=doca.fSizeBudgetStrict,
+			size_report=doca.fSizeReport)
 
 class SWorklist(NamedTuple): # tag = wl
 	lDoca: list[SDocumentArgs]
@@ -223,6 +235,9 @@ def IterDoca(args: Tap) -> Iterator[SDocumentArgs]:
 	if not doca.strDirOutput:
 		doca = doca.model_copy(update={'strDirOutput': args.output_dir })
 
+	if args.size_report:
+		doca = doca.model_copy(update={'fSizeReport': True })
+
 	if doca.fAllTournaments:
 		assert(not doca.strNameTourn)
 		assert(not doca.fUnwindPages)
@@ -270,7 +285,12 @@ def IterDoca(args: Tap) -> Iterator[SDocumentArgs]:
 						output_dir = doca.strDirOutput,
 						file_suffix='',
 						auto_file_suffix=False,
-						unwind_pages=False)
+						unwind_pages=False,
+						linearize=doca.fLinearize,
+						previews=doca.fPreviews,
+						size_budget=doca.mpStrFmtKbBudget,
+						size_budget_strict=doca.fSizeBudgetStrict,
+						size_report=doca.fSizeReport)
 
 			yield DocaUnwind(doca, pagea)				
 
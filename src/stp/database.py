@@ -4,16 +4,28 @@ from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo,
 
 import arrow
 import copy
+import csv
+import hashlib
+import itertools
+import json
+import numpy as np
 import openpyxl
+import os
 import re
+import sys
 
+from concurrent.futures import ProcessPoolExecutor
 from enum import IntEnum, auto
-from typing import Optional, cast
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sequence, cast
 
 from bolay import IntEnum0, EnumTuple, SColor, ColorFromStr, ColorResaturate, ColorResaturateDarker, FIsSaturated
 
 from . import __project__, __version__, __author_email__, g_pathCode
-from .loc import g_loc
+from .loc import g_loc, CZoneClasses
+from .results import SScoreUpdate, LScoreuFromPath, SaveLScoreu
+from .standings import CGroupTable, CStandings
+from .zones import CMatchTimes
 
 TExcelRow = dict[str, str]				# tag = xlrow
 TExcelSheet = list[TExcelRow]			# tag = xls
@@ -23,52 +35,327 @@ class CDataBase: # tag = db
 
 	s_pathDir = g_pathCode / 'database'
 
+	# bump when the parse below changes what ends up in a TExcelBook, so stale snapshots get rebuilt
+
+	s_nVersionSnapshot = 1
+
 	@classmethod
 	def LStrNameTournament(cls) -> list[str]:
-		lPath = cls.s_pathDir.glob('*.xlsx')
-		return [path.stem for path in sorted(lPath) if path.stem != 'localization' and path.stem[0].isdigit()]
+		setStrName: set[str] = set()
+
+		for path in cls.s_pathDir.iterdir():
+			strName = StrNameFromPathBook(path)
+			if strName and strName != 'localization' and strName[0].isdigit():
+				setStrName.add(strName)
+
+		return sorted(setStrName)
 
 	def __init__(self, strName: str) -> None:
 
 		self.strName = strName
-		self.pathFile = self.s_pathDir / (strName + '.xlsx')
+		self.pathFile = PathBookFromDirName(self.s_pathDir, strName)
+		self.pathSnapshot = self.s_pathDir / (strName + g_strSuffixSnapshot)
+		self.pathResults = self.s_pathDir / (strName + g_strSuffixResults)
+
+		# the compiled tournament topology that came with the snapshot, if any (see CTournamentDataBase)
+
+		self.objTopologySnapshot: Optional[dict[str, Any]] = None
 
 	def XlbLoad(self) -> TExcelBook:
-		wb = openpyxl.load_workbook(filename = str(self.pathFile), data_only=True)
-		
-		xlb: TExcelBook = {}
-		
-		for ws in wb.worksheets:
+		""" load the workbook from its snapshot if the xlsx hasn't changed since it was taken, otherwise
+		parse the xlsx (slow) and take a new snapshot. json and csv books are quick to parse, so they
+		are never snapshotted. """
+
+		if (xlb := self.XlbLoadQuick()) is not None:
+			return xlb
+
+		xlb = self.XlbParse()
+
+		self.SaveSnapshot(self.StrHash(), xlb)
+
+		return xlb
+
+	def XlbLoadQuick(self) -> Optional[TExcelBook]:
+		""" the workbook, if it can be had without parsing an xlsx. """
+
+		if self.pathFile.suffix != '.xlsx':
+			return self.XlbParse()
+
+		return self.XlbFromSnapshot(self.StrHash())
+
+	def StrHash(self) -> str:
+		if self.pathFile.is_dir():
+			sha = hashlib.sha256()
+			for pathCsv in sorted(self.pathFile.glob('*.csv')):
+				sha.update(f'{pathCsv.name}\0'.encode())
+				sha.update(pathCsv.read_bytes())
+			return sha.hexdigest()
+
+		return hashlib.sha256(self.pathFile.read_bytes()).hexdigest()
+
+	def LScoreuSidecar(self) -> list[SScoreUpdate]:
+		""" the results saved by stp --results since the book was last edited. once the book changes they
+		could undo a fix made there, so they're dropped instead. """
+
+		try:
+			obj = json.loads(self.pathResults.read_text(encoding='utf-8'))
+		except FileNotFoundError:
+			return []
+		except (OSError, ValueError) as exc:
+			sys.exit(f"error: can't read results from {self.pathResults}: {exc}")
+
+		if not isinstance(obj, dict) or obj.get('hash') != self.StrHash():
+			print(f"results: {self.pathFile.name} changed since {self.pathResults.name} was saved; dropping it")
+			self.pathResults.unlink(missing_ok=True)
+			return []
+
+		return LScoreuFromPath(self.pathResults)
+
+	def SaveLScoreuSidecar(self, lScoreu: list[SScoreUpdate]) -> None:
+		SaveLScoreu(self.pathResults, lScoreu, self.StrHash())
+
+	def XlbFromSnapshot(self, strHash: str) -> Optional[TExcelBook]:
+		try:
+			obj = json.loads(self.pathSnapshot.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			return None
+
+		if not isinstance(obj, dict):
+			return None
+
+		if obj.get('version') != self.s_nVersionSnapshot or obj.get('hash') != strHash:
+			return None
+
+		self.objTopologySnapshot = obj.get('topology')
+
+		return obj.get('xlb')
+
+	def SaveSnapshot(self, strHash: str, xlb: TExcelBook) -> None:
+		self.WriteSnapshot({
+			'version': self.s_nVersionSnapshot,
+			'hash': strHash,
+			'xlb': xlb,
+		})
+
+	def ObjTopologyLoad(self) -> Optional[dict[str, Any]]:
+		""" the topology saved with the snapshot. it carries its own hash (see StrHashTopology()), so it's
+		checked against the book by the caller, not here. """
+
+		if self.objTopologySnapshot is not None or self.pathFile.suffix != '.xlsx':
+			return self.objTopologySnapshot
+
+		try:
+			obj = json.loads(self.pathSnapshot.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			return None
+
+		if not isinstance(obj, dict) or obj.get('version') != self.s_nVersionSnapshot:
+			return None
+
+		return obj.get('topology')
+
+	def SaveTopology(self, objTopology: dict[str, Any]) -> None:
+		""" add the topology to an up to date snapshot. books without snapshots just compile it every time. """
+
+		if self.pathFile.suffix != '.xlsx':
+			return
+
+		try:
+			obj = json.loads(self.pathSnapshot.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			return
+
+		if not isinstance(obj, dict) or obj.get('version') != self.s_nVersionSnapshot or obj.get('hash') != self.StrHash():
+			return
+
+		obj['topology'] = objTopology
+		self.objTopologySnapshot = objTopology
+
+		self.WriteSnapshot(obj)
+
+	def WriteSnapshot(self, obj: dict[str, Any]) -> None:
+		# write then rename, so concurrent loaders (eg worker processes) never see a partial snapshot
+
+		pathTemp = self.pathSnapshot.with_name(f'{self.pathSnapshot.name}.{os.getpid()}.tmp')
+
+		try:
+			pathTemp.write_text(json.dumps(obj, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+			pathTemp.replace(self.pathSnapshot)
+		except OSError as exc:
+			print(f"warning: can't write snapshot {self.pathSnapshot}: {exc}")
+
+	def XlbParse(self) -> TExcelBook:
+		return XlbFromPathBook(self.pathFile)
+
+# a tournament's tables (properties, seeds, matches) can live in any of these books, checked in this order:
+#
+#	<name>.xlsx		one sheet per table
+#	<name>.json		{"<table>": [{"<column>": value, ...}, ...], ...}
+#	<name>/			one <table>.csv per table
+#
+# all of them produce the same TExcelBook and follow the same rules (lowercased headers/table names,
+# '#' tables and rows skipped, empty cells as '').
+
+g_strSuffixSnapshot = '.snapshot.json'
+g_strSuffixResults = '.results.json'
+
+# bump when CTournamentDataBase.CompileTopology() changes what it derives
+
+g_nVersionTopology = 1
+
+def StrHashTopology(xlb: TExcelBook) -> str:
+	""" a tournament's topology only depends on its seeds and which seeds play in which match, so
+	results, times, venues and team names can change without recompiling it """
+
+	obj = [
+		g_nVersionTopology,
+		sorted(xlrow['seed'] for xlrow in xlb['seeds']),
+		[(xlrow['match'], xlrow['home-seed'], xlrow['away-seed']) for xlrow in xlb['matches']],
+	]
+
+	return hashlib.sha256(json.dumps(obj, separators=(',', ':')).encode()).hexdigest()
+
+def StrNameFromPathBook(path: Path) -> Optional[str]:
+	if path.is_dir():
+		return path.name if (path / 'matches.csv').exists() else None
+
+	if path.name.endswith(g_strSuffixSnapshot) or path.name.endswith(g_strSuffixResults):
+		return None
+
+	if path.suffix in ('.xlsx', '.json'):
+		return path.stem
+
+	return None
+
+def PathBookFromDirName(pathDir: Path, strName: str) -> Path:
+	for path in (pathDir / (strName + '.xlsx'), pathDir / (strName + '.json'), pathDir / strName):
+		if path.exists():
+			return path
+
+	# not found... let the xlsx load fail like it always has
+
+	return pathDir / (strName + '.xlsx')
+
+def XlbFromPathBook(path: Path) -> TExcelBook:
+	if path.is_dir():
+		return XlbFromPathCsvDir(path)
+
+	if path.suffix == '.json':
+		return XlbFromPathJson(path)
+
+	return XlbFromPathXlsx(path)
+
+def XlbFromPathJson(pathJson: Path) -> TExcelBook:
+	obj = json.loads(pathJson.read_text(encoding='utf-8'))
+
+	if not isinstance(obj, dict):
+		sys.exit(f"error: {pathJson} should hold an object of tables")
+
+	xlb: TExcelBook = {}
+
+	for strTable, lObjRow in obj.items():
+		if strTable.startswith('#'):
+			continue
+
+		# dict rows become a header row plus value rows, so they get walked like any sheet
+
+		lStrKey: list[str] = []
+		for objRow in lObjRow:
+			lStrKey += [strKey for strKey in objRow if strKey not in lStrKey]
+
+		iterLVal = itertools.chain([lStrKey], ([objRow.get(strKey) for strKey in lStrKey] for objRow in lObjRow))
+
+		xlb[strTable.lower()] = XlsFromIterLVal(iterLVal) if lStrKey else []
+
+	return xlb
+
+def XlbFromPathCsvDir(pathDir: Path) -> TExcelBook:
+	xlb: TExcelBook = {}
+
+	for pathCsv in sorted(pathDir.glob('*.csv')):
+		if pathCsv.stem.startswith('#'):
+			continue
+
+		with pathCsv.open(newline='', encoding='utf-8-sig') as fileCsv:
+			xlb[pathCsv.stem.lower()] = XlsFromIterLVal(csv.reader(fileCsv))
+
+	return xlb
+
+# workbooks this big are streamed (see XlbFromPathXlsx)
+
+g_cBytesStreamingMin = 1024 * 1024
+
+def XlsFromIterLVal(iterLVal: Iterable[Sequence[Any]]) -> TExcelSheet:
+	""" a sheet from its rows of cell values. the first row (that isn't skipped) is the header. """
+
+	lStrKey: list[str] = []
+	lStrFill: list[str] = []
+	xls: TExcelSheet = []
+	for lValRow in iterLVal:
+		lValRow = list(lValRow)
+		# skip empty rows and rows starting with a '#'
+		if not any(val is not None and val != '' for val in lValRow):
+			continue
+		valStart = lValRow[0]
+		strStart = '' if valStart is None else str(valStart)
+		if strStart.startswith('#'):
+			continue
+		if not lStrKey:
+			while not lValRow[-1]:
+				del lValRow[-1]
+			assert all(lValRow), f'header row has an empty value: {lValRow}'
+			lStrKey = [cast(str, val).lower() for val in lValRow]
+			assert lStrKey
+			lStrFill = [''] * len(lStrKey)
+		else:
+			lStrValue: list[str] = ['' if val is None else str(val) for val in lValRow] + lStrFill
+			xlrow: TExcelRow = dict(zip(lStrKey, lStrValue))
+			xls.append(xlrow)
+
+	return xls
+
+def XlbFromPathXlsx(
+		pathXlsx: Path,
+		fStreaming: Optional[bool] = None,
+		setStrSheet: Optional[set[str]] = None) -> TExcelBook:
+	""" parse any workbook (eg the big ones in source-data) into a TExcelBook, optionally limited to
+	the named sheets.
+
+	streaming uses openpyxl's read-only mode, which reads rows lazily as plain values instead of building
+	every cell object of every sheet up front, and only ever opens the sheets we keep. by default, only
+	big workbooks stream. """
+
+	if fStreaming is None:
+		fStreaming = pathXlsx.stat().st_size >= g_cBytesStreamingMin
+
+	wb = openpyxl.load_workbook(filename = str(pathXlsx), data_only=True, read_only=fStreaming)
+
+	xlb: TExcelBook = {}
+
+	try:
+		for strTitle in wb.sheetnames:
 			# skip worksheets starting with pound sign... so we can have scratch sheets for conversion work
-			if str(ws.title).startswith('#'):
+			if strTitle.startswith('#'):
 				continue
-			lStrKey: list[str] = []
-			lStrFill: list[str] = []
-			xls: TExcelSheet = []
-			for row in ws.rows:
-				lValRow = [cell.value for cell in row]
-				# skip empty rows and rows starting with a '#'
-				if not lValRow:
-					continue
-				valStart = lValRow[0]
-				strStart = '' if valStart is None else str(valStart)
-				if strStart.startswith('#'):
-					continue
-				if not lStrKey:
-					while not lValRow[-1]:
-						del lValRow[-1]
-					assert all(lValRow), f'header row has an empty value: {lValRow}'
-					lStrKey = [cast(str, val).lower() for val in lValRow]
-					assert lStrKey
-					lStrFill = [''] * len(lStrKey)
-				else:
-					lStrValue: list[str] = ['' if val is None else str(val) for val in lValRow] + lStrFill
-					xlrow: TExcelRow = dict(zip(lStrKey, lStrValue))
-					xls.append(xlrow)
-			xlb[str(ws.title).lower()] = xls
 
-		return xlb
+			if setStrSheet is not None and strTitle.lower() not in setStrSheet:
+				continue
+
+			ws = wb[strTitle]
+
+			if fStreaming:
+				iterLVal: Iterable[Sequence[Any]] = ws.iter_rows(values_only=True)
+			else:
+				iterLVal = ([cell.value for cell in row] for row in ws.rows)
 
+			xlb[strTitle.lower()] = XlsFromIterLVal(iterLVal)
+	finally:
+		# read-only workbooks hold their zip file open until closed
+
+		if fStreaming:
+			wb.close()
+
+	return xlb
 
 class STAGE(IntEnum):
 	Group = auto()
@@ -122,8 +409,9 @@ class CResults:
 		self.lResult: list[SResult] = []
 		self.cPoint = 0
 		self.strPlace = ''
+		self.strPlaceStandings = ''		# for teams the knockout seeds don't place (see MpStrTeamResults)
 
-		for match in sorted(setMatch, key=lambda match: match.tStart):
+		for match in sorted(setMatch, key=lambda match: match.secStart):
 			if match.stage == stageElimFirst:
 				if strTeam == match.strTeamHome:
 					strSeed = match.strSeedHome
@@ -156,39 +444,150 @@ class CResults:
 
 				self.lResult.append(SResult(cGoalFor, cGoalAgainst, cPoint))
 
+class CMatchStore: # tag = mstore
+	""" a tournament's matches, stored by column. numbers live in compact numpy arrays and strings in
+	parallel lists. CMatch objects are just (store, index) views onto a row. """
+
+	def __init__(self, tourn: CTournamentDataBase, xls: TExcelSheet) -> None:
+		self.tourn = tourn
+
+		cMatch = len(xls)
+
+		self.aId: np.ndarray = np.zeros(cMatch, dtype=np.int32)
+		self.aVenue: np.ndarray = np.zeros(cMatch, dtype=np.int16)
+		self.aSecStart: np.ndarray = np.zeros(cMatch, dtype=np.int64)		# utc epoch seconds
+		self.aScoreHome: np.ndarray = np.full(cMatch, -1, dtype=np.int16)
+		self.aScoreAway: np.ndarray = np.full(cMatch, -1, dtype=np.int16)
+		self.aScoreHomeTiebreaker: np.ndarray = np.full(cMatch, -1, dtype=np.int16)
+		self.aScoreAwayTiebreaker: np.ndarray = np.full(cMatch, -1, dtype=np.int16)
+		self.aFAfterExtraTime: np.ndarray = np.zeros(cMatch, dtype=bool)
+		self.aStage: np.ndarray = np.zeros(cMatch, dtype=np.int8)			# 0 is no stage (yet)
+		self.aIdFeederHome: np.ndarray = np.full(cMatch, -1, dtype=np.int32)	# -1 is no feeder
+		self.aIdFeederAway: np.ndarray = np.full(cMatch, -1, dtype=np.int32)
+		self.aIdFeeding: np.ndarray = np.full(cMatch, -1, dtype=np.int32)
+		self.aSortElim: np.ndarray = np.zeros(cMatch, dtype=np.int32)
+		self.aHalf: np.ndarray = np.zeros(cMatch, dtype=np.int8)				# 0 is neither, 1 feeds the final's home side, 2 its away side
+
+		self.lStrSeedHome: list[str] = [''] * cMatch
+		self.lStrSeedAway: list[str] = [''] * cMatch
+		self.lStrTeamHome: list[str] = [''] * cMatch
+		self.lStrTeamAway: list[str] = [''] * cMatch
+		self.lLStrGroup: list[list[str]] = [[] for _ in range(cMatch)]
+
+		self.lMatch: list[CMatch] = [CMatch(self, i, xlrow) for i, xlrow in enumerate(xls)]
+
+		# stage and bracket half membership as index arrays. see IndexStages().
+
+		self.mpStageAI: dict[STAGE, np.ndarray] = {}
+		self.aIElimHalfHome: np.ndarray = np.zeros(0, dtype=np.intp)
+		self.aIElimHalfAway: np.ndarray = np.zeros(0, dtype=np.intp)
+
+	def IndexStages(self) -> None:
+		""" called once every match has its stage and half """
+
+		assert np.all(self.aStage != 0)
+
+		self.mpStageAI = {stage: np.flatnonzero(self.aStage == stage) for stage in STAGE if np.any(self.aStage == stage)}
+		self.aIElimHalfHome = np.flatnonzero(self.aHalf == 1)
+		self.aIElimHalfAway = np.flatnonzero(self.aHalf == 2)
+
+	def ObjTopology(self, strHash: str) -> dict[str, Any]:
+		return {
+			'hash': strHash,
+			'stage': self.aStage.tolist(),
+			'sort-elim': self.aSortElim.tolist(),
+			'feeding': self.aIdFeeding.tolist(),
+			'half': self.aHalf.tolist(),
+			'groups': [''.join(lStrGroup) for lStrGroup in self.lLStrGroup],
+		}
+
+	def ApplyTopology(self, objTopology: dict[str, Any]) -> None:
+		self.aStage[:] = objTopology['stage']
+		self.aSortElim[:] = objTopology['sort-elim']
+		self.aIdFeeding[:] = objTopology['feeding']
+		self.aHalf[:] = objTopology['half']
+		self.lLStrGroup = [list(strGroups) for strGroups in objTopology['groups']]
+
+	def LMatchFromAI(self, aI: np.ndarray) -> list[CMatch]:
+		return [self.lMatch[i] for i in aI]
+
+class CColumn: # tag = col
+	""" a CMatch attribute that reads and writes a column of its CMatchStore. numpy columns convert to
+	plain python values on the way out. columns of optional values store valNone in place of None. """
+
+	def __init__(self, strColumn: str, fnFromVal: Optional[Callable[[Any], Any]] = None, valNone: Any = None) -> None:
+		self.strColumn = strColumn
+		self.fnFromVal = fnFromVal
+		self.valNone = valNone
+
+	def __get__(self, match: Optional[CMatch], clsOwner: Optional[type] = None) -> Any:
+		if match is None:
+			return self
+
+		val = getattr(match.mstore, self.strColumn)[match.i]
+
+		if self.valNone is not None and val == self.valNone:
+			return None
+
+		return self.fnFromVal(val) if self.fnFromVal else val
+
+	def __set__(self, match: CMatch, val: Any) -> None:
+		getattr(match.mstore, self.strColumn)[match.i] = self.valNone if val is None else val
+
 class CMatch:
 	s_patAlphaNum = re.compile('([a-zA-Z]+)-*([0-9]+)')
 	s_patNumAlpha = re.compile('([0-9]+)-*([a-zA-Z]+)')
 
-	def __init__(self, tourn: CTournamentDataBase, xlrow: TExcelRow) -> None:
-		self.tourn = tourn
+	__slots__ = ('mstore', 'i')
+
+	id					= CColumn('aId', int)
+	venue				= CColumn('aVenue', int)
+	secStart			= CColumn('aSecStart', int)
+	scoreHome			= CColumn('aScoreHome', int)
+	scoreAway			= CColumn('aScoreAway', int)
+	scoreHomeTiebreaker	= CColumn('aScoreHomeTiebreaker', int)
+	scoreAwayTiebreaker	= CColumn('aScoreAwayTiebreaker', int)
+	fAfterExtraTime		= CColumn('aFAfterExtraTime', bool)
+	stage				= CColumn('aStage', STAGE, valNone=0)
+	idFeederHome		= CColumn('aIdFeederHome', int, valNone=-1)
+	idFeederAway		= CColumn('aIdFeederAway', int, valNone=-1)
+	idFeeding			= CColumn('aIdFeeding', int, valNone=-1)
+	sortElim			= CColumn('aSortElim', int)
+	strSeedHome			= CColumn('lStrSeedHome')
+	strSeedAway			= CColumn('lStrSeedAway')
+	strTeamHome			= CColumn('lStrTeamHome')
+	strTeamAway			= CColumn('lStrTeamAway')
+	lStrGroup			= CColumn('lLStrGroup')
+
+	def __init__(self, mstore: CMatchStore, i: int, xlrow: TExcelRow) -> None:
+		self.mstore = mstore
+		self.i = i
+
+		tourn = mstore.tourn
+
 		self.id = int(xlrow['match'])
-		self.venue: int = int(xlrow['venue'])
-		self.strSeedHome: str = xlrow['home-seed']
-		self.strSeedAway: str = xlrow['away-seed']
-		self.tStart: arrow.Arrow = arrow.get(xlrow['time'])
+		self.venue = int(xlrow['venue'])
+		self.strSeedHome = xlrow['home-seed']
+		self.strSeedAway = xlrow['away-seed']
+		self.secStart = arrow.get(xlrow['time']).int_timestamp
 
-		self.strTeamHome: str = xlrow['home-team'] if xlrow['home-team'] else tourn.mpStrSeedStrTeam.get(self.strSeedHome, '')
-		self.strTeamAway: str = xlrow['away-team'] if xlrow['away-team'] else tourn.mpStrSeedStrTeam.get(self.strSeedAway, '')
+		self.strTeamHome = xlrow['home-team'] if xlrow['home-team'] else tourn.mpStrSeedStrTeam.get(self.strSeedHome, '')
+		self.strTeamAway = xlrow['away-team'] if xlrow['away-team'] else tourn.mpStrSeedStrTeam.get(self.strSeedAway, '')
 
-		self.scoreHome: int = int(xlrow['home-score']) if xlrow['home-score'] else -1
-		self.scoreAway: int = int(xlrow['away-score']) if xlrow['away-score'] else -1
+		self.scoreHome = int(xlrow['home-score']) if xlrow['home-score'] else -1
+		self.scoreAway = int(xlrow['away-score']) if xlrow['away-score'] else -1
 
-		self.fAfterExtraTime: bool = bool(xlrow.get('after-extra-time'))
+		self.fAfterExtraTime = bool(xlrow.get('after-extra-time'))
 
-		self.scoreHomeTiebreaker: int = int(xlrow['home-tiebreaker']) if xlrow['home-tiebreaker'] else -1
-		self.scoreAwayTiebreaker: int = int(xlrow['away-tiebreaker']) if xlrow['away-tiebreaker'] else -1
+		self.scoreHomeTiebreaker = int(xlrow['home-tiebreaker']) if xlrow['home-tiebreaker'] else -1
+		self.scoreAwayTiebreaker = int(xlrow['away-tiebreaker']) if xlrow['away-tiebreaker'] else -1
 
-		self.stage: STAGE = cast(STAGE, None)
-		self.lStrGroup: list[str] = []
-		self.idFeederHome: Optional[int] = None
-		self.idFeederAway: Optional[int] = None
-		self.idFeeding: Optional[int] = None
+		# stage starts out unset (None), as do the feeders
 
-		# display sort order of the elimination bracket. final is in the middle, with
-		# each match's home feeder being before and away feeder being after.
+		self.lStrGroup = []
 
-		self.sortElim: int = 0
+		# display sort order of the elimination bracket (sortElim). final is in the middle, with
+		# each match's home feeder being before and away feeder being after.
 
 		if self.strSeedHome in tourn.mpStrSeedStrTeam and \
 		   self.strSeedAway in tourn.mpStrSeedStrTeam:
@@ -265,11 +664,62 @@ class CMatch:
 
 		return True
 	
+	@property
+	def tourn(self) -> CTournamentDataBase:
+		return self.mstore.tourn
+
 	def FHasResults(self) -> bool:
-		return self.strTeamHome and self.strTeamAway and self.scoreHome != -1 and self.scoreAway != -1
+		return bool(self.strTeamHome and self.strTeamAway and self.scoreHome != -1 and self.scoreAway != -1)
+
+	def TuResult(self) -> tuple:
+		return (
+			self.strTeamHome,
+			self.strTeamAway,
+			self.scoreHome,
+			self.scoreAway,
+			self.scoreHomeTiebreaker,
+			self.scoreAwayTiebreaker,
+			self.fAfterExtraTime)
+
+	def FHomeWon(self) -> Optional[bool]:
+		""" None if there's no result yet (or it's a draw, which only happens in group matches) """
+
+		if not self.FHasResults():
+			return None
+
+		if self.scoreHome != self.scoreAway:
+			return self.scoreHome > self.scoreAway
+
+		if self.scoreHomeTiebreaker != -1 and self.scoreAwayTiebreaker != -1 and self.scoreHomeTiebreaker != self.scoreAwayTiebreaker:
+			return self.scoreHomeTiebreaker > self.scoreAwayTiebreaker
+
+		return None
+
+	def StrTeamWinner(self) -> str:
+		fHomeWon = self.FHomeWon()
+		if fHomeWon is None:
+			return ''
+		return self.strTeamHome if fHomeWon else self.strTeamAway
+
+	def StrTeamLoser(self) -> str:
+		fHomeWon = self.FHomeWon()
+		if fHomeWon is None:
+			return ''
+		return self.strTeamAway if fHomeWon else self.strTeamHome
+
+def XlbLoadAsync(strName: str) -> TExcelBook:
+	# Top-level so ProcessPoolExecutor can pickle it.
+	return CDataBase(strName).XlbLoad()
 
 class CTournamentDataBase(CDataBase): # tag = tourn
 
+	# competitions that rank teams level on points by head to head first, from the given year
+
+	s_mpStrCompetitionYearHeadToHead: dict[str, int] = {
+		'mens-euro':		2004,
+		'mens-world-cup':	2026,
+	}
+
 	s_mpCSeedStageElimFirst = {
 		8:	STAGE.Semis,
 		12:	STAGE.Quarters,
@@ -282,6 +732,10 @@ class CTournamentDataBase(CDataBase): # tag = tourn
 
 	s_mpStrNameTourn: dict[str, CTournamentDataBase] = {}
 
+	# starting worker processes costs more than parsing a few small workbooks
+
+	s_cBytesParallelMin = 2 * 1024 * 1024
+
 	@classmethod
 	def TournFromStrName(cls, strName: str) -> CTournamentDataBase:
 		tourn = cls.s_mpStrNameTourn.get(strName)
@@ -291,12 +745,55 @@ class CTournamentDataBase(CDataBase): # tag = tourn
 			cls.s_mpStrNameTourn[strName] = tourn
 
 		return tourn
-	
-	def __init__(self, strName: str):
+
+	@classmethod
+	def LTournFromLStrName(cls, lStrName: list[str], cJob: int = 0) -> list[CTournamentDataBase]:
+		""" TournFromStrName() for a bunch of tournaments at once. xlsx files without an up to date snapshot
+		are parsed concurrently in worker processes (openpyxl is pure python, so threads would just take
+		turns), then linked here. everything else (including small xlsx files) loads quickly enough that
+		a pool would only slow it down. """
+
+		lStrNameParse: list[str] = []
+
+		for strName in lStrName:
+			if strName in cls.s_mpStrNameTourn:
+				continue
+
+			db = CDataBase(strName)
+
+			if (xlb := db.XlbLoadQuick()) is not None:
+				cls.s_mpStrNameTourn[strName] = cls(strName, xlb, db.objTopologySnapshot)
+			else:
+				lStrNameParse.append(strName)
+
+		if cJob <= 0:
+			cJob = os.cpu_count() or 1
+
+		cJob = min(cJob, len(lStrNameParse))
+
+		if sum(CDataBase(strName).pathFile.stat().st_size for strName in lStrNameParse) < cls.s_cBytesParallelMin:
+			cJob = 1
+
+		if cJob <= 1:
+			for strName in lStrNameParse:
+				cls.TournFromStrName(strName)
+		else:
+			with ProcessPoolExecutor(max_workers=cJob) as pool:
+				for strName, xlb in zip(lStrNameParse, pool.map(XlbLoadAsync, lStrNameParse)):
+					cls.s_mpStrNameTourn[strName] = cls(strName, xlb)
+
+		return [cls.s_mpStrNameTourn[strName] for strName in lStrName]
+
+	def __init__(self, strName: str, xlb: Optional[TExcelBook] = None, objTopology: Optional[dict[str, Any]] = None):
+		""" xlb is for tournaments built from a book that isn't in the database dir, or
+		loaded elsewhere (along with its snapshot's objTopology, if any) """
 
 		super().__init__(strName)
 
-		xlb: TExcelBook = self.XlbLoad()
+		if xlb is None:
+			xlb = self.XlbLoad()
+		elif objTopology is not None:
+			self.objTopologySnapshot = objTopology
 
 		# properties come from the properties table
 
@@ -319,14 +816,36 @@ class CTournamentDataBase(CDataBase): # tag = tourn
 		self.setStrGroup: set[str] = set(self.lStrGroup)
 		self.mpStrTeamGroup: dict[str, CGroup] = {strTeam:group for group in self.mpStrGroupGroup.values() for strTeam in group.mpStrSeedStrTeam.values()}
 
-		self.mpIdMatch: dict[int, CMatch] = {int(xlrow['match']):CMatch(self, xlrow) for xlrow in xlb['matches']}
+		self.mstore: CMatchStore = CMatchStore(self, xlb['matches'])
+		self.mpIdMatch: dict[int, CMatch] = {match.id:match for match in self.mstore.lMatch}
 
 		self.fHasAllResults = all([match.FHasResults() for match in self.mpIdMatch.values()])
 
-		for match in self.mpIdMatch.values():
-			match.LinkFeeders(self.mpIdMatch)
+		# stages, bracket order, feeding and halves are compiled once and kept with the snapshot
+
+		strHashTopology = StrHashTopology(xlb)
+		objTopology = self.ObjTopologyLoad()
+
+		if objTopology is not None and objTopology.get('hash') == strHashTopology:
+			self.mstore.ApplyTopology(objTopology)
+		else:
+			self.SaveTopology(self.ObjTopologyCompile(strHashTopology))
+
+		self.mstore.IndexStages()
+
+		self.mpStageSetMatch: dict[STAGE, set[CMatch]] = {stage: set(self.mstore.LMatchFromAI(aI)) for stage, aI in self.mstore.mpStageAI.items()}
+
+		# group tables, recomputed whenever results change (see standings.py)
+
+		self.aIMatchGroup: np.ndarray = np.array(sorted(match.i for match in self.mpStageSetMatch[STAGE.Group]), dtype=np.intp)
+		self.gtable: CGroupTable = CGroupTable(
+										self.mpStrSeedStrTeam,
+										[self.mstore.lStrSeedHome[i] for i in self.aIMatchGroup],
+										[self.mstore.lStrSeedAway[i] for i in self.aIMatchGroup],
+										[strSeed for match in self.mpStageSetMatch[self.stageElimFirst] for strSeed in (match.strSeedHome, match.strSeedAway)],
+										self.FHeadToHeadFirst())
+		self.standings: CStandings = self.StandingsWhatIf([])
 
-		self.mpStageSetMatch: dict[STAGE, set[CMatch]] = self.MpStageSetMatch()
 		self.mpStrTeamResults: dict[str, CResults] = self.MpStrTeamResults()
 
 		setMatchFinal = self.mpStageSetMatch[STAGE.Final]
@@ -344,13 +863,25 @@ class CTournamentDataBase(CDataBase): # tag = tourn
 		except KeyError:
 			pass
 
-		self.AssignSortElim()
-		
 		self.setMatchGroup: set[CMatch] = self.mpStageSetMatch[STAGE.Group]
 		self.setMatchElimination: set[CMatch] = set().union(*[setMatch for stage, setMatch in self.mpStageSetMatch.items() if stage != STAGE.Group])
 		
-		self.setMatchElimHalfHome: set[CMatch] = self.SetMatchElimHalfHome()
-		self.setMatchElimHalfAway: set[CMatch] = self.SetMatchElimHalfAway()
+		self.setMatchElimHalfHome: set[CMatch] = set(self.mstore.LMatchFromAI(self.mstore.aIElimHalfHome))
+		self.setMatchElimHalfAway: set[CMatch] = set(self.mstore.LMatchFromAI(self.mstore.aIElimHalfAway))
+
+		# results that came in after the spreadsheet was last updated (see stp --results)
+
+		if lScoreu := self.LScoreuSidecar():
+			print(f"results: applying {len(lScoreu)} updates to {self.strName} from {self.pathResults}")
+			self.SetIdApplyLScoreu(lScoreu)
+
+		# start times as an array, so pages can convert every match into their timezone in one shot
+
+		self.mtimes: CMatchTimes = CMatchTimes(
+										self.mstore.aId.tolist(),
+										self.mstore.aSecStart,
+										self.mstore.aStage == STAGE.Group)
+		self.zclasses: CZoneClasses = CZoneClasses(self.mtimes)
 
 	def MpStrGroupGroup(self) -> dict[str, CGroup]:
 		""" build list of groups from team seedings. """
@@ -365,6 +896,27 @@ class CTournamentDataBase(CDataBase): # tag = tourn
 
 		return mpStrGroupGroup
 
+	def ObjTopologyCompile(self, strHashTopology: str) -> dict[str, Any]:
+		""" work out every match's stage, group list, sortElim, idFeeding and bracket half from the seeds """
+
+		for match in self.mpIdMatch.values():
+			match.LinkFeeders(self.mpIdMatch)
+
+		mpStageSetMatch = self.MpStageSetMatch()
+
+		setMatchFinal = mpStageSetMatch[STAGE.Final]
+		assert len(setMatchFinal) == 1
+		self.matchFinal = next(iter(setMatchFinal))
+
+		self.AssignSortElim()
+
+		for match in self.SetMatchElimHalfHome():
+			self.mstore.aHalf[match.i] = 1
+		for match in self.SetMatchElimHalfAway():
+			self.mstore.aHalf[match.i] = 2
+
+		return self.mstore.ObjTopology(strHashTopology)
+
 	def MpStageSetMatch(self) -> dict[STAGE, set[CMatch]]:
 		""" allot matches to stages. """
 
@@ -441,11 +993,28 @@ class CTournamentDataBase(CDataBase): # tag = tourn
 			mpStrTeamSetMatch.setdefault(match.strTeamHome, set()).add(match)
 			mpStrTeamSetMatch.setdefault(match.strTeamAway, set()).add(match)
 
-		return {
+		mpStrTeamResults = {
 			strTeam: CResults(self.stageElimFirst, strTeam, setMatch)
 				for strTeam, setMatch in mpStrTeamSetMatch.items()
 		}
 
+		# teams the seeds don't place get their place from the standings, as long as it was decided by
+		# criteria we have and no seed already gave it to another team in the group
+
+		mpStrGroupSetStrPlace: dict[str, set[str]] = {}
+
+		for strTeam, results in mpStrTeamResults.items():
+			if results.strPlace and (standing := self.standings.mpStrTeamStanding.get(strTeam)):
+				mpStrGroupSetStrPlace.setdefault(standing.strGroup, set()).add(results.strPlace)
+
+		for strTeam, results in mpStrTeamResults.items():
+			if results.strPlace or not (strPlace := self.standings.StrPlace(strTeam)):
+				continue
+			if strPlace not in mpStrGroupSetStrPlace.get(self.standings.mpStrTeamStanding[strTeam].strGroup, set()):
+				results.strPlaceStandings = strPlace
+
+		return mpStrTeamResults
+
 	def AssignSortElim(self):
 		sortElimNext: int = 1
 		lIdStack: list[int] = [self.matchFinal.id]
@@ -494,6 +1063,134 @@ class CTournamentDataBase(CDataBase): # tag = tourn
 
 		return {self.mpIdMatch[id] for id in setIdFeeding}
 
+	def StandingsWhatIf(self, lScoreu: list[SScoreUpdate]) -> CStandings:
+		""" group tables for the results so far, with lScoreu laid over them. nothing in the tournament
+		changes, so this is also how to ask "what if" about group matches. """
+
+		aScoreHome = self.mstore.aScoreHome.copy()
+		aScoreAway = self.mstore.aScoreAway.copy()
+
+		for scoreu in lScoreu:
+			match = self.mpIdMatch.get(scoreu.id)
+			if match is None:
+				print(f"warning: {self.strName} has no match {scoreu.id}")
+				continue
+			aScoreHome[match.i] = scoreu.scoreHome
+			aScoreAway[match.i] = scoreu.scoreAway
+
+		return CStandings(self.gtable, aScoreHome[self.aIMatchGroup], aScoreAway[self.aIMatchGroup])
+
+	def SetIdApplyLScoreu(self, lScoreu: list[SScoreUpdate]) -> set[int]:
+		""" apply score updates, moving winners and losers on to the matches they feed. returns the ids of
+		every match that changed (including ones that just got a new team). """
+
+		setIdChanged: set[int] = set()
+		setTuIdFHomeNamed: set[tuple[int, bool]] = set()
+
+		for scoreu in lScoreu:
+			match = self.mpIdMatch.get(scoreu.id)
+			if match is None:
+				print(f"warning: {self.strName} has no match {scoreu.id}")
+				continue
+
+			tuResultPrev = match.TuResult()
+
+			match.scoreHome = scoreu.scoreHome
+			match.scoreAway = scoreu.scoreAway
+			match.scoreHomeTiebreaker = scoreu.scoreHomeTiebreaker
+			match.scoreAwayTiebreaker = scoreu.scoreAwayTiebreaker
+			match.fAfterExtraTime = scoreu.fAfterExtraTime
+
+			if scoreu.strTeamHome:
+				match.strTeamHome = scoreu.strTeamHome
+				setTuIdFHomeNamed.add((match.id, True))
+			if scoreu.strTeamAway:
+				match.strTeamAway = scoreu.strTeamAway
+				setTuIdFHomeNamed.add((match.id, False))
+
+			if match.TuResult() != tuResultPrev:
+				setIdChanged.add(match.id)
+
+		# finished groups send their winners and runners up on to the first knockout round, unless the
+		# patch names the team itself (eg a tie the standings can't break, like fair play points)
+
+		self.standings = self.StandingsWhatIf([])
+
+		for match in self.mpStageSetMatch[self.stageElimFirst]:
+			for fHome, strSeed in ((True, match.strSeedHome), (False, match.strSeedAway)):
+				strTeam = self.standings.StrTeamFromStrSeed(strSeed)
+				if not strTeam or (match.id, fHome) in setTuIdFHomeNamed:
+					continue
+
+				if fHome:
+					if match.strTeamHome == strTeam:
+						continue
+					match.strTeamHome = strTeam
+				else:
+					if match.strTeamAway == strTeam:
+						continue
+					match.strTeamAway = strTeam
+
+				setIdChanged.add(match.id)
+
+		# which matches are fed by which, and whether they take the winner (W) or the loser (L/RU)
+
+		mpIdLTuFed: dict[int, list[tuple[CMatch, bool, bool]]] = {}
+
+		for match in self.mpIdMatch.values():
+			for fHome, idFeeder, strSeed in ((True, match.idFeederHome, match.strSeedHome), (False, match.idFeederAway, match.strSeedAway)):
+				if idFeeder is None:
+					continue
+				mat = CMatch.s_patAlphaNum.match(strSeed)
+				assert mat
+				mpIdLTuFed.setdefault(idFeeder, []).append((match, fHome, mat[1] == 'W'))
+
+		lIdVisit: list[int] = sorted(setIdChanged)
+
+		while lIdVisit:
+			matchFeeder = self.mpIdMatch[lIdVisit.pop()]
+
+			for matchFed, fHome, fWinner in mpIdLTuFed.get(matchFeeder.id, []):
+				strTeam = matchFeeder.StrTeamWinner() if fWinner else matchFeeder.StrTeamLoser()
+
+				# an undecided feeder sends nobody on, so a team it sent before goes back to the seed
+				# placeholder (unless the patch named it)
+
+				if not strTeam and (matchFed.id, fHome) in setTuIdFHomeNamed:
+					continue
+
+				if fHome:
+					if matchFed.strTeamHome == strTeam:
+						continue
+					matchFed.strTeamHome = strTeam
+				else:
+					if matchFed.strTeamAway == strTeam:
+						continue
+					matchFed.strTeamAway = strTeam
+
+				setIdChanged.add(matchFed.id)
+				lIdVisit.append(matchFed.id)
+
+		if setIdChanged:
+			self.fHasAllResults = all([match.FHasResults() for match in self.mpIdMatch.values()])
+			self.mpStrTeamResults = self.MpStrTeamResults()
+
+		return setIdChanged
+
+	def FHeadToHeadFirst(self) -> bool:
+		""" whether teams level on points are ranked by their matches against each other before overall
+		goal difference. a tiebreakers property ('head-to-head' or 'overall') overrides the competition. """
+
+		if strTiebreakers := self.objProperties.get('tiebreakers'):
+			if strTiebreakers not in ('head-to-head', 'overall'):
+				sys.exit(f"error: {self.strName} has unknown tiebreakers '{strTiebreakers}'")
+			return strTiebreakers == 'head-to-head'
+
+		yearFirst = self.s_mpStrCompetitionYearHeadToHead.get(self.objProperties['competition'])
+		strYear = self.strName.split('-')[0]
+
+		return yearFirst is not None and strYear.isdecimal() and int(strYear) >= yearFirst
+
 	def FLocSectionHasAllKeys(self, strSection: str, setStrKeys: set[str]) -> bool:
 		return setStrKeys.issubset(g_loc.mpStrSectionSetStrSubkey[strSection])
 
@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import base64
+import difflib
+import enum
+import fpdf
+import hashlib
+import importlib
+import inspect
+import io
+import json
+import sys
+import types
+
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
+
+from fpdf.enums import PDFResourceType, RenderStyle
+from fpdf.syntax import Name, PDFArray, PDFContentStream
+
+if TYPE_CHECKING:
+	from bolay import SColor, SRect
+
+# pages draw in two phases. layout runs every blot against a CRecordingPdf, which answers measurement
+# questions from the real pdf but only records drawing; render then plays the recorded display list
+# into the real pdf. a display list is plain data, so it can be saved, hashed, diffed and replayed.
+
+class SDisplayOp(NamedTuple): # tag = dop
+	strMethod: str
+	tuArg: tuple[Any, ...] = ()
+	mpStrKwarg: dict[str, Any] = {}
+
+# local_context brackets are recorded as a pair of pseudo-ops
+
+g_strMethodPush = '<push>'
+g_strMethodPop = '<pop>'
+
+# ops that put text on the page. everything else is artwork.
+
+g_setStrMethodText: set[str] = {'text', 'cell', 'multi_cell', 'write'}
+
+# runs of plain lines and rects, batched into one path by CDisplayList.DlistOptimized
+
+g_strMethodLines = '<lines>'
+g_strMethodRects = '<rects>'
+
+# fpdf2 versions CArtworkForms has been checked against. others fall back to drawing artwork per page.
+
+g_strVersionFpdfFormsMin = '2.8.7'
+g_strVersionFpdfFormsMax = '2.8.9'
+
+class CDisplayList: # tag = dlist
+	""" the drawing calls for one page, in order """
+
+	# bump when the json form changes
+
+	s_nVersion = 1
+
+	def __init__(self, lDop: list[SDisplayOp] | None = None) -> None:
+		self.lDop: list[SDisplayOp] = lDop if lDop is not None else []
+
+	def __len__(self) -> int:
+		return len(self.lDop)
+
+	def Add(self, strMethod: str, tuArg: tuple[Any, ...], mpStrKwarg: dict[str, Any]) -> None:
+		self.lDop.append(SDisplayOp(strMethod, tuple(ValRecorded(arg) for arg in tuArg), {strKey: ValRecorded(val) for strKey, val in mpStrKwarg.items()}))
+
+	def Play(self, pdf: fpdf.FPDF) -> None:
+		""" render phase: issue every recorded call against pdf """
+
+		lExitstack: list[ExitStack] = []
+
+		for dop in self.lDop:
+			tuArg = tuple(ValPlayed(arg) for arg in dop.tuArg)
+			mpStrKwarg = {strKey: ValPlayed(val) for strKey, val in dop.mpStrKwarg.items()}
+
+			if dop.strMethod == g_strMethodPush:
+				exitstack = ExitStack()
+				exitstack.enter_context(pdf.local_context(**mpStrKwarg))
+				lExitstack.append(exitstack)
+			elif dop.strMethod == g_strMethodPop:
+				lExitstack.pop().close()
+			elif dop.strMethod == g_strMethodLines:
+				PlayLines(pdf, tuArg)
+			elif dop.strMethod == g_strMethodRects:
+				PlayRects(pdf, tuArg[0], tuArg[1:])
+			else:
+				getattr(pdf, dop.strMethod)(*tuArg, **mpStrKwarg)
+
+		assert not lExitstack
+
+	def DlistOptimized(self) -> CDisplayList:
+		""" same drawing, fewer operators: runs of plain lines or same-style rects with nothing between them
+		are batched into one path each. setters that repeat the current drawing state are left alone;
+		fpdf already writes nothing for them. """
+
+		lDop: list[SDisplayOp] = []
+
+		for dop in self.lDop:
+			if (tuXYXY := TuXYXYFromDop(dop)) is not None:
+				dopPrev = lDop[-1] if lDop else None
+				if dopPrev is not None and dopPrev.strMethod == g_strMethodLines:
+					lDop[-1] = SDisplayOp(g_strMethodLines, dopPrev.tuArg + (tuXYXY,))
+				else:
+					lDop.append(SDisplayOp(g_strMethodLines, (tuXYXY,)))
+				continue
+			elif (tuStrXYWH := TuStrXYWHFromDop(dop)) is not None:
+				strOperator, tuXYWH = tuStrXYWH
+				dopPrev = lDop[-1] if lDop else None
+				if dopPrev is not None and dopPrev.strMethod == g_strMethodRects and dopPrev.tuArg[0] == strOperator:
+					lDop[-1] = SDisplayOp(g_strMethodRects, dopPrev.tuArg + (tuXYWH,))
+				else:
+					lDop.append(SDisplayOp(g_strMethodRects, (strOperator, tuXYWH)))
+				continue
+
+			lDop.append(dop)
+
+		return CDisplayList(lDop)
+
+	def LTuFArtDlistRun(self) -> list[tuple[bool, CDisplayList]]:
+		""" split into runs of artwork and runs of everything else (text, layout, local_context brackets),
+		in order, so playing the runs one after another stacks marks exactly as recorded. drawing state
+		stays in whichever run it falls in; brackets are never inside an artwork run. """
+
+		lTuFArtDlistRun: list[tuple[bool, CDisplayList]] = []
+
+		for dop in self.lDop:
+			if dop.strMethod in CRecordingPdf.s_setStrMethodState:
+				fArt = lTuFArtDlistRun[-1][0] if lTuFArtDlistRun else False
+			else:
+				fArt = dop.strMethod not in g_setStrMethodText and \
+						dop.strMethod not in CRecordingPdf.s_setStrMethodLayout and \
+						dop.strMethod not in (g_strMethodPush, g_strMethodPop)
+
+			if not lTuFArtDlistRun or lTuFArtDlistRun[-1][0] != fArt:
+				lTuFArtDlistRun.append((fArt, CDisplayList()))
+
+			lTuFArtDlistRun[-1][1].lDop.append(dop)
+
+		return lTuFArtDlistRun
+
+	def DlistState(self) -> CDisplayList:
+		""" just the drawing state setters """
+
+		return CDisplayList([dop for dop in self.lDop if dop.strMethod in CRecordingPdf.s_setStrMethodState])
+
+	def CMark(self) -> int:
+		""" ops that put something on the page """
+
+		return sum(1 for dop in self.lDop if dop.strMethod not in CRecordingPdf.s_setStrMethodState)
+
+	def ObjJson(self) -> dict[str, Any]:
+		return {
+			'version': self.s_nVersion,
+			'ops': [[dop.strMethod, [ObjJsonFromVal(arg) for arg in dop.tuArg], {strKey: ObjJsonFromVal(val) for strKey, val in dop.mpStrKwarg.items()}] for dop in self.lDop],
+		}
+
+	@classmethod
+	def DlistFromObjJson(cls, obj: dict[str, Any]) -> CDisplayList:
+		if obj.get('version') != cls.s_nVersion:
+			sys.exit(f"error: display list version {obj.get('version')} (expected {cls.s_nVersion})")
+
+		return cls([SDisplayOp(strMethod, tuple(ValFromObjJson(arg) for arg in lArg), {strKey: ValFromObjJson(val) for strKey, val in mpStrKwarg.items()}) for strMethod, lArg, mpStrKwarg in obj['ops']])
+
+	def Save(self, path: Path) -> None:
+		path.write_text(json.dumps(self.ObjJson(), ensure_ascii=False) + '\n', encoding='utf-8')
+
+	@classmethod
+	def DlistLoad(cls, path: Path) -> CDisplayList:
+		return cls.DlistFromObjJson(json.loads(path.read_text(encoding='utf-8')))
+
+	def StrHash(self) -> str:
+		""" same hash, same drawing. cheap way to tell if a page's geometry changed """
+
+		return hashlib.sha256(json.dumps(self.ObjJson(), sort_keys=True).encode()).hexdigest()
+
+	def LStrDiff(self, dlistOther: CDisplayList) -> list[str]:
+		""" one line per op that differs, for eyeballing what a change did to a page """
+
+		lStrSelf = [json.dumps(dopJson) for dopJson in self.ObjJson()['ops']]
+		lStrOther = [json.dumps(dopJson) for dopJson in dlistOther.ObjJson()['ops']]
+
+		return [strLine for strLine in difflib.unified_diff(lStrSelf, lStrOther, lineterm='', n=0) if strLine[:1] in '+-' and strLine[:3] not in ('+++', '---')]
+
+def TuXYXYFromDop(dop: SDisplayOp) -> tuple[float, float, float, float] | None:
+	if dop.strMethod != 'line' or dop.mpStrKwarg or len(dop.tuArg) != 4:
+		return None
+	return dop.tuArg
+
+def TuStrXYWHFromDop(dop: SDisplayOp) -> tuple[str, tuple[float, float, float, float]] | None:
+	""" (operator, rect) for square-cornered rects that are only stroked or only filled. stroking and
+	filling in one go paints differently once several rects share a path. """
+
+	if dop.strMethod != 'rect' or not 4 <= len(dop.tuArg) <= 5 or set(dop.mpStrKwarg) - {'style'}:
+		return None
+
+	style = dop.tuArg[4] if len(dop.tuArg) == 5 else dop.mpStrKwarg.get('style')
+	style = RenderStyle.coerce(style) if style is not None else RenderStyle.D
+	if style not in (RenderStyle.D, RenderStyle.F):
+		return None
+
+	return style.operator, dop.tuArg[:4]
+
+def FFpdfMethod(pdf: fpdf.FPDF, strMethod: str) -> bool:
+	""" pdf draws with fpdf's own strMethod, so a batch can write the same operators it would """
+
+	return getattr(type(pdf), strMethod, None) is getattr(fpdf.FPDF, strMethod)
+
+def PlayLines(pdf: fpdf.FPDF, tuTuXYXY: tuple[tuple[float, float, float, float], ...]) -> None:
+	""" FPDF.line, many at once. a pdf that overrides line (or has no page open, which line
+	reports) gets them one at a time. """
+
+	if not pdf.page or not FFpdfMethod(pdf, 'line'):
+		for tuXYXY in tuTuXYXY:
+			pdf.line(*tuXYXY)
+		return
+
+	k = pdf.k
+	dY = pdf.h
+	pdf._out(" ".join(f"{x1 * k:.2f} {(dY - y1) * k:.2f} m {x2 * k:.2f} {(dY - y2) * k:.2f} l" for x1, y1, x2, y2 in tuTuXYXY) + " S")
+
+def PlayRects(pdf: fpdf.FPDF, strOperator: str, tuTuXYWH: tuple[tuple[float, float, float, float], ...]) -> None:
+	""" FPDF.rect, many at once. falls back like PlayLines. """
+
+	if not pdf.page or not FFpdfMethod(pdf, 'rect'):
+		style = RenderStyle.D if strOperator == RenderStyle.D.operator else RenderStyle.F
+		for tuXYWH in tuTuXYWH:
+			pdf.rect(*tuXYWH, style=style)
+		return
+
+	k = pdf.k
+	dY = pdf.h
+	pdf._out(" ".join(f"{x * k:.2f} {(dY - y) * k:.2f} {dX * k:.2f} {-dYRect * k:.2f} re" for x, y, dX, dYRect in tuTuXYWH) + f" {strOperator}")
+
+def ValRecorded(val: Any) -> Any:
+	""" freeze a call argument. buffers (eg the qr code image) are shared and rewound by their
+	users, so keep their bytes rather than the buffer. """
+
+	if isinstance(val, io.BytesIO):
+		return val.getvalue()
+	return val
+
+def ValPlayed(val: Any) -> Any:
+	if isinstance(val, bytes):
+		return io.BytesIO(val)
+	return val
+
+def StrTypeName(cls: type) -> str:
+	return f'{cls.__module__}:{cls.__qualname__}'
+
+def ClsFromStrTypeName(strTypeName: str) -> Any:
+	strModule, strQualname = strTypeName.split(':')
+	obj: Any = importlib.import_module(strModule)
+	for strName in strQualname.split('.'):
+		obj = getattr(obj, strName)
+	return obj
+
+def ObjJsonFromVal(val: Any) -> Any:
+	""" json for a recorded argument. tuples, enums and bytes get tagged so they round trip. """
+
+	if val is None or isinstance(val, (bool, str)):
+		return val
+	if isinstance(val, enum.Enum):
+		return {'$enum': StrTypeName(type(val)), 'name': val.name}
+	if isinstance(val, (int, float)):
+		return val
+	if isinstance(val, bytes):
+		return {'$bytes': base64.b64encode(val).decode('ascii')}
+	if isinstance(val, tuple) and hasattr(val, '_fields'):
+		return {'$tuple': StrTypeName(type(val)), 'values': [ObjJsonFromVal(v) for v in val]}
+	if isinstance(val, tuple):
+		return {'$tuple': '', 'values': [ObjJsonFromVal(v) for v in val]}
+	if isinstance(val, list):
+		return [ObjJsonFromVal(v) for v in val]
+	if isinstance(val, dict):
+		return {'$dict': {str(strKey): ObjJsonFromVal(v) for strKey, v in val.items()}}
+
+	return {'$repr': repr(val)}
+
+def ValFromObjJson(obj: Any) -> Any:
+	if isinstance(obj, list):
+		return [ValFromObjJson(o) for o in obj]
+	if not isinstance(obj, dict):
+		return obj
+	if '$enum' in obj:
+		return ClsFromStrTypeName(obj['$enum'])[obj['name']]
+	if '$bytes' in obj:
+		return base64.b64decode(obj['$bytes'])
+	if '$tuple' in obj:
+		tuVal = tuple(ValFromObjJson(o) for o in obj['values'])
+		return ClsFromStrTypeName(obj['$tuple'])(*tuVal) if obj['$tuple'] else tuVal
+	if '$dict' in obj:
+		return {strKey: ValFromObjJson(o) for strKey, o in obj['$dict'].items()}
+
+	sys.exit(f"error: display list can't replay {obj.get('$repr', obj)}")
+
+class CRecordingPdf: # tag = rpdf
+	""" stands in for the document's pdf during layout. anything that puts marks on the page is recorded
+	instead of drawn; state that measurement depends on (font, size, spacing, position) is recorded and
+	also applied, so text measures exactly as it will render. everything else reads through to the pdf. """
+
+	# marks on the page: recorded only
+
+	s_setStrMethodDraw: set[str] = {
+		'arc', 'bezier', 'cell', 'circle', 'dashed_line', 'ellipse', 'image', 'line', 'multi_cell',
+		'polygon', 'polyline', 'rect', 'regular_polygon', 'solid_arc', 'star', 'text', 'write',
+	}
+
+	# drawing state: recorded only
+
+	s_setStrMethodState: set[str] = {
+		'set_draw_color', 'set_fill_color', 'set_text_color', 'set_line_width', 'set_dash_pattern',
+		'SetDrawColor', 'SetFillColor', 'SetTextColor',
+	}
+
+	# layout state: recorded and applied
+
+	s_setStrMethodLayout: set[str] = {
+		'set_font', 'set_font_size', 'set_stretching', 'set_char_spacing', 'set_text_shaping',
+		'set_xy', 'set_x', 'set_y',
+	}
+
+	def __init__(self, pdf: fpdf.FPDF, dlist: CDisplayList) -> None:
+		# set around __setattr__, which writes through to the pdf
+
+		self._pdf: fpdf.FPDF
+		self._dlist: CDisplayList
+		self._fillbat: CFillBatch | None
+		object.__setattr__(self, '_pdf', pdf)
+		object.__setattr__(self, '_dlist', dlist)
+		object.__setattr__(self, '_fillbat', None)
+
+	def __getattr__(self, strName: str) -> Any:
+		pdf = self._pdf
+		dlist = self._dlist
+
+		if strName in self.s_setStrMethodDraw or strName in self.s_setStrMethodState:
+			if strName == 'multi_cell':
+				return self.MultiCellRecorded
+			def Record(*tuArg: Any, **mpStrKwarg: Any) -> None:
+				dlist.Add(strName, tuArg, mpStrKwarg)
+			return Record
+
+		if strName in self.s_setStrMethodLayout:
+			fnApply = getattr(pdf, strName)
+			def RecordApply(*tuArg: Any, **mpStrKwarg: Any) -> Any:
+				dlist.Add(strName, tuArg, mpStrKwarg)
+				return fnApply(*tuArg, **mpStrKwarg)
+			return RecordApply
+
+		# helpers the pdf subclass adds on top of fpdf (eg in bolay) run against this proxy, so
+		# whatever they draw gets recorded too
+
+		for cls in type(pdf).__mro__:
+			if cls is fpdf.FPDF:
+				break
+			if strName in vars(cls):
+				attr = inspect.getattr_static(pdf, strName)
+				if isinstance(attr, types.FunctionType):
+					return types.MethodType(attr, self)
+				break
+
+		return getattr(pdf, strName)
+
+	def __setattr__(self, strName: str, val: Any) -> None:
+		setattr(self._pdf, strName, val)
+
+	def MultiCellRecorded(self, *tuArg: Any, **mpStrKwarg: Any) -> Any:
+		""" dry runs are measurement, so answer those; real ones get recorded """
+
+		if mpStrKwarg.get('dry_run') or mpStrKwarg.get('split_only'):
+			return self._pdf.multi_cell(*tuArg, **mpStrKwarg)
+
+		self._dlist.Add('multi_cell', tuArg, mpStrKwarg)
+		return None
+
+	@contextmanager
+	def local_context(self, **mpStrKwarg: Any) -> Iterator[None]:
+		""" recorded as push/pop. layout state set inside the context is rolled back on exit, like the
+		real thing, without writing anything to the page. """
+
+		pdf = self._pdf
+		dlist = self._dlist
+
+		dlist.Add(g_strMethodPush, (), mpStrKwarg)
+		pdf._push_local_stack()
+		try:
+			yield
+		finally:
+			pdf._pop_local_stack()
+			dlist.Add(g_strMethodPop, (), {})
+
+	def FillRect(self, rect: SRect, color: SColor) -> None:
+		""" CBlot.FillBox, except inside a FillBatch the fill is held back for the batch """
+
+		if self._fillbat is not None:
+			self._fillbat.Add(rect, color)
+			return
+
+		self._dlist.Add('SetFillColor', (color,), {})
+		self._dlist.Add('rect', (rect.x, rect.y, rect.dX, rect.dY), {'style': 'F'})
+
+	@contextmanager
+	def FillBatch(self) -> Iterator[None]:
+		""" FillRects made inside are drawn where the batch starts, one path per color. so only use it
+		around blots whose fills go under everything else they draw. a nested batch joins the outer one. """
+
+		if self._fillbat is not None:
+			yield
+			return
+
+		dlist = self._dlist
+		iDop = len(dlist)
+		fillbat = CFillBatch()
+
+		object.__setattr__(self, '_fillbat', fillbat)
+		try:
+			yield
+		finally:
+			object.__setattr__(self, '_fillbat', None)
+			dlist.lDop[iDop:iDop] = fillbat.LDop()
+
+class CFillBatch: # tag = fillbat
+	""" held back fills, by color, colors in the order they first showed up """
+
+	def __init__(self) -> None:
+		self.mpColorLTuXYWH: dict[SColor, list[tuple[float, float, float, float]]] = {}
+
+	def Add(self, rect: SRect, color: SColor) -> None:
+		# blots move their rects around after filling them, so keep the numbers
+
+		self.mpColorLTuXYWH.setdefault(color, []).append((rect.x, rect.y, rect.dX, rect.dY))
+
+	def LDop(self) -> list[SDisplayOp]:
+		""" the fills, bracketed so the fill color they leave behind doesn't leak into what follows.
+		DlistOptimized turns each color's rects into one path. """
+
+		if not self.mpColorLTuXYWH:
+			return []
+
+		lDop = [SDisplayOp(g_strMethodPush)]
+		for color, lTuXYWH in self.mpColorLTuXYWH.items():
+			lDop.append(SDisplayOp('SetFillColor', (color,)))
+			lDop += [SDisplayOp('rect', tuXYWH, {'style': 'F'}) for tuXYWH in lTuXYWH]
+		lDop.append(SDisplayOp(g_strMethodPop))
+
+		return lDop
+
+class SFormResources(NamedTuple): # tag = formres
+	""" resource names an artwork form's content uses. stands in for fpdf's blend groups, whose form
+	xobjects get their resource dictionaries resolved the same way at output time. """
+
+	setTuResource: frozenset[tuple[PDFResourceType, str]]
+
+	def get_resource_dictionary(
+			self,
+			mpStrGfxstate: dict[str, Any],
+			mpStrPattern: dict[str, Any],
+			mpStrShading: dict[str, Any],
+			mpIFont: dict[int, Any],
+			mpIImg: dict[int, Any]) -> str:
+
+		mpStrTypeLStrRef: dict[str, list[str]] = {}
+
+		for restype, strName in sorted(self.setTuResource, key=lambda tu: (tu[0].value, tu[1])):
+			match restype:
+				case PDFResourceType.EXT_G_STATE:
+					strRef = f"{Name(strName).serialize()} {mpStrGfxstate[strName].id} 0 R"
+				case PDFResourceType.X_OBJECT:
+					strRef = f"{Name(f'I{strName}').serialize()} {mpIImg[int(strName)].id} 0 R"
+				case PDFResourceType.PATTERN:
+					strRef = f"{Name(strName).serialize()} {mpStrPattern[strName].id} 0 R"
+				case PDFResourceType.SHADING:
+					strRef = f"{Name(strName).serialize()} {mpStrShading[strName].id} 0 R"
+				case PDFResourceType.FONT:
+					strRef = f"{Name(f'F{strName}').serialize()} {mpIFont[int(strName)].id} 0 R"
+				case _:
+					continue
+			mpStrTypeLStrRef.setdefault(restype.value, []).append(strRef)
+
+		return "<<" + "".join(f"{Name(strType).serialize()}<<{''.join(lStrRef)}>>" for strType, lStrRef in mpStrTypeLStrRef.items()) + ">>"
+
+class CArtworkForms: # tag = artf
+	""" per document: each distinct run of artwork (fills, boxes, borders, rules, crop marks, images) between
+	the text on a page is rendered once into a pdf form xobject, and every page with the same run draws it
+	by reference. pages of the same tournament, format and orientation tend to share artwork across
+	locales and zones, and the collated pdfs can then keep a single copy. """
+
+	# well clear of fpdf's own image numbering (images count up from 1)
+
+	s_iFormFirst = 100000
+
+	# shorter runs aren't worth a form of their own
+
+	s_cMarkFormMin = 4
+
+	def __init__(self) -> None:
+		self.mpStrHashIForm: dict[str, int] = {}
+		self.fWarned = False
+
+	def Play(self, pdf: fpdf.FPDF, dlist: CDisplayList) -> None:
+		if not FFormsSupported(pdf):
+			if not self.fWarned:
+				print(f"warning: fpdf2 v{fpdf.__version__} isn't one artwork forms are known to work with ({g_strVersionFpdfFormsMin} to {g_strVersionFpdfFormsMax}); drawing artwork per page")
+				self.fWarned = True
+			dlist.DlistOptimized().Play(pdf)
+			return
+
+		for fArt, dlistRun in dlist.LTuFArtDlistRun():
+			dlistRun = dlistRun.DlistOptimized()
+
+			if not fArt or dlistRun.CMark() < self.s_cMarkFormMin:
+				dlistRun.Play(pdf)
+				continue
+
+			# fpdf leaves out setters that match its current state, so what a run renders to depends on
+			# the state it starts in. form content is in page coordinates, so the page size counts too.
+
+			strHash = hashlib.sha256(f'{pdf.w:.4f}x{pdf.h:.4f}:{StrStateFpdf(pdf)}:{dlistRun.StrHash()}'.encode()).hexdigest()
+
+			iForm = self.mpStrHashIForm.get(strHash)
+			if iForm is None:
+				iForm = self.mpStrHashIForm[strHash] = self.IFormRender(pdf, dlistRun)
+
+			pdf._out(f"/I{iForm} Do")
+			pdf._resource_catalog.add(PDFResourceType.X_OBJECT, iForm, pdf.page)
+
+			# a form's state changes end with it, but what's drawn after it expects them
+
+			dlistRun.DlistState().Play(pdf)
+
+	def IFormRender(self, pdf: fpdf.FPDF, dlistArt: CDisplayList) -> int:
+		""" play the artwork into the current page, then move what it wrote into a form xobject. the
+		local context keeps fpdf's idea of the current colors/widths in step with the q/Q around it. """
+
+		catalog = pdf._resource_catalog
+		bContents = pdf.pages[pdf.page].contents
+		cbStart = len(bContents)
+
+		with pdf.local_context():
+			dlistArt.Play(pdf)
+
+		bForm = bytes(bContents[cbStart:])
+		del bContents[cbStart:]
+
+		xobject = PDFContentStream(contents=bForm, compress=pdf.compress)
+		xobject.type = Name("XObject")			# type: ignore[attr-defined]
+		xobject.subtype = Name("Form")			# type: ignore[attr-defined]
+		xobject.b_box = PDFArray([0, 0, round(pdf.w * pdf.k, 4), round(pdf.h * pdf.k, 4)])	# type: ignore[attr-defined]
+		xobject._blend_group = SFormResources(frozenset(catalog.scan_stream(bForm.decode('latin-1'))))	# type: ignore[attr-defined]
+		xobject._registered = False			# type: ignore[attr-defined]
+
+		iForm = self.s_iFormFirst + len(self.mpStrHashIForm)
+		catalog.form_xobjects.append((iForm, xobject))
+
+		return iForm
+
+def StrStateFpdf(pdf: fpdf.FPDF) -> str:
+	""" the drawing state fpdf is tracking """
+
+	return repr((pdf.draw_color, pdf.fill_color, pdf.text_color, pdf.line_width, pdf.dash_pattern))
+
+def FFormsSupported(pdf: fpdf.FPDF) -> bool:
+	""" CArtworkForms reaches into fpdf's internals: the resource catalog's form xobjects (and scan_stream),
+	the blend group hook that resolves a form's resources at output, and the raw page content. only trust
+	versions it's been checked against. """
+
+	tuVersion = TuVersion(fpdf.__version__)
+	if tuVersion is None or not TuVersion(g_strVersionFpdfFormsMin) <= tuVersion <= TuVersion(g_strVersionFpdfFormsMax):
+		return False
+
+	catalog = getattr(pdf, '_resource_catalog', None)
+
+	return hasattr(catalog, 'form_xobjects') and hasattr(catalog, 'scan_stream') and hasattr(pdf, '_out')
+
+def TuVersion(strVersion: str) -> tuple[int, ...] | None:
+	try:
+		return tuple(int(strPart) for strPart in strVersion.split('.')[:3])
+	except ValueError:
+		return None
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import appdirs
+import babel
+import json
+
+from babel import Locale
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+from . import __project__
+from .loc import CZoneScope, StrCityFromTzLocale, StrLocaleFromTzLocaleLang, StrTerritoryFromTz, s_mpStrTzStrKeyCityOverride
+
+class SZoneLangCell(NamedTuple): # tag = zlcell
+	""" what the grid needs to know about one timezone in one language """
+
+	strLocale: str		# native locale for the zone's territory in this language ('' if there isn't one)
+	fOfficial: bool		# language has official status in the zone's territory
+	strCity: str		# the zone's city, in this language
+
+class CZoneLangTable: # tag = zltable
+	""" a dense timezone x language table of resolved locales, territories, official languages and city names.
+
+	resolving these means walking babel's territory/language data and loading CLDR city names, which adds up
+	over a full grid (and happens for both the grid planning and the manifests). everything that comes from
+	babel is cached on disk, keyed by babel version and s_nVersion. city names we translate ourselves (see
+	s_mpStrTzStrKeyCityOverride) come from our own localization database, so they are never cached. """
+
+	s_pathDirCache = Path(appdirs.user_cache_dir(__project__))
+
+	# bump when our side of what's cached changes (CZoneScope, StrLocaleFromTzLocaleLang, the territory
+	# fallback below)
+
+	s_nVersion = 1
+
+	def __init__(self, setStrTz: set[str], setLocaleLang: set[Locale]) -> None:
+		self.mpStrTzStrTerritory: dict[str, str] = {}
+		self.mpStrTzLocaleLangZlcell: dict[str, dict[Locale, SZoneLangCell]] = {}
+
+		pathCache = self.s_pathDirCache / f'zone-lang-v{self.s_nVersion}-babel-{babel.__version__}.json'
+
+		mpStrTzObjZone: dict[str, Any] = self.MpStrTzObjZoneLoad(pathCache)
+		fDirty = False
+
+		for strTz in sorted(setStrTz):
+			objZone = mpStrTzObjZone.setdefault(strTz, {'territory': None, 'langs': {}})
+
+			if objZone['territory'] is None:
+				try:
+					objZone['territory'] = StrTerritoryFromTz(strTz)
+				except KeyError:
+					objZone['territory'] = ''
+				fDirty = True
+
+			self.mpStrTzStrTerritory[strTz] = objZone['territory']
+
+			mpStrLangObjCell: dict[str, Any] = objZone['langs']
+			lLocaleLangMissing = [localeLang for localeLang in setLocaleLang if str(localeLang) not in mpStrLangObjCell]
+
+			if lLocaleLangMissing:
+				if objZone['territory']:
+					setLocaleLangOfficial = CZoneScope(strTz, set(lLocaleLangMissing)).setLocaleLang
+				else:
+					setLocaleLangOfficial = set()
+
+				for localeLang in lLocaleLangMissing:
+					fOverride = strTz in s_mpStrTzStrKeyCityOverride
+
+					mpStrLangObjCell[str(localeLang)] = {
+						'locale': StrLocaleFromTzLocaleLang(strTz, localeLang) or '',
+						'official': localeLang in setLocaleLangOfficial,
+						'city': None if fOverride else StrCityFromTzLocale(strTz, localeLang),
+					}
+
+				fDirty = True
+
+			mpLocaleLangZlcell = self.mpStrTzLocaleLangZlcell.setdefault(strTz, {})
+
+			for localeLang in setLocaleLang:
+				objCell = mpStrLangObjCell[str(localeLang)]
+				strCity = objCell['city']
+
+				if strCity is None:
+					strCity = StrCityFromTzLocale(strTz, localeLang)
+
+				mpLocaleLangZlcell[localeLang] = SZoneLangCell(objCell['locale'], objCell['official'], strCity)
+
+		if fDirty:
+			self.SaveMpStrTzObjZone(pathCache, mpStrTzObjZone)
+
+	@classmethod
+	def MpStrTzObjZoneLoad(cls, pathCache: Path) -> dict[str, Any]:
+		try:
+			obj = json.loads(pathCache.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			return {}
+
+		if not isinstance(obj, dict) or obj.get('version') != cls.s_nVersion or obj.get('babel') != babel.__version__:
+			return {}
+
+		return obj.get('zones', {})
+
+	@classmethod
+	def SaveMpStrTzObjZone(cls, pathCache: Path, mpStrTzObjZone: dict[str, Any]) -> None:
+		try:
+			pathCache.parent.mkdir(parents=True, exist_ok=True)
+			pathTemp = pathCache.with_suffix('.tmp')
+			pathTemp.write_text(
+				json.dumps({'version': cls.s_nVersion, 'babel': babel.__version__, 'zones': mpStrTzObjZone}, ensure_ascii=False, sort_keys=True),
+				encoding='utf-8')
+			pathTemp.replace(pathCache)
+		except OSError as exc:
+			print(f"warning: can't cache zone/language table to {pathCache}: {exc}")
+
+	def Zlcell(self, strTz: str, localeLang: Locale) -> SZoneLangCell:
+		return self.mpStrTzLocaleLangZlcell[strTz][localeLang]
+
+	def StrTerritory(self, strTz: str) -> str:
+		return self.mpStrTzStrTerritory[strTz]
+
+	def StrLocale(self, strTz: str, localeLang: Locale) -> Optional[str]:
+		""" same as StrLocaleFromTzLocaleLang(), but from the table """
+		return self.Zlcell(strTz, localeLang).strLocale or None
+
+	def StrCity(self, strTz: str, localeLang: Locale) -> str:
+		""" same as StrCityFromTzLocale(), but from the table """
+		return self.Zlcell(strTz, localeLang).strCity
+
+	def SetLocaleLangOfficial(self, strTz: str) -> set[Locale]:
+		""" same as CZoneScope(strTz, <table languages>).setLocaleLang, but from the table """
+		mpLocaleLangZlcell = self.mpStrTzLocaleLangZlcell[strTz]
+		return {localeLang for localeLang, zlcell in mpLocaleLangZlcell.items() if zlcell.fOfficial}
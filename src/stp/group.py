@@ -65,7 +65,7 @@ class CGroupBlot(CBlot): # tag = groupb
 		dYTitle = rectInside.dX / self.s_rSGroup
 		rectTitle = rectInside.Copy(dY=dYTitle)
 
-		self.FillBox(rectTitle, self.group.colors.color)
+		self.pdf.FillRect(rectTitle, self.group.colors.color)
 
 		dYGroupName = dYTitle * 1.3
 		oltbGroupName = self.Oltb(rectTitle, self.page.Fontkey('group.name'), dYGroupName)
@@ -90,7 +90,7 @@ class CGroupBlot(CBlot): # tag = groupb
 		dYHeading = dYTitle / 4.0
 		rectHeading = rectInside.Copy(y=rectTitle.yMax, dY=dYHeading)
 
-		self.FillBox(rectHeading, colorBlack)
+		self.pdf.FillRect(rectHeading, colorBlack)
 
 		# teams
 
@@ -100,7 +100,7 @@ class CGroupBlot(CBlot): # tag = groupb
 
 		for i in range(len(self.group.mpStrSeedStrTeam)):
 			color = self.group.colors.colorLighter if (i & 1) else colorWhite
-			self.FillBox(rectTeam, color)
+			self.pdf.FillRect(rectTeam, color)
 			rectTeam.Shift(dY=dYTeam)
 
 		rectTeam.dX = dYTeam * self.s_rSTeamName
@@ -189,14 +189,22 @@ class CGroupBlot(CBlot): # tag = groupb
 
 				# group rank
 
-				if results and results.strPlace:
+				# archives only show the places the seeds give (see CTournamentDataBase.MpStrTeamResults)
+
+				strPlace = ''
+				if results:
+					strPlace = results.strPlace
+					if not strPlace and self.page.pagea.scoring != SCORING.Archive:
+						strPlace = results.strPlaceStandings
+
+				if strPlace:
 					if self.page.pagea.scoring == SCORING.Archive:
 						strFontkey = 'group.team.place'
 					else:
 						strFontkey = 'handwritten'
 					rectPlace = rectRank.Copy(y = yTeam, dY=dYTeam)
 					oltbPlace = self.Oltb(rectPlace, self.page.Fontkey(strFontkey), dYTeam)
-					oltbPlace.DrawText(results.strPlace, colorBlack, JH.Center)
+					oltbPlace.DrawText(strPlace, colorBlack, JH.Center)
 
 				# total points
 
@@ -359,12 +367,16 @@ class CGroupSetBlot(CBlot): # tag = gsetb
 
 		xGroupOrigin = pos.x + (self.dXGridGap / 2 if self.fAddOuterMargin else 0)
 		yGroupOrigin = pos.y + (self.dYGridGap / 2 if self.fAddOuterMargin else 0)
-		for iGroupb, groupb in enumerate(self.lGroupb):
-			iRow, iCol = divmod(iGroupb, self.cCol)
-			posGroup = SPoint(
-				xGroupOrigin + iCol * (CGroupBlot.s_dX + self.dXGridGap),
-				yGroupOrigin + iRow * (CGroupBlot.s_dY + self.dYGridGap))
-			groupb.Draw(posGroup)
+
+		# title, heading and team row fills go down first, all groups at once
+
+		with self.pdf.FillBatch():
+			for iGroupb, groupb in enumerate(self.lGroupb):
+				iRow, iCol = divmod(iGroupb, self.cCol)
+				posGroup = SPoint(
+					xGroupOrigin + iCol * (CGroupBlot.s_dX + self.dXGridGap),
+					yGroupOrigin + iRow * (CGroupBlot.s_dY + self.dYGridGap))
+				groupb.Draw(posGroup)
 
 		# NOTE bruceo: debug drawing for any blot?
 		#self.DrawBox(SRect(pos.x, pos.y, self.dX, self.dY), CGroupBlot.s_dSLineStats, ColorFromStr('magenta'))
@@ -8,13 +8,13 @@ import polib
 from babel import Locale
 from babel.core import get_global, parse_locale, UnknownLocaleError
 from babel.dates import format_interval, get_timezone_location, get_timezone
-from datetime import timedelta
-from typing import Optional, NamedTuple
+from typing import Iterable, Optional, NamedTuple
 from zoneinfo import ZoneInfo
 
 from bolay import CPdf
 
 from . import __project__, g_pathCode
+from .zones import STzSpan, CMatchTimes
 
 # tables from babel
 
@@ -61,16 +61,6 @@ lFmtIso = (
 	'c0', 'c1', 'c2', 'c3', 'c4', 'c5', 'c6', 'c7', 'c8', 'c9', 'c10',
 )
 
-# empirical minimum heights/widths of various tourney sizes.
-# see print() statement in CCalElimPage constructor.
-
-mpCTeamSizeMin: dict[int, tuple[float, float]] ={
-	16: (14.035, 19.844),
-	24: (18.068, 25.750),
-	32: (18.068, 25.750),
-	48: (22.665, 29.969),
-}
-
 s_setStrTerritoryUsLetter = {
 	'us',  # United States
 	'ca',  # Canada
@@ -92,19 +82,25 @@ def FTerritoryUsesIsoPaperSizes(strTerritory: Optional[str]) -> bool:
 def FLocaleUsesIsoPaperSizes(locale: Locale) -> bool:
 	return FTerritoryUsesIsoPaperSizes(locale.territory)
   
-def StrFmtBestFit(cTeam: int, locale: Locale) -> str:
-	dxInMin, dYInMin = mpCTeamSizeMin[cTeam]
-	dXPtMin = dxInMin * 72
-	dYPtMin = dYInMin * 72
-	sAreaPtMin = dXPtMin * dYPtMin
-	sWastedBest = None
-	strFmtBest = 'unknown'
-	lStrFmt = lFmtIso if FLocaleUsesIsoPaperSizes(locale) else lFmtUS
-	for strFmt in lStrFmt:
+def LFmtFromLocale(locale: Locale) -> tuple[str, ...]:
+	return lFmtIso if FLocaleUsesIsoPaperSizes(locale) else tuple(lFmtUS)
+
+def StrFmtBestFit(lTuDxDyPtMin: list[tuple[float, float]], locale: Locale, strOrientation: str = 'portrait') -> Optional[str]:
+	""" the locale's paper size that wastes the least area while fitting one of the page's measured
+	arrangements (widths/heights in points, as oriented on the page). None if nothing fits. """
+
+	fLandscape = strOrientation.lower().startswith('l')
+	sWastedBest: Optional[float] = None
+	strFmtBest: Optional[str] = None
+
+	for strFmt in LFmtFromLocale(locale):
 		dXPt, dYPt = CPdf.s_mpStrFormatWH[strFmt]
-		if dXPt < dXPtMin or dYPt < dYPtMin:
+		if fLandscape:
+			dXPt, dYPt = max(dXPt, dYPt), min(dXPt, dYPt)
+		lSAreaFit = [dXPtMin * dYPtMin for dXPtMin, dYPtMin in lTuDxDyPtMin if dXPt >= dXPtMin and dYPt >= dYPtMin]
+		if not lSAreaFit:
 			continue
-		sWastedFmt = (dXPt * dYPt) - sAreaPtMin
+		sWastedFmt = (dXPt * dYPt) - max(lSAreaFit)
 		if sWastedBest is None or sWastedFmt < sWastedBest:
 			sWastedBest = sWastedFmt
 			strFmtBest = strFmt
@@ -124,13 +120,11 @@ class STZs(NamedTuple):  # tag = tzs
 	strStd: str
 	strDst: str = ''
 
-	def StrLookup(self, tTz: arrow.Arrow) -> str:
+	def StrLookup(self, fDst: bool) -> str:
 		if not self.strDst:
 			return self.strStd
 
-		fIsDst = tTz.dst() and tTz.dst().total_seconds() > 0
-
-		return self.strDst if fIsDst else self.strStd
+		return self.strDst if fDst else self.strStd
 
 class CZoneName: # tag = zonename
 	""" the timezone name(s) for a date/time """
@@ -161,53 +155,60 @@ class CZoneName: # tag = zonename
 		"Asia/Taipei":			STZs("TST"),
 	}
 
-	def __init__(self, tUtc: arrow.Arrow, zoneinfo: ZoneInfo):
+	def __init__(self, strTz: str, tzspan: STzSpan):
+
+		self.strAbbrev, self.cHour, self.cMin = self.TuAbbrevHMFromTzspan(strTz, tzspan)
+
+		# no abbreviation means tz was an offset like "+0330".
+
+		if not self.strAbbrev:
+			print(f"Warning: timezone '{strTz}' abbreviated to '{tzspan.strAbbrev}'")
+		else:
+			setHM = self.s_mpStrAbbrevSetHM.setdefault(self.strAbbrev, set())
+			cHm = len(setHM)
+			setHM.add((self.cHour, self.cMin))
+			
+			if cHm and len(setHM) > cHm:
+				print(f"tz {self.strAbbrev} has multiple HM: {setHM}")
 
-		tTz = tUtc.to(zoneinfo)
+	@classmethod
+	def TuAbbrevHMFromTzspan(cls, strTz: str, tzspan: STzSpan) -> tuple[str, int, int]:
+		""" (abbrev, hour, min) for a span, without the warnings; abbrev is '' for offset-only zones """
 
-		self.strAbbrev = ''
-		self.cHour = 0
-		self.cMin = 0
+		strAbbrev = ''
+		cHour = 0
+		cMin = 0
 
 		try:
-			tzs = self.s_mpStrTzTzs[zoneinfo.key]
-			strTzLookup = tzs.StrLookup(tTz)
+			tzs = cls.s_mpStrTzTzs[strTz]
+			strTzLookup = tzs.StrLookup(tzspan.fDst)
 		except KeyError:
-			strTzLookup = tTz.strftime('%Z')
+			strTzLookup = tzspan.strAbbrev
 
 		# tz be an offset like "+0330".
 
 		if strTzLookup[0] in ('+', '-'):
-			print(f"Warning: timezone '{zoneinfo.key}' abbreviated to '{strTzLookup}'")
 			assert strTzLookup[1:].isdecimal()
 			assert len(strTzLookup) >= 2
 			assert len(strTzLookup) <= 5
 			if len(strTzLookup) > 3:
-				self.cHour = int(strTzLookup[:-2])
-				self.cMin = int(strTzLookup[-2:])
+				cHour = int(strTzLookup[:-2])
+				cMin = int(strTzLookup[-2:])
 			else:
-				self.cHour = int(strTzLookup)
+				cHour = int(strTzLookup)
 		else:
-			self.strAbbrev = strTzLookup
+			strAbbrev = strTzLookup
 
-			dT = tTz.utcoffset()
-			assert(isinstance(dT, timedelta))
-			if cSec := int(dT.total_seconds()):
+			if cSec := tzspan.cSecOffset:
 				if (cSec % (60*60)) == 0:
-					self.cHour = cSec // (60*60)
+					cHour = cSec // (60*60)
 				else:
-					self.cHour = cSec // (60*60)
-					self.cMin = (cSec % (60*60)) // 60
+					cHour = cSec // (60*60)
+					cMin = (cSec % (60*60)) // 60
 
-			setHM = self.s_mpStrAbbrevSetHM.setdefault(self.strAbbrev, set())
-			cHm = len(setHM)
-			setHM.add((self.cHour, self.cMin))
-			
-			if cHm and len(setHM) > cHm:
-				print(f"tz {self.strAbbrev} has multiple HM: {setHM}")
-			
+		assert not any([ch.isdecimal() for ch in strAbbrev])
 
-		assert not any([ch.isdecimal() for ch in self.strAbbrev])
+		return (strAbbrev, cHour, cMin)
 
 	def StrUtcRaw(self) -> str:
 		return f'UTC{self.StrRawOffset()}'
@@ -349,6 +350,55 @@ class CZoneScope: # tag = zscope
 
 		self.setLocaleLang: set[Locale] = setLocaleLangFound & setLocaleLangValid
 
+class SZoneKey(NamedTuple): # tag = zonek
+	""" everything a page can observe about a timezone over a tournament window. two zones with equal keys
+	render identical pages (modulo the zone's city name). """
+
+	tuTzspan: tuple[tuple[int, int, str, int, int], ...]	# (secUtcMin, cSecOffset, abbrev, hour, min) per span
+
+class CZoneClasses: # tag = zclasses
+	""" timezones that are observationally identical over a tournament's window: the same utc offset at every
+	match time and the same CZoneName abbreviation. zones are keyed on all the offset spans in the (padded)
+	window, which is a little stricter than the match times alone, but never merges zones a page can tell apart. """
+
+	def __init__(self, mtimes: CMatchTimes) -> None:
+		self.mtimes = mtimes
+		self.mpStrTzZonek: dict[str, SZoneKey] = {}
+		self.mpZonekLStrTz: dict[SZoneKey, list[str]] = {}
+
+	def ZonekFromStrTz(self, strTz: str) -> SZoneKey:
+		zonek = self.mpStrTzZonek.get(strTz)
+
+		if zonek is None:
+			loct = self.mtimes.LoctFromZoneinfo(ZoneInfo(strTz))
+
+			lTuTzspan: list[tuple[int, int, str, int, int]] = []
+
+			for tzspan in loct.zspans.lTzspan:
+				strAbbrev, cHour, cMin = CZoneName.TuAbbrevHMFromTzspan(strTz, tzspan)
+				lTuTzspan.append((tzspan.secUtcMin, tzspan.cSecOffset, strAbbrev, cHour, cMin))
+
+			zonek = SZoneKey(tuple(lTuTzspan))
+			self.mpStrTzZonek[strTz] = zonek
+
+			lStrTz = self.mpZonekLStrTz.setdefault(zonek, [])
+			lStrTz.append(strTz)
+			lStrTz.sort()
+
+		return zonek
+
+	def Add(self, iterStrTz: Iterable[str]) -> None:
+		for strTz in iterStrTz:
+			self.ZonekFromStrTz(strTz)
+
+	def LStrTzClass(self, strTz: str) -> list[str]:
+		""" all the zones seen so far that are equivalent to strTz (including strTz), sorted. """
+		return self.mpZonekLStrTz[self.ZonekFromStrTz(strTz)]
+
+	def StrTzCanonical(self, strTz: str) -> str:
+		""" a stable representative for strTz's class. only stable once all zones of interest are added. """
+		return self.LStrTzClass(strTz)[0]
+
 # timezones in the CLDR whose city names map to another timezone's city.
 # we need a 1-1 mapping, so we choose to translate the city name ourselves
 # and then look it up from our loc database.
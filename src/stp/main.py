@@ -4,11 +4,14 @@ from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo,
 
 import arrow
 import fpdf
+import functools
 import icu
 import logging
 import os
 import platform
 import re
+import shutil
+import subprocess
 import sys
 import yaml
 
@@ -18,17 +21,22 @@ from enum import IntEnum, auto
 from os import sep as g_chPathSeparator
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from pypdf import PdfWriter
 from tqdm import tqdm
-from typing import Optional, Type, NamedTuple, Iterator, Any
+from typing import Callable, Optional, Type, NamedTuple, Iterator, Any
 
 from bolay import CPdf, ICC
 
 from . import g_pathCode
-from .config import PAGEK, TFmt, REGION, COLORING, SPageArgs, SDocumentArgs, SWorklist, WlFromArgs, ParseArgs, DocaUnwind, StrFromFmt
+from .collate import CCollatedPdf
+from .config import PAGEK, TFmt, REGION, COLORING, SCORING, SPageArgs, SDocumentArgs, SWorklist, WlFromArgs, ParseArgs, DocaUnwind, StrFromFmt
 from .fonts import SetStrTtfFromSetStrScript
-from .loc import CZoneName, StrLangShortFromLocale, StrScriptFromLocale, StrLocaleFromTzLocaleLang, StrLocaleFromLocaleLang, CZoneScope, StrCityFromTzLocale, g_loc
+from .grid import CZoneLangTable
+from .loc import CZoneName, StrLangShortFromLocale, StrScriptFromLocale, StrLocaleFromLocaleLang, g_loc
+from .display import CArtworkForms
+from .preview import CPreviewCache, SPreviewResult
+from .sizes import SizerFromPath, StrKb
 from .profiling import Profiling, DumpTopCumulative
+from .results import LScoreuFromPath, LScoreuMerged
 from .database import CTournamentDataBase
 from .page import CPage, CGroupsTestPage, CDaysTestPage, CColorsTestPage, CCalOnlyPage, CCalElimPage
 
@@ -84,17 +92,19 @@ def PagerFromPage(page: CPage) ->SPageResult:
 class SDocResult(NamedTuple): # tag = docr
 	pathOutput: Path
 	lPager: list[SPageResult]
+	prevr: Optional[SPreviewResult] = None
 
 class SManifestPage(NamedTuple): # tag = manp
 	pathOutput: Path
 	pager: SPageResult
+	prevr: Optional[SPreviewResult] = None
 
 class CCityMap: # tag = citymap
-	def __init__(self, setStrTz: set[str], locale: Locale) -> None:
+	def __init__(self, setStrTz: set[str], locale: Locale, zltable: CZoneLangTable) -> None:
 		mpStrCitySetStrTz: dict[str, set[str]] = {}
 		
 		for strTz in setStrTz:
-			strCity = StrCityFromTzLocale(strTz, locale)
+			strCity = zltable.StrCity(strTz, locale)
 			mpStrCitySetStrTz.setdefault(strCity, set()).add(strTz)
 
 		if len(setStrTz) != len(mpStrCitySetStrTz):
@@ -107,6 +117,24 @@ class CCityMap: # tag = citymap
 		self.mpStrTzStrCity: dict[str, str] = {next(iter(setStrTz)): strCity for strCity, setStrTz in mpStrCitySetStrTz.items()}
 		self.mpStrCityStrTz: dict[str, str] = {strCity: strTz for strTz, strCity  in self.mpStrTzStrCity.items()}
 
+		# one collator per locale, with sort keys computed once and shared by every manifest pass
+
+		self.sorter = icu.Collator.createInstance(icu.Locale(str(locale))) # type: ignore[attr-defined]
+		self.mpStrKeySort: dict[str, bytes] = {}
+
+	def KeySort(self, strIn: str) -> bytes:
+		keySort = self.mpStrKeySort.get(strIn)
+
+		if keySort is None:
+			keySort = self.sorter.getSortKey(strIn)
+			self.mpStrKeySort[strIn] = keySort
+
+		return keySort
+
+	def LStrTzSorted(self, setStrTz: set[str]) -> list[str]:
+		""" zones sorted by their city names in this locale """
+		return sorted(setStrTz, key=lambda strTz: self.KeySort(self.mpStrTzStrCity[strTz]))
+
 # Manifest Destination
 
 class MAND(IntEnum): # tag = mand
@@ -119,6 +147,8 @@ class SCityObj(BaseModel): # tag = cityo
 	strTzAbbrev:	str         			= Field(default='',		alias='tz_abbrev')
 	strTzUtc:		str         			= Field(default='',		alias='tz_utc')
 	linko:			SLinkObj				= Field(default={},		alias='links')
+	linkoThumb:		Optional[SLinkObj]		= Field(default=None,	alias='thumbs')		# same keys as links, when
+	linkoPreview:	Optional[SLinkObj]		= Field(default=None,	alias='previews')	# the documents have previews
 
 type SRegionObj = dict[str, SCityObj] # tag = rego
 
@@ -195,16 +225,21 @@ class CManifest: # tag = manif
 			region = collector.mpStrTzPagezr[strTz].region
 			self.mpRegionSetStrTz.setdefault(region, set()).add(strTz)
 
+		assert collector.zltable
+
 		for locale in collector.setLocaleLang:
-			self.mpLocaleCitymap[locale] = CCityMap(collector.setStrTz, locale)
+			self.mpLocaleCitymap[locale] = CCityMap(collector.setStrTz, locale, collector.zltable)
+
+		self.mpLocaleStrDisplay: dict[Locale, str] = {locale: StrDisplayFromLocale(locale) for locale in collector.setLocaleLang}
 
 		if setLocaleUnordered := collector.setLocaleLang - self.s_setLocaleLangOrdered:
 			sys.exit(f"error: locales not ordered... {','.join([str(locale) for locale in setLocaleUnordered])}")
 
 	def SectoBuild(self, locale: Locale, mand: MAND) -> SSectionObj:
-		sorter = icu.Collator.createInstance(icu.Locale(str(locale))) # type: ignore[attr-defined]
 		pagelr = self.collector.mpLocaleLangPagelr[locale]
 		citymap = self.mpLocaleCitymap[locale]
+		zltable = self.collector.zltable
+		assert zltable
 		strDirection = 'rtl' if locale.character_order == 'right-to-left' else 'ltr'
 
 		secto = SSectionObj(edition=pagelr.strEdition, dir=strDirection)
@@ -216,13 +251,20 @@ class CManifest: # tag = manif
 
 			rego: SRegionObj = {}
 
-			lStrCity = [citymap.mpStrTzStrCity[strTz] for strTz in setStrTz]
-
-			for strCity in sorted(lStrCity, key=sorter.getSortKey):
-				strTz = citymap.mpStrCityStrTz[strCity]
+			for strTz in citymap.LStrTzSorted(setStrTz):
+				strCity = citymap.mpStrTzStrCity[strTz]
 				pagezr = self.collector.mpStrTzPagezr[strTz]
 
 				linko: SLinkObj = {}
+				linkoThumb: SLinkObj = {}
+				linkoPreview: SLinkObj = {}
+
+				def AddLinks(strKey: str, localeLang: Locale, manp: SManifestPage) -> None:
+					strDir = StrLangShortFromLocale(localeLang) + g_chPathSeparator
+					linko[strKey] = strDir + manp.pathOutput.name
+					if manp.prevr:
+						linkoThumb[strKey] = strDir + manp.prevr.pathThumb.name
+						linkoPreview[strKey] = strDir + manp.prevr.pathPreview.name
 
 				match mand:
 					case MAND.Published:
@@ -232,20 +274,20 @@ class CManifest: # tag = manif
 						# - only their preferred paper format
 
 						fmtDefault = pagezr.fmt
-						zscope = CZoneScope(strTz, self.collector.setLocaleLang)
+						setLocaleLangOfficial = zltable.SetLocaleLangOfficial(strTz)
 
-						mpStrLangLocaleLang = {StrDisplayFromLocale(localeLang): localeLang for localeLang in zscope.setLocaleLang}
-						assert len(mpStrLangLocaleLang) == len(zscope.setLocaleLang)
+						mpStrLangLocaleLang = {self.mpLocaleStrDisplay[localeLang]: localeLang for localeLang in setLocaleLangOfficial}
+						assert len(mpStrLangLocaleLang) == len(setLocaleLangOfficial)
 						assert all(mpStrLangLocaleLang.keys())
 
-						for strLang in sorted(mpStrLangLocaleLang.keys(), key=sorter.getSortKey):
+						for strLang in sorted(mpStrLangLocaleLang.keys(), key=citymap.KeySort):
 							assert strLang
 							localeLang = mpStrLangLocaleLang[strLang]
 
 							mank = SManifestKey(strTz, localeLang, fmtDefault)
 							manp = self.collector.mpMankManp[mank]
 
-							linko[strLang] = StrLangShortFromLocale(localeLang) + g_chPathSeparator + manp.pathOutput.name
+							AddLinks(strLang, localeLang, manp)
 
 					case MAND.Language:
 						# language manifest manifest has:
@@ -257,12 +299,14 @@ class CManifest: # tag = manif
 							mank = SManifestKey(strTz, locale, namefmt.fmt)
 							manp = self.collector.mpMankManp[mank]
 
-							linko[namefmt.strName] = StrLangShortFromLocale(locale) + g_chPathSeparator + manp.pathOutput.name
+							AddLinks(namefmt.strName, locale, manp)
 
 				cityo = SCityObj(
 							tz_abbrev=pagezr.strTzAbbrev,
 							tz_utc=pagezr.strTzUtc,
-							links=linko)
+							links=linko,
+							thumbs=linkoThumb or None,
+							previews=linkoPreview or None)
 				
 				rego[strCity] = cityo
 
@@ -286,7 +330,7 @@ class CManifest: # tag = manif
 
 		for localeLang in self.s_lLocaleLangOrder:
 			if secto := mpLocaleSecto.get(localeLang):
-				mpStrLangSecto[StrDisplayFromLocale(localeLang)] = secto
+				mpStrLangSecto[self.mpLocaleStrDisplay[localeLang]] = secto
 
 		mano = SManifestObj(published=sectoPublished, languages=mpStrLangSecto)
 
@@ -294,14 +338,15 @@ class CManifest: # tag = manif
 		
 		pathOutput.write_text(
 			yaml.dump(
-        		mano.model_dump(mode="json", by_alias=True),
+        		mano.model_dump(mode="json", by_alias=True, exclude_none=True),
 				allow_unicode=True,   		# don't escape non-ASCII
 				sort_keys=False,      		# preserve field declaration order
 				default_flow_style=False))	# prettier?
 	
 class CCollector: # tag = collector
-	def __init__(self, doca: Optional[SDocumentArgs], lDocr: list[SDocResult]) -> None:
+	def __init__(self, doca: Optional[SDocumentArgs], lDocr: list[SDocResult], colpdf: Optional[CCollatedPdf] = None) -> None:
 		self.doca = doca
+		self.colpdf = colpdf
 		self.mpMankManp: dict[SManifestKey, SManifestPage] = {}
 		self.setStrTz: set[str] = set()
 		self.setLocaleLang: set[Locale] = set()
@@ -309,6 +354,7 @@ class CCollector: # tag = collector
 		self.mpStrTzPagezr: dict[str, SPageZoneResult] = {}
 		self.mpLocaleLangPagelr: dict[Locale, SPageLangResult] = {}
 		self.setMankMissing: set[SManifestKey] = set()
+		self.zltable: Optional[CZoneLangTable] = None
 
 		if not self.doca:
 			return
@@ -321,7 +367,7 @@ class CCollector: # tag = collector
 				for mank in pager.IterMank():
 
 					assert mank not in self.mpMankManp
-					self.mpMankManp[mank] = SManifestPage(docr.pathOutput, pager)
+					self.mpMankManp[mank] = SManifestPage(docr.pathOutput, pager, docr.prevr)
 
 					self.setStrTz.add(mank.strTz)
 					self.setLocaleLang.add(mank.localeLang)
@@ -341,6 +387,9 @@ class CCollector: # tag = collector
 					except KeyError:
 						self.mpLocaleLangPagelr[mank.localeLang] = pager.pagelr
 
+		if self.doca.fFillGrid:
+			self.zltable = CZoneLangTable(self.setStrTz, self.setLocaleLang)
+
 		self.setMankMissing = self.SetMankMissing()
 
 		self.CollateUnwoundPages()
@@ -375,15 +424,16 @@ class CCollector: # tag = collector
 			print(f"warning: no unwound documents for {pathOutput.relative_to(Path.cwd())}")
 			return
 
-		writer = PdfWriter()
-		for manp in self.mpMankManp.values():
-			writer.append(manp.pathOutput)
+		# the pages streamed in while their documents built (see LDocrBuildLDoca); finish the file
 
-		print(f"collating to {pathOutput.relative_to(Path.cwd())}")
+		assert self.colpdf
 
-		pathOutput.parent.mkdir(parents=True, exist_ok=True)
-		with pathOutput.open("wb") as fileDst:
-			writer.write(fileDst)		
+		print(f"collating {len(self.colpdf.lIdPage)} pages to {pathOutput.relative_to(Path.cwd())}")
+
+		self.colpdf.Close()
+
+		if self.doca.fLinearize:
+			LinearizePdf(pathOutput)
 
 	def PrintMissing(self) -> None:
 		assert self.doca
@@ -410,10 +460,18 @@ class CCollector: # tag = collector
 		
 		lDoca: list[SDocumentArgs] = []
 		mpMankUtcOnlySetMankMissing: dict[SManifestKey, set[SManifestKey]] = {}
-		
-		
+		mpTuNativeSetMankMissing: dict[tuple[str, str, TFmt], set[SManifestKey]] = {}
+
+		# zones that are indistinguishable over the tournament (same offsets and abbreviations) render
+		# identical pages, so all of the grid's zones are classified up front.
+
+		zclasses = CTournamentDataBase.TournFromStrName(self.doca.strNameTourn).zclasses
+		zclasses.Add(sorted(self.setStrTz))
+
+		assert self.zltable
+
 		for mankMissing in self.setMankMissing:
-			strLocale = StrLocaleFromTzLocaleLang(mankMissing.strTz, mankMissing.localeLang)
+			strLocale = self.zltable.StrLocale(mankMissing.strTz, mankMissing.localeLang)
 
 			if not strLocale:
 				# timezone(city) does not natively support this language (eg french in the US).
@@ -437,7 +495,25 @@ class CCollector: # tag = collector
 				continue
 
 			# BB bruceo: need to choose a territory here
-			lDoca.append(DocaUnwind(self.doca, SPageArgs(tz=mankMissing.strTz, loc=strLocale, format=mankMissing.fmt)))
+
+			# a native page can stand in for every equivalent zone that natively gets the same locale
+			# (eg zones that share a territory, or a zone and its legacy aliases).
+
+			tuNative = (strLocale, zclasses.StrTzCanonical(mankMissing.strTz), mankMissing.fmt)
+			setMankMissing = mpTuNativeSetMankMissing.setdefault(tuNative, set())
+			setMankMissing.add(mankMissing)
+
+		for (strLocale, _, fmt), setMankMissing in mpTuNativeSetMankMissing.items():
+			lStrTzAlias = sorted(mankMissing.strTz for mankMissing in setMankMissing)
+
+			lDoca.append(
+				DocaUnwind(
+					self.doca,
+					SPageArgs(
+						tz=lStrTzAlias[0],
+						loc=strLocale,
+						format=fmt,
+						tz_aliases=lStrTzAlias[1:])))
 
 		for mankUtcOnly, setMankMissing in mpMankUtcOnlySetMankMissing.items():
 			lStrTzAlias = [mankMissing.strTz for mankMissing in setMankMissing]
@@ -482,7 +558,7 @@ class CCollector: # tag = collector
 				for mank in pager.IterMank():
 
 					assert mank not in self.mpMankManp
-					self.mpMankManp[mank] = SManifestPage(docr.pathOutput, pager)
+					self.mpMankManp[mank] = SManifestPage(docr.pathOutput, pager, docr.prevr)
 
 					assert mank.strTz in self.setStrTz
 					assert mank.localeLang in self.setLocaleLang
@@ -517,6 +593,7 @@ class CDocument: # tag = doc
 	def __init__(self, doca: SDocumentArgs) -> None:
 		self.doca = doca
 		self.pdf = CPdf(self.s_mpColoringIcc[doca.coloring])
+		self.artf = CArtworkForms()
 
 		if doca.strNameTourn:
 			strName = doca.strNameTourn
@@ -528,6 +605,10 @@ class CDocument: # tag = doc
 			strSubject = 'collection'
 			strKeywords = ''
 
+			# collections (eg all_tournaments) load their tournaments all at once
+
+			CTournamentDataBase.LTournFromLStrName(sorted({pagea.strNameTourn for pagea in doca.tuPagea if pagea.strNameTourn}))
+
 		self.pdf.set_title(strName)
 		self.pdf.set_author('bruce oberg')
 		self.pdf.set_subject(strSubject)
@@ -544,8 +625,13 @@ class CDocument: # tag = doc
 		for strTtf in SetStrTtfFromSetStrScript(setStrScript):
 			self.pdf.AddFont(strTtf, '', self.s_pathDirFonts / strTtf)
 
+		# lay out every page, then render them all
+
 		self.lPage: list[CPage] = [self.s_mpPagekClsPage[pagea.pagek](self, pagea) for pagea in self.doca.tuPagea]
 
+		for page in self.lPage:
+			page.Render()
+
 		self.pathOutput = self.doca.PathOutput(strName, self.lPage)
 
 		self.pathOutput.parent.mkdir(parents=True, exist_ok=True)
@@ -556,17 +642,111 @@ class CDocument: # tag = doc
 
 		self.pdf.output(str(self.pathOutput))
 
+		if doca.fLinearize:
+			LinearizePdf(self.pathOutput)
+
+		self.CheckSize()
+
+		# the first page's drawing stands in for the pdf's bytes, which change every run
+
+		self.prevr: Optional[SPreviewResult] = None
+
+		if doca.fPreviews:
+			pageFirst = self.lPage[0]
+			strHashDrawing = f'{pageFirst.rect.dX:.4f}x{pageFirst.rect.dY:.4f}:{doca.coloring}:{pageFirst.dlist.StrHash()}'
+			self.prevr = CPreviewCache.PrevrBuild(self.pathOutput, strHashDrawing)
+
+	def CheckSize(self) -> None:
+		""" report the pdf's size by part, and hold it to its format's budget """
+
+		if not self.doca.fSizeReport and not self.doca.mpStrFmtKbBudget:
+			return
+
+		sizer = SizerFromPath(self.pathOutput)
+		strPath = str(self.pathOutput.relative_to(Path.cwd()))
+
+		setStrFmt = {StrFromFmt(page.fmt) for page in self.lPage}
+		strLocales = ', '.join(sorted({str(page.locale) for page in self.lPage}))
+
+		if self.doca.fSizeReport:
+			print(f"size: {strPath} [{strLocales}; {', '.join(sorted(setStrFmt))}]: {sizer.StrReport()}")
+
+		# budgets are per format, so documents mixing formats aren't held to one
+
+		if len(setStrFmt) != 1:
+			return
+
+		strFmt = next(iter(setStrFmt))
+		kbBudget = self.doca.mpStrFmtKbBudget.get(strFmt)
+
+		if kbBudget is None or sizer.cbTotal <= kbBudget * 1024:
+			return
+
+		strOver = f"{strPath} is {StrKb(sizer.cbTotal)}, over the {kbBudget} KB budget for {strFmt}: {sizer.StrReport()}"
+
+		if self.doca.fSizeBudgetStrict:
+			sys.exit(f"error: {strOver}")
+
+		print(f"warning: {strOver}")
+
 	def Docr(self) -> Optional[SDocResult]:
 		if not self.doca.fAutoFileSuffix:
 			return None
 
-		return SDocResult(self.pathOutput, [PagerFromPage(page) for page in self.lPage])
+		return SDocResult(self.pathOutput, [PagerFromPage(page) for page in self.lPage], self.prevr)
+
+@functools.cache
+def StrPathQpdf() -> Optional[str]:
+	strPath = shutil.which('qpdf')
+	if strPath is None:
+		print("warning: qpdf not found; pdfs will not be linearized")
+	return strPath
+
+def LinearizePdf(path: Path) -> None:
+	""" rewrite the pdf at path for fast web view (first page readable before the rest downloads).
+	pypdf and fpdf can't write linearized files, so this leans on qpdf when it's installed. """
+
+	strPathQpdf = StrPathQpdf()
+	if strPathQpdf is None:
+		return
+
+	pathTemp = path.with_suffix('.linear.pdf')
+
+	# qpdf exits 3 when it succeeded with warnings
+
+	result = subprocess.run([strPathQpdf, '--linearize', str(path), str(pathTemp)], capture_output=True, text=True)
+	if result.returncode not in (0, 3):
+		print(f"warning: can't linearize {path.relative_to(Path.cwd())}: {result.stderr.strip()}")
+		pathTemp.unlink(missing_ok=True)
+		return
+
+	pathTemp.replace(path)
 
 def DocrBuildDocaAsync(doca: SDocumentArgs) -> Optional[SDocResult]:
 	# Top-level so ProcessPoolExecutor can pickle it.
 	return CDocument(doca).Docr()
 
-def LDocrBuildLDoca(lDoca: list[SDocumentArgs], cJob: int) -> list[SDocResult]:
+def ColpdfFromDoca(doca: Optional[SDocumentArgs]) -> Optional[CCollatedPdf]:
+	""" the collated pdf for unwound documents, which their pages stream into as they build """
+
+	# no collated file when filling the grid
+
+	if not doca or not doca.fUnwindPages or doca.fFillGrid:
+		return None
+
+	return CCollatedPdf(doca.PathOutput(doca.strNameTourn))
+
+def CollateDocr(colpdf: CCollatedPdf, docr: SDocResult) -> None:
+	# a page goes in once per manifest key, same as the manifest
+
+	for pager in docr.lPager:
+		for _ in pager.IterMank():
+			colpdf.Append(docr.pathOutput)
+
+def LDocrBuildLDoca(lDoca: list[SDocumentArgs], cJob: int, fnDocrDone: Optional[Callable[[SDocResult], None]] = None) -> list[SDocResult]:
+	""" build every document. fnDocrDone sees each result as soon as it and every result before it
+	are in, so it sees them in lDoca order. """
+
 	lDocr: list[SDocResult] = []
 
 	if cJob == 1 or len(lDoca) <= 1:
@@ -574,6 +754,8 @@ def LDocrBuildLDoca(lDoca: list[SDocumentArgs], cJob: int) -> list[SDocResult]:
 			doc = CDocument(doca)
 			if docr := doc.Docr():
 				lDocr.append(docr)
+				if fnDocrDone:
+					fnDocrDone(docr)
 			print(f"writing to {doc.pathOutput.relative_to(Path.cwd())}")
 		return lDocr
 
@@ -584,12 +766,71 @@ def LDocrBuildLDoca(lDoca: list[SDocumentArgs], cJob: int) -> list[SDocResult]:
 	with tqdm(total=len(lDoca), desc="building", bar_format=strBarFormat) as pbar:
 		with ProcessPoolExecutor(max_workers=cJob) as pool:
 			lFuture = [pool.submit(DocrBuildDocaAsync, doca) for doca in lDoca]
-			for _ in as_completed(lFuture):
+			mpFutureI = {future: i for i, future in enumerate(lFuture)}
+
+			# reorder buffer: results finish in any order but go to fnDocrDone in order
+
+			mpIDocr: dict[int, Optional[SDocResult]] = {}
+			iNext = 0
+
+			for future in as_completed(lFuture):
 				pbar.update(1)
+				if not fnDocrDone:
+					continue
+				mpIDocr[mpFutureI[future]] = future.result()
+				while iNext in mpIDocr:
+					if docr := mpIDocr.pop(iNext):
+						fnDocrDone(docr)
+					iNext += 1
+
 			lDocr = [docr for future in lFuture if (docr := future.result())]
 
 	return lDocr
 
+def FDocaShowsResults(doca: SDocumentArgs, strNameTourn: str) -> bool:
+	""" fixtures pages never show results (not even teams that have moved on), so they never need
+	rebuilding when results change. """
+
+	for pagea in doca.tuPagea:
+		if (pagea.strNameTourn or doca.strNameTourn) != strNameTourn:
+			continue
+		if pagea.scoring != SCORING.Fixtures:
+			return True
+
+	return False
+
+def WlApplyResults(wl: SWorklist, pathResults: Path, strNameTourn: str) -> SWorklist:
+	""" apply a results patch to a tournament and keep only the documents that it changes. the patch is
+	merged into the tournament's results sidecar, so worker processes (and later runs, until the book
+	itself is edited) pick it up. an unwound set always rebuilds in full, fixtures pages included: its
+	pages are collated and manifested together, from this run's results. """
+
+	if not strNameTourn:
+		setStrNameTourn = {doca.strNameTourn for doca in wl.lDoca if doca.strNameTourn}
+		if len(setStrNameTourn) != 1:
+			sys.exit("error: --results needs a --tournament")
+		strNameTourn = next(iter(setStrNameTourn))
+
+	tourn = CTournamentDataBase.TournFromStrName(strNameTourn)
+
+	lScoreu = LScoreuFromPath(pathResults)
+	setIdChanged = tourn.SetIdApplyLScoreu(lScoreu)
+
+	tourn.SaveLScoreuSidecar(LScoreuMerged(tourn.LScoreuSidecar(), lScoreu))
+
+	print(f"results: {len(setIdChanged)} matches changed in {strNameTourn}: {', '.join(str(id) for id in sorted(setIdChanged))}")
+
+	# unwound documents get collated (and manifested) together, so they all build
+
+	if wl.docaWind:
+		return wl
+
+	lDoca = [doca for doca in wl.lDoca if setIdChanged and FDocaShowsResults(doca, strNameTourn)]
+
+	print(f"results: rebuilding {len(lDoca)} of {len(wl.lDoca)} documents")
+
+	return SWorklist(lDoca, wl.docaWind)
+
 def main():
 	args = ParseArgs()
 
@@ -608,9 +849,20 @@ def main():
 
 		wl = WlFromArgs(args)
 
-		lDocr = LDocrBuildLDoca(wl.lDoca, cJob)
+		if args.results:
+			wl = WlApplyResults(wl, Path(args.results), args.tournament)
+
+		colpdf = ColpdfFromDoca(wl.docaWind)
+
+		try:
+			lDocr = LDocrBuildLDoca(wl.lDoca, cJob, (lambda docr: CollateDocr(colpdf, docr)) if colpdf else None)
+
+			collector = CCollector(wl.docaWind, lDocr, colpdf)
+		finally:
+			# a failed or interrupted run leaves the last good collated pdf alone
 
-		collector = CCollector(wl.docaWind, lDocr)
+			if colpdf:
+				colpdf.Abort()
 
 		if wl := collector.WlMissing():
 			assert wl.docaWind is None
@@ -4,9 +4,11 @@ import arrow
 import babel.dates
 import datetime
 import io
+import numpy as np
 import qrcode
 import sys
 
+from abc import ABC, abstractmethod
 from babel import Locale
 from dataclasses import dataclass
 from qrcode.constants import ERROR_CORRECT_L
@@ -20,9 +22,10 @@ from bolay import colorBlack, colorWhite, colorGrey, colorLightGrey
 
 from .config import SPageArgs, SCORING
 from .fonts import StrTtfLookup
-from .loc import g_loc, CZoneName, StrFmtBestFit, StrLangTerritoryFromLocale, StrScriptFromLocale, StrDateRange
+from .loc import g_loc, CZoneName, SZoneKey, StrFmtBestFit, StrLangTerritoryFromLocale, StrScriptFromLocale, StrDateRange
 from .versioning import g_repover
 from .database import CTournamentDataBase, CMatch, STAGE
+from .display import CDisplayList, CRecordingPdf
 from .group import CGroupBlot, CGroupSetBlot
 from .calendar import CDayBlot, CDayBlotList, CElimBlot, CCalendarBlot
 from .bracket import CFinalBlot, CBracketBlot
@@ -85,7 +88,7 @@ class CTomorrowTime(datetime.time):  # tag = tmrt
             kwargs.get('tzinfo'),  # type: ignore[arg-type]
         )
 
-class CPage:
+class CPage(ABC):
 
 	s_dSLineCropMarks = 0.008
 	s_colorCropMarks = colorGrey
@@ -102,11 +105,19 @@ class CPage:
 		STAGE.Semis: ColorFromStr("#aaaaaa"),		# 129 + 41 = 170 (0xaa)
 	}
 
+	# display dates/times by (tournament, zone class, locale, tomorrow time). see BuildDisplayDatesTimes.
+
+	s_mpTuKeyTuMpDisplay: dict[tuple[str, SZoneKey, str, bool], tuple[dict[int, datetime.date], dict[int, str]]] = {}
+
 	def __init__(self, doc: CDocument, pagea: SPageArgs):
 		self.doc = doc
-		self.pdf = doc.pdf
 		self.pagea = pagea
 
+		# layout phase: blots draw into a display list, which Render plays into the document's pdf
+
+		self.dlist = CDisplayList()
+		self.pdf = CRecordingPdf(doc.pdf, self.dlist)
+
 		if pagea.strNameTourn:
 			self.tourn = CTournamentDataBase.TournFromStrName(pagea.strNameTourn)
 		else:
@@ -125,13 +136,6 @@ class CPage:
 		self.locale = Locale.parse(self.pagea.strLocale)
 		self.strScript = StrScriptFromLocale(self.locale)
 		self.strDateMMMMEEEEd = StrPatternDateMMMMEEEEd(self.locale)
-		if self.pagea.fmt is None:
-			assert(self.pagea.fmtCrop == None)
-			self.fmt = StrFmtBestFit(len(self.tourn.mpStrTeamGroup), self.locale)
-		else:
-			self.fmt = self.pagea.fmt
-		self.fmtCrop = self.pagea.fmtCrop
-
 		self.BuildDisplayDatesTimes()
 
 		self.mpDateSetMatch: dict[datetime.date, set[CMatch]] = self.MpDateSetMatch()
@@ -140,7 +144,7 @@ class CPage:
 
 		self.tMin = arrow.get(min(self.mpDateSetMatch))
 		self.tMax = arrow.get(max(self.mpDateSetMatch))
-		self.zonename = CZoneName(self.tMin, self.zoneinfo)
+		self.zonename = CZoneName(self.zoneinfo.key, self.loct.zspans.TzspanFromSecUtc(self.tMin.int_timestamp))
 
 		self.strEdition = self.StrEdition()
 		self.strTitle = self.StrTitle(self.strEdition)
@@ -148,13 +152,23 @@ class CPage:
 		self.strLocation = self.StrTranslation(self.tourn.StrKeyHost())
 		self.strZonename = self.zonename.StrUtcFriendly() if self.pagea.fUtcOnly else self.zonename.StrFriendly()
 
+		# with every string in place, the blots can be measured to pick a format
+
+		if self.pagea.fmt is None:
+			assert(self.pagea.fmtCrop == None)
+			self.fmt = self.StrFmtBestFit()
+		else:
+			self.fmt = self.pagea.fmt
+		self.fmtCrop = self.pagea.fmtCrop
+
 		# if self.pagea.fmt is None:
 		# 	print(f"{self.tourn.strName} ({str(self.locale).lower()}/{self.zoneinfo.key}): choosing {self.fmt}")
 
-		# using "type: ignore" here because fpdf's typing stubs are known to be janky.
+		# the page itself isn't added until Render, so size it the way the crop format gets sized
 
-		self.pdf.add_page(orientation=self.strOrientation, format=self.fmt)	# type: ignore[arg-type]
-		self.rect = SRect(0, 0, self.pdf.w, self.pdf.h)
+		tuDxDy = self.pdf.TuDxDyFromOrientationFmt(self.strOrientation, self.fmt)
+		assert tuDxDy
+		self.rect = SRect(0, 0, tuDxDy[0], tuDxDy[1])
 
 		if tuDxDyCrop := self.pdf.TuDxDyFromOrientationFmt(self.strOrientation, self.fmtCrop):
 			dX = min(self.rect.dX, tuDxDyCrop[0])
@@ -229,8 +243,28 @@ class CPage:
 
 	def BuildDisplayDatesTimes(self):
 
+		# every match converted into the page's timezone (and the tournament's) in one shot
+
+		mtimes = self.tourn.mtimes
+		aFGroup = mtimes.aFGroup
+
+		self.loct = mtimes.LoctFromZoneinfo(self.zoneinfo)
+
+		# pages in equivalent zones (see CZoneClasses) get identical display tables, so share them.
+
+		tuKeyDisplay = (
+			self.tourn.strName,
+			self.tourn.zclasses.ZonekFromStrTz(self.zoneinfo.key),
+			str(self.locale),
+			self.pagea.fTomorrowTime)
+
+		if tuMpDisplay := self.s_mpTuKeyTuMpDisplay.get(tuKeyDisplay):
+			self.mpIdDateDisplay, self.mpIdStrTimeDisplay = tuMpDisplay
+			return
+
 		self.mpIdDateDisplay: dict[int, datetime.date] = {}
 		self.mpIdStrTimeDisplay: dict[int, str] = {}
+		self.s_mpTuKeyTuMpDisplay[tuKeyDisplay] = (self.mpIdDateDisplay, self.mpIdStrTimeDisplay)
 
 		# map all matches into the day that they are played in the tournament's timezone.
 		# the goal here is to have same-day matches appear on the same calendar day for all
@@ -239,66 +273,60 @@ class CPage:
 		strTzTourney: str = self.tourn.StrTimezone()
 		zoneinfoTourney = ZoneInfo(strTzTourney)
 		assert(zoneinfoTourney)
-		mpIdDateTourney: dict[int, datetime.date] = { id: match.tStart.to(zoneinfoTourney).date() for id, match in self.tourn.mpIdMatch.items() }
+		aDateTourney = mtimes.LoctFromZoneinfo(zoneinfoTourney).aDate
 
 		# if all the matches are one day off their display dates, then reset the display dates
 
 		if self.pagea.fTomorrowTime:
 
-			fAllGroupMatchesAhead = True
-
-			for match in self.tourn.mpIdMatch.values():
-				if match.stage != STAGE.Group:
-					continue
-				tTimeTz = match.tStart.to(self.zoneinfo)
-				dateDisplay = mpIdDateTourney[match.id]
-				if dateDisplay.day == tTimeTz.day:
-					fAllGroupMatchesAhead = False
-					break
+			fAllGroupMatchesAhead = bool(np.all(aDateTourney[aFGroup] != self.loct.aDate[aFGroup]))
 
 			if fAllGroupMatchesAhead:
-				mpIdDateTourneyAdjusted: dict[int, datetime.date] = {id: dateTourney + datetime.timedelta(days=1) for id, dateTourney in mpIdDateTourney.items() }
-				mpIdDateTourney = mpIdDateTourneyAdjusted
+				aDateTourney = aDateTourney + np.timedelta64(1, 'D')
+
+		# group matches (optionally) display on the tournament's day, and show "tomorrow" times when
+		# the page's timezone has them landing on a different day.
+
+		if self.pagea.fTomorrowTime:
+			aDateDisplay = np.where(aFGroup, aDateTourney, self.loct.aDate)
+			aFTomorrow = aFGroup & (aDateTourney != self.loct.aDate)
+		else:
+			aDateDisplay = self.loct.aDate
+			aFTomorrow = np.zeros_like(aFGroup)
 
 		# several language/territory combos have a 'short' format that negates the effect of our
 		# CTomorrowTime hack. if any group matches would use CTomorrowTime, force a 24h aware format.
 
-		strFmtTime = 'short'
+		strFmtTime = 'HH:mm' if aFTomorrow.any() else 'short'
 
-		if self.pagea.fTomorrowTime:
+		# lots of matches share kickoff times, so only format each distinct time once
 
-			fForceGroup24HourTime = False
+		mpTuStrTime: dict[tuple[int, int, int, bool], str] = {}
 
-			for match in self.tourn.mpIdMatch.values():
-				if match.stage != STAGE.Group:
-					continue
-				tTimeTz = match.tStart.to(self.zoneinfo)
-				dateDisplay = mpIdDateTourney[match.id]
-				if dateDisplay.day != tTimeTz.day:
-					fForceGroup24HourTime = True
-					continue
+		for i, id in enumerate(mtimes.lId):
+			fTomorrow = bool(aFTomorrow[i])
+			tuTime = (int(self.loct.aHour[i]), int(self.loct.aMinute[i]), int(self.loct.aSecond[i]), fTomorrow)
 
-			if fForceGroup24HourTime:
-				strFmtTime = 'HH:mm'
+			strTime = mpTuStrTime.get(tuTime)
 
-		for match in self.tourn.mpIdMatch.values():
-			tTimeTz = match.tStart.to(self.zoneinfo)
-			strTime = babel.dates.format_time(tTimeTz.time(), strFmtTime, locale=self.locale)
+			if strTime is None:
+				cHour, cMinute, cSecond, _ = tuTime
 
-			if match.stage == STAGE.Group and self.pagea.fTomorrowTime:
-				dateDisplay = mpIdDateTourney[match.id]
-				if dateDisplay.day != tTimeTz.day:
-					ttTimeTz = CTomorrowTime(tTimeTz.hour, tTimeTz.minute, tTimeTz.second, tTimeTz.microsecond, tTimeTz.tzinfo)
-					strTime = babel.dates.format_time(ttTimeTz, strFmtTime, locale=self.locale)
-			else:
-				dateDisplay = tTimeTz.date()
+				if fTomorrow:
+					timeTz = CTomorrowTime(cHour, cMinute, cSecond, 0, self.zoneinfo)
+				else:
+					timeTz = datetime.time(cHour, cMinute, cSecond)
 
-			# hacks that probably violate the CLDR
+				strTime = babel.dates.format_time(timeTz, strFmtTime, locale=self.locale)
 
-			strTime = strTime.translate({ord(ch):' ' for ch in '   '}) # some of our fonts don't have weirdo spaces
+				# hacks that probably violate the CLDR
 
-			self.mpIdDateDisplay[match.id] = dateDisplay
-			self.mpIdStrTimeDisplay[match.id] = strTime
+				strTime = strTime.translate({ord(ch):' ' for ch in '   '}) # some of our fonts don't have weirdo spaces
+
+				mpTuStrTime[tuTime] = strTime
+
+			self.mpIdDateDisplay[id] = aDateDisplay[i].item()
+			self.mpIdStrTimeDisplay[id] = strTime
 
 	def DateDisplay(self, match: CMatch) -> datetime.date:
 		return self.mpIdDateDisplay[match.id]
@@ -317,6 +345,37 @@ class CPage:
 		return mpDateSetMatch
 
 
+	# room left over for the gaps between blots when a page is sized to fit
+
+	s_dSFitMargin = 1.0
+
+	@abstractmethod
+	def LTuDxDyMin(self) -> list[tuple[float, float]]:
+		""" measure-only layout: the smallest (width, height) for each arrangement the page can fall back
+		to. builds the page's blots to measure them, but draws nothing and needs no pdf page. every page
+		class in PAGEK overrides this. """
+
+	def StrFmtBestFit(self) -> str:
+		lTuDxDyMin = self.LTuDxDyMin()
+		strFmt = StrFmtBestFit([(dX * self.pdf.k, dY * self.pdf.k) for dX, dY in lTuDxDyMin], self.locale, self.strOrientation)
+
+		if strFmt is None:
+			strMin = ' or '.join(f"{dX:.2f}x{dY:.2f}" for dX, dY in lTuDxDyMin)
+			sys.exit(f"{self.tourn.strName} ({self.locale}): no paper size fits {strMin}")
+
+		return strFmt
+
+	def Render(self) -> None:
+		""" render phase: add the page and play the display list recorded during layout into it. artwork
+		shared with other pages of the document is drawn by reference. """
+
+		# using "type: ignore" here because fpdf's typing stubs are known to be janky.
+
+		self.doc.pdf.add_page(orientation=self.strOrientation, format=self.fmt)	# type: ignore[arg-type]
+		assert abs(self.doc.pdf.w - self.rect.dX) < 0.01 and abs(self.doc.pdf.h - self.rect.dY) < 0.01
+
+		self.doc.artf.Play(self.doc.pdf, self.dlist)
+
 	def DrawCropLines(self) -> None:
 		if self.rectInside is self.rect:
 			return
@@ -355,10 +414,16 @@ class CPage:
 		return self.tourn.fHasAllResults
 
 class CGroupsTestPage(CPage): # gtp
+
+	s_dSMargin = 0.5
+
+	def LTuDxDyMin(self) -> list[tuple[float, float]]:
+		return [(2 * (CGroupBlot.s_dX + self.s_dSMargin) + self.s_dSMargin, 4 * (CGroupBlot.s_dY + self.s_dSMargin) + self.s_dSMargin)]
+
 	def __init__(self, doc: CDocument, pagea: SPageArgs):
 		super().__init__(doc, pagea)
 
-		dSMargin = 0.5
+		dSMargin = self.s_dSMargin
 
 		dXGrid = CGroupBlot.s_dX + dSMargin
 		dYGrid = CGroupBlot.s_dY + dSMargin
@@ -377,16 +442,26 @@ class CGroupsTestPage(CPage): # gtp
 				groupb.Draw(pos)
 
 class CDaysTestPage(CPage): # gtp
-	def __init__(self, doc: CDocument, pagea: SPageArgs):
-		super().__init__(doc, pagea)
 
-		dSMargin = 0.25
+	s_dSMargin = 0.25
 
+	def Daybl(self) -> CDayBlotList:
 		# lIdMatch = (49,57)
-		# setDate: set[datetime.date] = {doc.tourn.mpIdMatch[idMatch].tStart.date() for idMatch in lIdMatch}
+		# setDate: set[datetime.date] = {datetime.datetime.fromtimestamp(doc.tourn.mpIdMatch[idMatch].secStart, datetime.UTC).date() for idMatch in lIdMatch}
 		setDate: set[datetime.date] = set(self.mpDateSetMatch.keys())
 
-		daybl = CDayBlotList([CDayBlot(self, arrow.get(date), self.mpDateSetMatch.get(date)) for date in sorted(setDate)])
+		return CDayBlotList([CDayBlot(self, arrow.get(date), self.mpDateSetMatch.get(date)) for date in sorted(setDate)])
+
+	def LTuDxDyMin(self) -> list[tuple[float, float]]:
+		daybl = self.Daybl()
+		return [(7 * (daybl.dXDayb + self.s_dSMargin) + self.s_dSMargin, 4 * (daybl.dYDayb + self.s_dSMargin) + self.s_dSMargin)]
+
+	def __init__(self, doc: CDocument, pagea: SPageArgs):
+		super().__init__(doc, pagea)
+
+		dSMargin = self.s_dSMargin
+
+		daybl = self.Daybl()
 
 		dXCell = daybl.dXDayb + dSMargin
 		dYCell = daybl.dYDayb + dSMargin
@@ -451,20 +526,18 @@ class CColorsTestPage(CPage): # gtp
 
 	s_lMpStrGroupStrColor: list[Optional[dict[str, str]]] = [s_mpStrGroupStrColorOrig, s_mpStrGroupStrColorWashed, s_mpStrGroupStrColorFixed]
 
-	def __init__(self, doc: CDocument, pagea: SPageArgs):
-		super().__init__(doc, pagea)
-
-		dSMargin = 0.25
+	s_dSMargin = 0.25
 
-		assert doc.tourn
+	def Daybl(self) -> CDayBlotList:
+		assert self.doc.tourn
 		
 		if True:
 			lIdMatch = range(25,48)
-			setDate: set[datetime.date] = {doc.tourn.mpIdMatch[idMatch].tStart.date() for idMatch in lIdMatch}
+			setDate: set[datetime.date] = {datetime.datetime.fromtimestamp(self.doc.tourn.mpIdMatch[idMatch].secStart, datetime.UTC).date() for idMatch in lIdMatch}
 		else:
 			setDate: set[datetime.date] = set(self.mpDateSetMatch.keys())
 
-		daybl = CDayBlotList(
+		return CDayBlotList(
 					[
 						CDayBlot(
 							self,
@@ -473,6 +546,20 @@ class CColorsTestPage(CPage): # gtp
 						for date in sorted(setDate)
 					])
 
+	def LTuDxDyMin(self) -> list[tuple[float, float]]:
+		daybl = self.Daybl()
+		cRow = len(self.s_lMpStrGroupStrColor) * 2
+		return [(len(daybl.lDayb) * (daybl.dXDayb + self.s_dSMargin) + self.s_dSMargin, cRow * (daybl.dYDayb + self.s_dSMargin) + self.s_dSMargin)]
+
+	def __init__(self, doc: CDocument, pagea: SPageArgs):
+		super().__init__(doc, pagea)
+
+		dSMargin = self.s_dSMargin
+
+		assert doc.tourn
+
+		daybl = self.Daybl()
+
 		dXCell = daybl.dXDayb + dSMargin
 		dYCell = daybl.dYDayb + dSMargin
 
@@ -626,7 +713,9 @@ class CFooterBlot(CBlot): # tag = headerb
 		lStrInfoLeft: list[str] = []
 
 		if not self.page.FAllMatchesHaveResults():
-			strTzFooter = self.page.pagea.strTz
+			# a page shared by equivalent zones (see tz_aliases) shouldn't name just one of their cities
+
+			strTzFooter = self.page.strZonename if self.page.pagea.lStrTzAlias else self.page.pagea.strTz
 			lStrInfoLeft.append(strTzFooter)
 
 		lStrInfoLeft += [
@@ -649,6 +738,29 @@ class CFooterBlot(CBlot): # tag = headerb
 			oltbInfo.DrawText(strInfo, colorLightGrey, jh, JV.Middle)
 
 class CCalOnlyPage(CPage): # tag = calonlyp
+
+	def Calb(self) -> CCalendarBlot:
+		setMatchCalendar = self.tourn.setMatchGroup | self.tourn.setMatchElimination
+
+		if self.tourn.matchThird:
+			setMatchCalendar.add(self.tourn.matchThird)
+
+		return CCalendarBlot(self, setMatchCalendar)
+
+	def LTuDxDyMin(self) -> list[tuple[float, float]]:
+		# groups either side (the right gets the odd one), calendar over final in the middle
+
+		cGroupHalf = len(self.tourn.lStrGroup) // 2
+		rectMin = SRect(0, 0, 0, 0) # zero size gives group sets their minimum gaps
+		lGroupb = [CGroupBlot(self, self.tourn.mpStrGroupGroup[strGroup]) for strGroup in self.tourn.lStrGroup[cGroupHalf:]]
+		gsetb = CGroupSetBlot(self.doc, lGroupb, rectMin, cCol = 1)
+
+		calb = self.Calb()
+
+		return [(
+			2 * gsetb.dX + calb.dX + self.s_dSFitMargin,
+			CHeaderBlot.s_dY + CFooterBlot.s_dY + max(calb.dY + CFinalBlot.s_dY + self.s_dSFitMargin, gsetb.dY))]
+
 	def __init__(self, doc: CDocument, pagea: SPageArgs):
 		super().__init__(doc, pagea)
 
@@ -674,12 +786,7 @@ class CCalOnlyPage(CPage): # tag = calonlyp
 		lGroupbRight = [CGroupBlot(self, self.tourn.mpStrGroupGroup[strGroup]) for strGroup in self.tourn.lStrGroup[cGroupHalf:]]
 		gsetbRight = CGroupSetBlot(doc, lGroupbRight, rectCanvas, cCol = 1)
 
-		setMatchCalendar = self.tourn.setMatchGroup | self.tourn.setMatchElimination
-
-		if self.tourn.matchThird:
-			setMatchCalendar.add(self.tourn.matchThird)
-
-		calb = CCalendarBlot(self, setMatchCalendar)
+		calb = self.Calb()
 		finalb = CFinalBlot(self)
 
 		dXUnused = rectCanvas.dX - (calb.dX + gsetbLeft.dX + gsetbRight.dX)
@@ -715,6 +822,40 @@ class CCalOnlyPage(CPage): # tag = calonlyp
 		self.DrawCropLines()
 
 class CCalElimPage(CPage): # tag = calelimp
+
+	def TuCalbBracketb(self) -> tuple[CCalendarBlot, CBracketBlot]:
+		setMatchCalendar: set[CMatch] = self.tourn.mpStageSetMatch[STAGE.Group]
+		lSetMatchBracket: list[set[CMatch]] = [setMatch for stage, setMatch in self.tourn.mpStageSetMatch.items() if stage != STAGE.Group]
+		setMatchBracket: set[CMatch] = set().union(*lSetMatchBracket)
+
+		return CCalendarBlot(self, setMatchCalendar), CBracketBlot(self, setMatchBracket)
+
+	def LTuDxDyMin(self) -> list[tuple[float, float]]:
+		# the two arrangements laid out below: groups either side of a calendar/bracket/final stack, or
+		# (when that's too wide) groups tucked below the calendar, either side of bracket and final.
+
+		cGroupHalf = len(self.tourn.lStrGroup) // 2
+		rectMin = SRect(0, 0, 0, 0) # zero size gives group sets their minimum gaps
+		lGroupb = [CGroupBlot(self, self.tourn.mpStrGroupGroup[strGroup]) for strGroup in self.tourn.lStrGroup[:cGroupHalf]]
+		gsetb = CGroupSetBlot(self.doc, lGroupb, rectMin, cCol = 1)
+		gsetbTight = CGroupSetBlot(self.doc, lGroupb, rectMin, cCol = 1, fAddOuterMargin = False)
+
+		calb, bracketb = self.TuCalbBracketb()
+
+		dYChrome = CHeaderBlot.s_dY + CFooterBlot.s_dY
+
+		# when height is short, the final gets skootched into the bracket, so it needs no height of its own
+
+		tuDxDyStack = (
+			2 * gsetb.dX + max(calb.dX, bracketb.dX, CFinalBlot.s_dX) + self.s_dSFitMargin,
+			dYChrome + max(calb.dY + bracketb.dY, gsetb.dY))
+
+		tuDxDyTucked = (
+			max(calb.dX, 2 * gsetbTight.dX + max(bracketb.dX, CFinalBlot.s_dX)) + self.s_dSFitMargin,
+			dYChrome + calb.dY + max(gsetbTight.dY, bracketb.dY) + CFinalBlot.s_dY + self.s_dSFitMargin)
+
+		return [tuDxDyStack, tuDxDyTucked]
+
 	def __init__(self, doc: CDocument, pagea: SPageArgs):
 		super().__init__(doc, pagea)
 
@@ -752,12 +893,7 @@ class CCalElimPage(CPage): # tag = calelimp
 
 		# cal vs bracket matches
 
-		setMatchCalendar: set[CMatch] = self.tourn.mpStageSetMatch[STAGE.Group]
-		lSetMatchBracket: list[set[CMatch]] = [setMatch for stage, setMatch in self.tourn.mpStageSetMatch.items() if stage != STAGE.Group]
-		setMatchBracket: set[CMatch] = set().union(*lSetMatchBracket)
-
-		calb = CCalendarBlot(self, setMatchCalendar)
-		bracketb = CBracketBlot(self, setMatchBracket)
+		calb, bracketb = self.TuCalbBracketb()
 
 		finalb = CFinalBlot(self)
 
@@ -842,13 +978,3 @@ class CCalElimPage(CPage): # tag = calelimp
 		footerb.Draw(rectFooter.posMin)
 
 		self.DrawCropLines()
-
-		# print(' '.join([
-		# 	f"cTeam: {len(self.tourn.mpStrTeamGroup)}",
-		# 	f"dX2: {gsetbLeft.dX+gsetbRight.dX+max(bracketb.dX, finalb.s_dX)+1:0.3f}",
-		# 	f"dX3: {gsetbLeft.dX+gsetbRight.dX+max(calb.dX, bracketb.dX, finalb.s_dX)+1:0.3f}",
-		# 	f"dY2: {headerb.s_dY+footerb.s_dY+calb.dY+bracketb.dY:0.3f}",
-		# 	f"dY3: {headerb.s_dY+footerb.s_dY+calb.dY+bracketb.dY+finalb.s_dY+1:0.3f}",
-		# ]))
-
-		# print(f"cTeam: {len(self.tourn.mpStrTeamGroup)} fmt: {self.StrFmtBestFit()}")
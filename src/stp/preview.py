@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import appdirs
+import hashlib
+import pypdfium2 as pdfium
+import shutil
+
+from pathlib import Path
+from PIL import Image, features
+from typing import NamedTuple
+
+from . import __project__
+
+class SPreviewResult(NamedTuple): # tag = prevr
+	pathThumb: Path
+	pathPreview: Path
+
+class CPreviewCache: # tag = prevc
+	""" a small thumbnail and a medium preview of a pdf's first page, for the grid site. rasterized
+	locally with pdfium, and cached by a hash of what the page draws (the pdf itself differs every run,
+	if only by its creation date), so unchanged posters aren't rasterized again. """
+
+	s_pathDirCache = Path(appdirs.user_cache_dir(__project__)) / 'previews'
+
+	# bump when the sizes or encodings change, or when fonts change under the same names
+
+	s_nVersion = 1
+
+	# longest side, in pixels
+
+	s_cPixelThumb = 256
+	s_cPixelPreview = 1024
+
+	s_strExtThumb = '.png'
+	s_strExtPreview = '.webp' if features.check('webp') else '.png'
+
+	@classmethod
+	def PrevrBuild(cls, pathPdf: Path, strHashDrawing: str) -> SPreviewResult:
+		""" write the thumbnail and preview next to pathPdf """
+
+		prevr = SPreviewResult(
+					pathPdf.with_name(f'{pathPdf.stem}-thumb{cls.s_strExtThumb}'),
+					pathPdf.with_name(f'{pathPdf.stem}-preview{cls.s_strExtPreview}'))
+
+		strKey = hashlib.sha256(f'{cls.s_nVersion}\0{strHashDrawing}'.encode()).hexdigest()
+		pathCacheThumb = cls.s_pathDirCache / f'{strKey}-thumb{cls.s_strExtThumb}'
+		pathCachePreview = cls.s_pathDirCache / f'{strKey}-preview{cls.s_strExtPreview}'
+
+		if pathCacheThumb.exists() and pathCachePreview.exists():
+			shutil.copyfile(pathCacheThumb, prevr.pathThumb)
+			shutil.copyfile(pathCachePreview, prevr.pathPreview)
+			return prevr
+
+		# one rasterization at preview size; the thumbnail is scaled down from it
+
+		pdfdoc = pdfium.PdfDocument(str(pathPdf))
+		try:
+			pdfpage = pdfdoc[0]
+			dXPt, dYPt = pdfpage.get_size()
+			imagePreview: Image.Image = pdfpage.render(scale=cls.s_cPixelPreview / max(dXPt, dYPt)).to_pil()
+		finally:
+			pdfdoc.close()
+
+		imageThumb = imagePreview.copy()
+		imageThumb.thumbnail((cls.s_cPixelThumb, cls.s_cPixelThumb), Image.Resampling.LANCZOS)
+
+		imagePreview.save(prevr.pathPreview)
+		imageThumb.save(prevr.pathThumb, optimize=True)
+
+		# workers race on the cache, so land files whole
+
+		try:
+			cls.s_pathDirCache.mkdir(parents=True, exist_ok=True)
+			for pathSrc, pathCache in ((prevr.pathThumb, pathCacheThumb), (prevr.pathPreview, pathCachePreview)):
+				pathTemp = pathCache.with_name(f'{pathCache.stem}.{pathPdf.stem}.tmp')
+				shutil.copyfile(pathSrc, pathTemp)
+				pathTemp.replace(pathCache)
+		except OSError as exc:
+			print(f"warning: can't cache previews in {cls.s_pathDirCache}: {exc}")
+
+		return prevr
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import csv
+import json
+import sys
+
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# score updates use the same columns as the matches table, so a results patch can be cut and pasted
+# from (or into) a tournament spreadsheet. only 'match' is required; missing scores mean no result (yet).
+
+class SScoreUpdate(NamedTuple): # tag = scoreu
+	id: int
+	scoreHome: int = -1
+	scoreAway: int = -1
+	scoreHomeTiebreaker: int = -1
+	scoreAwayTiebreaker: int = -1
+	fAfterExtraTime: bool = False
+	strTeamHome: str = ''		# '' leaves the team as is
+	strTeamAway: str = ''
+
+	@classmethod
+	def ScoreuFromMpStrVal(cls, mpStrVal: dict[str, Any]) -> SScoreUpdate:
+		def IntFromVal(val: Any) -> int:
+			return -1 if val is None or val == '' else int(val)
+
+		def StrFromVal(val: Any) -> str:
+			return '' if val is None else str(val)
+
+		return cls(
+				int(mpStrVal['match']),
+				IntFromVal(mpStrVal.get('home-score')),
+				IntFromVal(mpStrVal.get('away-score')),
+				IntFromVal(mpStrVal.get('home-tiebreaker')),
+				IntFromVal(mpStrVal.get('away-tiebreaker')),
+				bool(mpStrVal.get('after-extra-time')),
+				StrFromVal(mpStrVal.get('home-team')),
+				StrFromVal(mpStrVal.get('away-team')))
+
+	def MpStrVal(self) -> dict[str, Any]:
+		mpStrVal: dict[str, Any] = {
+			'match': self.id,
+			'home-score': self.scoreHome,
+			'away-score': self.scoreAway,
+		}
+
+		if self.scoreHomeTiebreaker != -1 or self.scoreAwayTiebreaker != -1:
+			mpStrVal['home-tiebreaker'] = self.scoreHomeTiebreaker
+			mpStrVal['away-tiebreaker'] = self.scoreAwayTiebreaker
+
+		if self.fAfterExtraTime:
+			mpStrVal['after-extra-time'] = 'x'
+
+		if self.strTeamHome:
+			mpStrVal['home-team'] = self.strTeamHome
+
+		if self.strTeamAway:
+			mpStrVal['away-team'] = self.strTeamAway
+
+		return mpStrVal
+
+def LScoreuFromPath(path: Path) -> list[SScoreUpdate]:
+	""" score updates from a csv (with a header row) or json (a list of rows, or {"matches": [rows]})
+	file. rows whose match starts with '#' are skipped. """
+
+	lMpStrVal: list[dict[str, Any]]
+
+	match path.suffix.lower():
+		case '.csv':
+			with path.open(newline='', encoding='utf-8-sig') as fileCsv:
+				lMpStrVal = [{str(strKey).strip().lower(): val for strKey, val in mpStrVal.items()} for mpStrVal in csv.DictReader(fileCsv)]
+		case '.json':
+			obj = json.loads(path.read_text(encoding='utf-8'))
+			if isinstance(obj, dict):
+				obj = obj.get('matches', [])
+			lMpStrVal = [{str(strKey).lower(): val for strKey, val in mpStrVal.items()} for mpStrVal in obj]
+		case _:
+			sys.exit(f"error: can't read results from {path} (expected .csv or .json)")
+
+	lScoreu: list[SScoreUpdate] = []
+
+	for mpStrVal in lMpStrVal:
+		strMatch = str(mpStrVal.get('match', '')).strip()
+		if not strMatch or strMatch.startswith('#'):
+			continue
+		lScoreu.append(SScoreUpdate.ScoreuFromMpStrVal(mpStrVal))
+
+	return lScoreu
+
+def LScoreuMerged(lScoreuOld: list[SScoreUpdate], lScoreuNew: list[SScoreUpdate]) -> list[SScoreUpdate]:
+	""" later updates to a match replace earlier ones """
+
+	mpIdScoreu: dict[int, SScoreUpdate] = {scoreu.id: scoreu for scoreu in lScoreuOld}
+	mpIdScoreu.update({scoreu.id: scoreu for scoreu in lScoreuNew})
+
+	return [mpIdScoreu[id] for id in sorted(mpIdScoreu)]
+
+def SaveLScoreu(path: Path, lScoreu: list[SScoreUpdate], strHash: str = '') -> None:
+	""" strHash, if given, names the book the updates were made against """
+
+	obj: dict[str, Any] = {'hash': strHash} if strHash else {}
+	obj['matches'] = [scoreu.MpStrVal() for scoreu in lScoreu]
+
+	path.write_text(json.dumps(obj, ensure_ascii=False, indent='\t') + '\n', encoding='utf-8')
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import argparse
+import csv
+import json
+import numpy as np
+import sys
+
+from enum import IntEnum, auto
+from pathlib import Path
+
+from .database import CDataBase, CTournamentDataBase, CMatch, STAGE
+from .thirds import SThirdSlot, MpStrGroupsStrRoute
+
+# monte carlo tournament outcomes. goals are poisson, with each side's expected goals scaled by the
+# difference in (elo style) ratings. a 400 point edge is roughly 3.3 expected goals to 0.5. knockout
+# draws go to extra time (a third of a match) and then a coin flip for penalties. this is a rough model;
+# it's meant for "who's likely to get where" posters, not betting.
+
+g_ratingDefault = 1500.0
+g_cGoalMean = 1.3
+g_dRatingScale = 1000.0
+
+class SLOTK(IntEnum):
+	""" where a knockout match gets one of its teams from """
+	Place = auto()		# a group place, eg 1A
+	Third = auto()		# one of the third placed teams that goes through, eg 3ABCD
+	Winner = auto()		# W49
+	Loser = auto()		# L61, RU101
+
+def MpStrTeamRatingFromPath(path: Path) -> dict[str, float]:
+	""" team ratings from a csv (team,rating columns) or json ({team: rating}) file """
+
+	match path.suffix.lower():
+		case '.csv':
+			with path.open(newline='', encoding='utf-8-sig') as fileCsv:
+				return {mpStrVal['team'].strip(): float(mpStrVal['rating']) for mpStrVal in csv.DictReader(fileCsv) if mpStrVal.get('team')}
+		case '.json':
+			return {str(strTeam): float(rating) for strTeam, rating in json.loads(path.read_text(encoding='utf-8')).items()}
+		case _:
+			sys.exit(f"error: can't read ratings from {path} (expected .csv or .json)")
+
+class CFlatBracket: # tag = flatb
+	""" a tournament's knockout rounds compiled down to arrays, in an order where every match comes after
+	its feeders. each side of each match says where its team comes from (SLOTK) and which group place,
+	third place slot or earlier match that is. teams and winners already known from results are kept, so
+	simulations only fill in what hasn't happened yet. """
+
+	def __init__(self, tourn: CTournamentDataBase) -> None:
+		self.tourn = tourn
+		self.gtable = tourn.gtable
+
+		self.cPlace: int = max(np.bincount(self.gtable.aIGroupTeam))
+
+		lMatch: list[CMatch] = sorted(tourn.setMatchElimination | {tourn.matchFinal} | ({tourn.matchThird} if tourn.matchThird else set()), key=lambda match: (match.stage, match.id))
+		mpIdIElim: dict[int, int] = {match.id: iElim for iElim, match in enumerate(lMatch)}
+
+		self.lMatch: list[CMatch] = lMatch
+		self.cElim: int = len(lMatch)
+		self.aStage: np.ndarray = np.array([match.stage for match in lMatch], dtype=np.int8)
+		self.iElimFinal: int = mpIdIElim[tourn.matchFinal.id]
+
+		self.aSlotkHome: np.ndarray = np.zeros(self.cElim, dtype=np.int8)
+		self.aSlotkAway: np.ndarray = np.zeros(self.cElim, dtype=np.int8)
+		self.aArgHome: np.ndarray = np.zeros(self.cElim, dtype=np.intp)
+		self.aArgAway: np.ndarray = np.zeros(self.cElim, dtype=np.intp)
+
+		self.lTslot: list[SThirdSlot] = []
+
+		for iElim, match in enumerate(lMatch):
+			for aSlotk, aArg, strSeed, strSeedVs, idFeeder in (
+					(self.aSlotkHome, self.aArgHome, match.strSeedHome, match.strSeedAway, match.idFeederHome),
+					(self.aSlotkAway, self.aArgAway, match.strSeedAway, match.strSeedHome, match.idFeederAway)):
+
+				if idFeeder is not None:
+					aSlotk[iElim] = SLOTK.Winner if strSeed.startswith('W') else SLOTK.Loser
+					aArg[iElim] = mpIdIElim[idFeeder]
+				elif strSeed.startswith('3') and len(strSeed) > 2:
+					aSlotk[iElim] = SLOTK.Third
+					aArg[iElim] = len(self.lTslot)
+					self.lTslot.append(SThirdSlot(strSeedVs, strSeed[1:]))
+				else:
+					aSlotk[iElim] = SLOTK.Place
+					aArg[iElim] = self.gtable.lStrGroup.index(strSeed[1]) * self.cPlace + int(strSeed[0]) - 1
+
+		assert len(self.lTslot) == self.gtable.cThirdQualify
+
+		# what's already happened (-1 is not known yet)
+
+		self.aITeamHomeKnown: np.ndarray = np.array([self.ITeamFromStr(match.strTeamHome) for match in lMatch], dtype=np.intp)
+		self.aITeamAwayKnown: np.ndarray = np.array([self.ITeamFromStr(match.strTeamAway) for match in lMatch], dtype=np.intp)
+		self.aFHomeWonKnown: np.ndarray = np.array([match.FHomeWon() is True for match in lMatch], dtype=bool)
+		self.aFAwayWonKnown: np.ndarray = np.array([match.FHomeWon() is False for match in lMatch], dtype=bool)
+
+		self.fRouteOfficial: bool = True
+		self.aIRowFromMask, self.aIGroupRouteThird = self.RouteThirds()
+
+	def ITeamFromStr(self, strTeam: str) -> int:
+		return self.gtable.mpStrTeamITeam.get(strTeam, -1)
+
+	def RouteThirds(self) -> tuple[np.ndarray, np.ndarray]:
+		""" which group's third placed team goes to which third place slot, for every combination of groups
+		the thirds can come from (see thirds.py). sets fRouteOfficial if that's the competition's table.
+
+		returns a (2^cGroup) array from a bitmask of groups to a row of the (cCombo, cSlot) route table. """
+
+		lStrGroup = self.gtable.lStrGroup
+
+		aIRowFromMask = np.full(1 << len(lStrGroup), -1, dtype=np.intp)
+		lLIGroupRoute: list[list[int]] = []
+
+		if not self.lTslot:
+			return aIRowFromMask, np.zeros((0, 0), dtype=np.intp)
+
+		mpStrGroupsStrRoute, self.fRouteOfficial = MpStrGroupsStrRoute(lStrGroup, self.lTslot)
+
+		for strGroups, strRoute in mpStrGroupsStrRoute.items():
+			aIRowFromMask[sum(1 << lStrGroup.index(strGroup) for strGroup in strGroups)] = len(lLIGroupRoute)
+			lLIGroupRoute.append([lStrGroup.index(strGroup) for strGroup in strRoute])
+
+		return aIRowFromMask, np.array(lLIGroupRoute, dtype=np.intp)
+
+class CSimulation: # tag = sim
+	""" per team counts of reaching each knockout stage (and winning it all) over many simulated tournaments """
+
+	s_cSimBatch = 20000
+
+	def __init__(self, tourn: CTournamentDataBase, mpStrTeamRating: dict[str, float]) -> None:
+		self.tourn = tourn
+		self.flatb = CFlatBracket(tourn)
+		self.gtable = tourn.gtable
+
+		lStrTeamUnrated = [strTeam for strTeam in self.gtable.lStrTeam if strTeam not in mpStrTeamRating]
+		if mpStrTeamRating and lStrTeamUnrated:
+			print(f"warning: no rating for {', '.join(lStrTeamUnrated)}; using {g_ratingDefault:g}")
+
+		self.aRating: np.ndarray = np.array([mpStrTeamRating.get(strTeam, g_ratingDefault) for strTeam in self.gtable.lStrTeam], dtype=np.float64)
+
+		# group matches and what's been played of them
+
+		self.aScoreHomeKnown: np.ndarray = tourn.mstore.aScoreHome[tourn.aIMatchGroup].astype(np.int64)
+		self.aScoreAwayKnown: np.ndarray = tourn.mstore.aScoreAway[tourn.aIMatchGroup].astype(np.int64)
+		self.aFGroupKnown: np.ndarray = (self.aScoreHomeKnown >= 0) & (self.aScoreAwayKnown >= 0)
+
+		# columns of the report: each knockout stage reached, then winning the final
+
+		self.lStage: list[STAGE] = [stage for stage in STAGE if stage not in (STAGE.Group, STAGE.Third) and np.any(self.flatb.aStage == stage)]
+		self.lStrColumn: list[str] = [stage.name for stage in self.lStage] + ['Champion']
+
+		self.cSim: int = 0
+		self.aCReach: np.ndarray = np.zeros((self.gtable.cTeam, len(self.lStrColumn)), dtype=np.int64)
+
+	def ALambda(self, aITeamFor: np.ndarray, aITeamAgainst: np.ndarray) -> np.ndarray:
+		return g_cGoalMean * np.power(10.0, (self.aRating[aITeamFor] - self.aRating[aITeamAgainst]) / g_dRatingScale)
+
+	def Run(self, cSim: int, rng: np.random.Generator) -> None:
+		while cSim > 0:
+			cBatch = min(cSim, self.s_cSimBatch)
+			self.RunBatch(cBatch, rng)
+			cSim -= cBatch
+
+	def RunBatch(self, cBatch: int, rng: np.random.Generator) -> None:
+		gtable = self.gtable
+		flatb = self.flatb
+
+		# group stage: played matches keep their scores
+
+		aScoreHome = rng.poisson(self.ALambda(gtable.aITeamHome, gtable.aITeamAway), size=(cBatch, len(gtable.aITeamHome)))
+		aScoreAway = rng.poisson(self.ALambda(gtable.aITeamAway, gtable.aITeamHome), size=(cBatch, len(gtable.aITeamHome)))
+		aScoreHome = np.where(self.aFGroupKnown, self.aScoreHomeKnown, aScoreHome)
+		aScoreAway = np.where(self.aFGroupKnown, self.aScoreAwayKnown, aScoreAway)
+
+		gstats = gtable.GstatsFromScores(aScoreHome, aScoreAway)
+
+		# (batch, group * place) -> team
+
+		aIBatch = np.repeat(np.arange(cBatch), gtable.cTeam)
+		aITeam = np.tile(np.arange(gtable.cTeam), cBatch)
+		aITeamAtPlace = np.full((cBatch, gtable.cGroup * flatb.cPlace), -1, dtype=np.intp)
+		aITeamAtPlace[aIBatch, gtable.aIGroupTeam[aITeam] * flatb.cPlace + gstats.aIPlace.ravel() - 1] = aITeam
+
+		# which groups' thirds go through, and so which route the third place slots take
+
+		aFThirdQualify = (gstats.aIRankThird >= 1) & (gstats.aIRankThird <= gtable.cThirdQualify)
+		aMask = (aFThirdQualify * (1 << gtable.aIGroupTeam)).sum(axis=1)
+		aIRoute = flatb.aIRowFromMask[aMask] if gtable.cThirdQualify else np.zeros(cBatch, dtype=np.intp)
+
+		# knockouts, a match at a time (but every batch at once)
+
+		aITeamHome = np.zeros((cBatch, flatb.cElim), dtype=np.intp)
+		aITeamAway = np.zeros((cBatch, flatb.cElim), dtype=np.intp)
+		aITeamWinner = np.zeros((cBatch, flatb.cElim), dtype=np.intp)
+		aITeamLoser = np.zeros((cBatch, flatb.cElim), dtype=np.intp)
+
+		def ATeamFromSlot(slotk: int, arg: int) -> np.ndarray:
+			match slotk:
+				case SLOTK.Place:
+					return aITeamAtPlace[:, arg]
+				case SLOTK.Third:
+					aIGroup = flatb.aIGroupRouteThird[aIRoute, arg]
+					return aITeamAtPlace[np.arange(cBatch), aIGroup * flatb.cPlace + 2]
+				case SLOTK.Winner:
+					return aITeamWinner[:, arg]
+				case SLOTK.Loser:
+					return aITeamLoser[:, arg]
+				case _:
+					assert False
+
+		for iElim in range(flatb.cElim):
+			aIHome = ATeamFromSlot(flatb.aSlotkHome[iElim], flatb.aArgHome[iElim])
+			aIAway = ATeamFromSlot(flatb.aSlotkAway[iElim], flatb.aArgAway[iElim])
+
+			if flatb.aITeamHomeKnown[iElim] >= 0:
+				aIHome = np.full(cBatch, flatb.aITeamHomeKnown[iElim])
+			if flatb.aITeamAwayKnown[iElim] >= 0:
+				aIAway = np.full(cBatch, flatb.aITeamAwayKnown[iElim])
+
+			if flatb.aFHomeWonKnown[iElim]:
+				aFHomeWon = np.ones(cBatch, dtype=bool)
+			elif flatb.aFAwayWonKnown[iElim]:
+				aFHomeWon = np.zeros(cBatch, dtype=bool)
+			else:
+				aLambdaHome = self.ALambda(aIHome, aIAway)
+				aLambdaAway = self.ALambda(aIAway, aIHome)
+				aGoalDiff = rng.poisson(aLambdaHome) - rng.poisson(aLambdaAway)
+				aFLevel = aGoalDiff == 0
+				aGoalDiff[aFLevel] = rng.poisson(aLambdaHome[aFLevel] / 3) - rng.poisson(aLambdaAway[aFLevel] / 3)
+				aFLevel = aGoalDiff == 0
+				aGoalDiff[aFLevel] = np.where(rng.random(np.count_nonzero(aFLevel)) < 0.5, 1, -1)
+				aFHomeWon = aGoalDiff > 0
+
+			aITeamHome[:, iElim] = aIHome
+			aITeamAway[:, iElim] = aIAway
+			aITeamWinner[:, iElim] = np.where(aFHomeWon, aIHome, aIAway)
+			aITeamLoser[:, iElim] = np.where(aFHomeWon, aIAway, aIHome)
+
+		for iColumn, stage in enumerate(self.lStage):
+			aFStage = flatb.aStage == stage
+			aITeamStage = np.concatenate((aITeamHome[:, aFStage].ravel(), aITeamAway[:, aFStage].ravel()))
+			self.aCReach[:, iColumn] += np.bincount(aITeamStage, minlength=gtable.cTeam)
+
+		self.aCReach[:, -1] += np.bincount(aITeamWinner[:, flatb.iElimFinal], minlength=gtable.cTeam)
+		self.cSim += cBatch
+
+	def MpStrTeamMpStrColumnProb(self) -> dict[str, dict[str, float]]:
+		""" probabilities, best chance of winning first """
+
+		aProb = self.aCReach / max(self.cSim, 1)
+		lITeam = sorted(range(self.gtable.cTeam), key=lambda iTeam: tuple(-aProb[iTeam, ::-1]) + (iTeam,))
+
+		return {
+			self.gtable.lStrTeam[iTeam]: {strColumn: float(aProb[iTeam, iColumn]) for iColumn, strColumn in enumerate(self.lStrColumn)}
+				for iTeam in lITeam
+		}
+
+	def Print(self) -> None:
+		print(f"{self.tourn.strName}: {self.cSim} simulations")
+
+		if not self.flatb.fRouteOfficial:
+			print(f"warning: no published third place table for {self.tourn.strName}; thirds go to the first slots their seeds allow, so odds past the first knockout round are approximate")
+		print(f"{'team':<8}" + ''.join(f"{strColumn:>10}" for strColumn in self.lStrColumn))
+
+		for strTeam, mpStrColumnProb in self.MpStrTeamMpStrColumnProb().items():
+			print(f"{strTeam:<8}" + ''.join(f"{prob:>10.1%}" for prob in mpStrColumnProb.values()))
+
+	def Save(self, path: Path) -> None:
+		mpStrTeamMpStrColumnProb = self.MpStrTeamMpStrColumnProb()
+
+		match path.suffix.lower():
+			case '.csv':
+				with path.open('w', newline='', encoding='utf-8') as fileCsv:
+					writer = csv.writer(fileCsv)
+					writer.writerow(['team'] + self.lStrColumn)
+					for strTeam, mpStrColumnProb in mpStrTeamMpStrColumnProb.items():
+						writer.writerow([strTeam] + [f"{prob:.4f}" for prob in mpStrColumnProb.values()])
+			case '.json':
+				path.write_text(
+					json.dumps({'tournament': self.tourn.strName, 'simulations': self.cSim, 'teams': mpStrTeamMpStrColumnProb}, indent='\t') + '\n',
+					encoding='utf-8')
+			case _:
+				sys.exit(f"error: can't write probabilities to {path} (expected .csv or .json)")
+
+def Main() -> None:
+	parser = argparse.ArgumentParser(description="Simulate a tournament's remaining matches and report how far each team gets.")
+	parser.add_argument('tournament', nargs='?', default='latest', help="Tournament name (default latest)")
+	parser.add_argument('-r', '--ratings', type=Path, help="Team ratings (.csv with team,rating columns, or .json); unrated teams get 1500")
+	parser.add_argument('-n', '--count', type=int, default=100000, help="Simulations to run (default 100000)")
+	parser.add_argument('-s', '--seed', type=int, help="Random seed, for repeatable runs")
+	parser.add_argument('-o', '--output', type=Path, help="Also write probabilities to a .csv or .json file")
+
+	args = parser.parse_args()
+
+	strName: str = args.tournament
+	if strName == 'latest':
+		strName = CDataBase.LStrNameTournament()[-1]
+
+	mpStrTeamRating: dict[str, float] = MpStrTeamRatingFromPath(args.ratings) if args.ratings else {}
+
+	sim = CSimulation(CTournamentDataBase.TournFromStrName(strName), mpStrTeamRating)
+	sim.Run(args.count, np.random.default_rng(args.seed))
+	sim.Print()
+
+	if args.output:
+		sim.Save(args.output)
+
+if __name__ == '__main__':
+	Main()
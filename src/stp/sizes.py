@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import re
+
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+class SSizeReport(NamedTuple): # tag = sizer
+	""" where a pdf's bytes go. parts are embedded fonts (one per ttf), images (the qr code), the icc
+	profile and content streams (pages and artwork forms); everything else (object dictionaries, xref,
+	metadata) is 'other'. streams count at their stored (compressed) size. """
+
+	cbTotal: int
+	mpStrPartCb: dict[str, int]
+
+	def LTuStrPartCb(self) -> list[tuple[str, int]]:
+		""" biggest first """
+		return sorted(self.mpStrPartCb.items(), key=lambda tu: -tu[1])
+
+	def StrReport(self, cPart: int = 4) -> str:
+		lStrPart = [f"{strPart} {StrKb(cb)}" for strPart, cb in self.LTuStrPartCb()[:cPart]]
+		return f"{StrKb(self.cbTotal)} ({', '.join(lStrPart)})"
+
+def StrKb(cb: int) -> str:
+	return f"{(cb + 1023) // 1024} KB"
+
+def SizerFromPath(path: Path) -> SSizeReport:
+	reader = PdfReader(path)
+	setIdSeen: set[int] = set()
+	mpStrPartCb: dict[str, int] = {}
+
+	def ObjVisit(val: Any) -> Any:
+		""" the object val refers to, or None if it's been counted already """
+
+		if isinstance(val, IndirectObject):
+			if val.idnum in setIdSeen:
+				return None
+			setIdSeen.add(val.idnum)
+			return val.get_object()
+		return val
+
+	def CountPart(val: Any, strPart: str) -> None:
+		""" val and everything it references go to strPart """
+
+		obj = ObjVisit(val)
+
+		if isinstance(obj, StreamObject):
+			mpStrPartCb[strPart] = mpStrPartCb.get(strPart, 0) + len(obj._data)	# type: ignore[attr-defined]
+
+		if isinstance(obj, DictionaryObject):
+			for valChild in obj.values():
+				CountPart(valChild, strPart)
+		elif isinstance(obj, ArrayObject):
+			for valChild in obj:
+				CountPart(valChild, strPart)
+
+	def CountResources(val: Any) -> None:
+		resources = ObjVisit(val)
+		if not isinstance(resources, DictionaryObject):
+			return
+
+		for valFont in (resources.get('/Font') or {}).values():
+			fontDict = valFont.get_object()
+			strFont = re.sub(r'^[A-Z]{6}\+', '', str(fontDict.get('/BaseFont', '/?'))[1:])
+			CountPart(valFont, f"font {strFont}")
+
+		for valCs in (resources.get('/ColorSpace') or {}).values():
+			CountPart(valCs, 'icc profile')
+
+		for valXobject in (resources.get('/XObject') or {}).values():
+			xobject = valXobject.get_object()
+			if xobject.get('/Subtype') == '/Form':
+				if ObjVisit(valXobject) is None:
+					continue
+				mpStrPartCb['content'] = mpStrPartCb.get('content', 0) + len(xobject._data)
+				CountResources(xobject.raw_get('/Resources') if '/Resources' in xobject else None)
+			else:
+				CountPart(valXobject, 'images')
+
+	# the output intent carries the icc profile
+
+	for valIntent in reader.trailer['/Root'].get('/OutputIntents') or []:
+		CountPart(valIntent, 'icc profile')
+
+	for page in reader.pages:
+		CountPart(page.raw_get('/Contents') if '/Contents' in page else None, 'content')
+		CountResources(page.raw_get('/Resources') if '/Resources' in page else None)
+
+	cbTotal = path.stat().st_size
+	mpStrPartCb['other'] = max(0, cbTotal - sum(mpStrPartCb.values()))
+
+	return SSizeReport(cbTotal, mpStrPartCb)
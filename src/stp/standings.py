@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import numpy as np
+
+from typing import NamedTuple, Optional
+
+# group tables are computed for a batch of "worlds" at once: scores come in as (cBatch, cMatch) arrays of
+# group stage results (-1 for not played yet) and every team in every group in every world is ranked by
+# the same handful of matrix products and sorts. the posters only ever need one world; simulations need lots.
+
+class SStanding(NamedTuple): # tag = standing
+	strTeam: str
+	strGroup: str
+	iPlace: int			# 1 based place in the group, by the results so far
+	cPlayed: int
+	cWin: int
+	cDraw: int
+	cLoss: int
+	cGoalFor: int
+	cGoalAgainst: int
+	cPoint: int
+	fTied: bool			# iPlace came down to seed order
+
+class SGroupStats(NamedTuple): # tag = gstats
+	""" (cBatch, cTeam) arrays """
+
+	aCPlayed: np.ndarray
+	aCWin: np.ndarray
+	aCDraw: np.ndarray
+	aCLoss: np.ndarray
+	aCGoalFor: np.ndarray
+	aCGoalAgainst: np.ndarray
+	aCPoint: np.ndarray
+	aIPlace: np.ndarray		# 1 based
+	aIRankThird: np.ndarray	# 1 based rank among third placed teams (0 for teams not in third)
+	aFTied: np.ndarray		# level with another team in the group on every criterion but seed order
+
+class CGroupTable: # tag = gtable
+	""" which teams play which group matches, set up once per tournament. teams are indexed in seed order
+	(A1, A2, ..., B1, ...), which is also the last resort tiebreaker (standing in for fair play points and
+	drawing lots, which we don't know).
+
+	tiebreakers are points, goal difference, goals scored, then points, goal difference and goals scored in
+	the matches between the teams still tied. with fHeadToHeadFirst (euros, and world cups from 2026), the
+	head to head criteria come straight after points. """
+
+	def __init__(
+			self,
+			mpStrSeedStrTeam: dict[str, str],
+			lStrSeedHome: list[str],
+			lStrSeedAway: list[str],
+			lStrSeedElimFirst: list[str],
+			fHeadToHeadFirst: bool = False) -> None:
+
+		lStrSeed = sorted(mpStrSeedStrTeam)
+		mpStrSeedITeam: dict[str, int] = {strSeed: iTeam for iTeam, strSeed in enumerate(lStrSeed)}
+
+		self.lStrTeam: list[str] = [mpStrSeedStrTeam[strSeed] for strSeed in lStrSeed]
+		self.mpStrTeamITeam: dict[str, int] = {strTeam: iTeam for iTeam, strTeam in enumerate(self.lStrTeam)}
+		self.lStrGroup: list[str] = sorted({strSeed[:1] for strSeed in lStrSeed})
+		self.aIGroupTeam: np.ndarray = np.array([self.lStrGroup.index(strSeed[:1]) for strSeed in lStrSeed], dtype=np.intp)
+		self.cTeam: int = len(self.lStrTeam)
+		self.cGroup: int = len(self.lStrGroup)
+
+		self.aITeamHome: np.ndarray = np.array([mpStrSeedITeam[strSeed] for strSeed in lStrSeedHome], dtype=np.intp)
+		self.aITeamAway: np.ndarray = np.array([mpStrSeedITeam[strSeed] for strSeed in lStrSeedAway], dtype=np.intp)
+		self.aIGroupMatch: np.ndarray = self.aIGroupTeam[self.aITeamHome]
+
+		assert np.all(self.aIGroupMatch == self.aIGroupTeam[self.aITeamAway])
+
+		# groups are all the same size, so the tables can be ranked as (group, place) rows
+
+		self.cPlace: int = self.cTeam // self.cGroup
+		self.aIPlaceSeed: np.ndarray = np.arange(self.cTeam) % self.cPlace
+
+		assert np.all(np.bincount(self.aIGroupTeam) == self.cPlace)
+
+		# (cMatch, cTeam) incidence of home and away teams
+
+		self.aIncHome: np.ndarray = np.zeros((len(self.aITeamHome), self.cTeam), dtype=np.float64)
+		self.aIncAway: np.ndarray = np.zeros((len(self.aITeamAway), self.cTeam), dtype=np.float64)
+		self.aIncHome[np.arange(len(self.aITeamHome)), self.aITeamHome] = 1
+		self.aIncAway[np.arange(len(self.aITeamAway)), self.aITeamAway] = 1
+
+		# third placed teams that go through (eg '3ABCD' seeds)
+
+		self.cThirdQualify: int = sum(1 for strSeed in lStrSeedElimFirst if strSeed.startswith('3'))
+
+		self.fHeadToHeadFirst: bool = fHeadToHeadFirst
+
+	def GstatsFromScores(self, aScoreHome: np.ndarray, aScoreAway: np.ndarray) -> SGroupStats:
+		""" rank every group in every batch. scores are (cBatch, cMatch) (or (cMatch,) for a single batch),
+		in the same match order the table was built with. """
+
+		aScoreHome = np.atleast_2d(aScoreHome).astype(np.int64)
+		aScoreAway = np.atleast_2d(aScoreAway).astype(np.int64)
+		cBatch = aScoreHome.shape[0]
+
+		aFPlayed = (aScoreHome >= 0) & (aScoreAway >= 0)
+		aGoalHome = np.where(aFPlayed, aScoreHome, 0)
+		aGoalAway = np.where(aFPlayed, aScoreAway, 0)
+		aFHomeWin = aFPlayed & (aGoalHome > aGoalAway)
+		aFAwayWin = aFPlayed & (aGoalHome < aGoalAway)
+		aFDraw = aFPlayed & (aGoalHome == aGoalAway)
+
+		# per match (batch, match) values summed into per team (batch, team) totals by multiplying with
+		# the match/team incidence matrices
+
+		def ACount(aHome: np.ndarray, aAway: np.ndarray, aFMatch: Optional[np.ndarray] = None) -> np.ndarray:
+			if aFMatch is not None:
+				aHome = aHome * aFMatch
+				aAway = aAway * aFMatch
+			aCount = aHome.astype(np.float64) @ self.aIncHome + aAway.astype(np.float64) @ self.aIncAway
+			return aCount.astype(np.int64)
+
+		aPointHome = 3 * aFHomeWin + aFDraw
+		aPointAway = 3 * aFAwayWin + aFDraw
+
+		aCPlayed = ACount(aFPlayed, aFPlayed)
+		aCWin = ACount(aFHomeWin, aFAwayWin)
+		aCDraw = ACount(aFDraw, aFDraw)
+		aCLoss = ACount(aFAwayWin, aFHomeWin)
+		aCGoalFor = ACount(aGoalHome, aGoalAway)
+		aCGoalAgainst = ACount(aGoalAway, aGoalHome)
+		aCPoint = ACount(aPointHome, aPointAway)
+		aCGoalDiff = aCGoalFor - aCGoalAgainst
+
+		# teams still level on the overall criteria are in a block. head to head only counts matches
+		# between two teams in the same block (matches never cross groups or batches, so comparing
+		# the packed criteria is enough to tell).
+
+		if self.fHeadToHeadFirst:
+			aKeyOverall = self.AKeyPacked(aCPoint)
+		else:
+			aKeyOverall = self.AKeyPacked(aCPoint, aCGoalDiff, aCGoalFor)
+
+		aFHeadToHead = np.take_along_axis(aKeyOverall, np.broadcast_to(self.aITeamHome, aScoreHome.shape), axis=1) == \
+						np.take_along_axis(aKeyOverall, np.broadcast_to(self.aITeamAway, aScoreAway.shape), axis=1)
+
+		aCPointH2h = ACount(aPointHome, aPointAway, aFHeadToHead)
+		aCGoalForH2h = ACount(aGoalHome, aGoalAway, aFHeadToHead)
+		aCGoalDiffH2h = aCGoalForH2h - ACount(aGoalAway, aGoalHome, aFHeadToHead)
+
+		# seed order is the final tiebreaker, so every key in a group is distinct
+
+		aSeedOrder = np.broadcast_to(self.cPlace - 1 - self.aIPlaceSeed, aCPoint.shape)
+
+		if self.fHeadToHeadFirst:
+			aKeyTied = self.AKeyPacked(aCPoint, aCPointH2h, aCGoalDiffH2h, aCGoalForH2h, aCGoalDiff, aCGoalFor)
+		else:
+			aKeyTied = self.AKeyPacked(aCPoint, aCGoalDiff, aCGoalFor, aCPointH2h, aCGoalDiffH2h, aCGoalForH2h)
+
+		aKey = (aKeyTied << 8) | aSeedOrder
+
+		# teams of a group are adjacent in seed order, so each group is a row of cPlace
+
+		aKeyGroup = aKey.reshape(cBatch * self.cGroup, self.cPlace)
+		aIPlace = np.empty_like(aKeyGroup)
+		np.put_along_axis(aIPlace, np.argsort(-aKeyGroup, axis=1), np.arange(1, self.cPlace + 1), axis=1)
+		aIPlace = aIPlace.reshape(cBatch, self.cTeam)
+
+		# places that came down to seed order (ie fair play points or lots, which we don't know)
+
+		aKeyTiedGroup = aKeyTied.reshape(cBatch * self.cGroup, self.cPlace)
+		aFTied = ((aKeyTiedGroup[:, :, None] == aKeyTiedGroup[:, None, :]).sum(axis=2) > 1).reshape(cBatch, self.cTeam)
+
+		# third placed teams, ranked across groups within each batch (cBatch, cGroup)
+
+		aIRankThird = np.zeros_like(aIPlace)
+
+		if self.cPlace < 3:
+			return SGroupStats(aCPlayed, aCWin, aCDraw, aCLoss, aCGoalFor, aCGoalAgainst, aCPoint, aIPlace, aIRankThird, aFTied)
+
+		aITeamThird = np.argmax(aIPlace.reshape(cBatch, self.cGroup, self.cPlace) == 3, axis=2) + np.arange(self.cGroup) * self.cPlace
+
+		aKeyThird = self.AKeyPacked(
+						np.take_along_axis(aCPoint, aITeamThird, axis=1),
+						np.take_along_axis(aCGoalDiff, aITeamThird, axis=1),
+						np.take_along_axis(aCGoalFor, aITeamThird, axis=1),
+						np.broadcast_to(self.cGroup - 1 - np.arange(self.cGroup), aITeamThird.shape))
+
+		aIRankThirdGroup = np.empty_like(aKeyThird)
+		np.put_along_axis(aIRankThirdGroup, np.argsort(-aKeyThird, axis=1), np.arange(1, self.cGroup + 1), axis=1)
+
+		np.put_along_axis(aIRankThird, aITeamThird, aIRankThirdGroup, axis=1)
+
+		return SGroupStats(aCPlayed, aCWin, aCDraw, aCLoss, aCGoalFor, aCGoalAgainst, aCPoint, aIPlace, aIRankThird, aFTied)
+
+	@staticmethod
+	def AKeyPacked(*lA: np.ndarray) -> np.ndarray:
+		""" pack criteria (most important first, bigger is better) into one int64 that sorts the same way.
+		each gets 8 bits, clamped; nothing in a group stage gets near that. """
+
+		aKey = np.zeros(np.shape(lA[0]), dtype=np.int64)
+
+		for a in lA:
+			aKey = (aKey << 8) | np.clip(np.asarray(a, dtype=np.int64) + 128, 0, 255)
+
+		return aKey
+
+	def AFGroupComplete(self, aScoreHome: np.ndarray, aScoreAway: np.ndarray) -> np.ndarray:
+		""" (cBatch, cGroup) flags for groups with every match played """
+
+		aScoreHome = np.atleast_2d(aScoreHome)
+		aScoreAway = np.atleast_2d(aScoreAway)
+		aFUnplayed = (aScoreHome < 0) | (aScoreAway < 0)
+
+		aCUnplayed = np.zeros((aScoreHome.shape[0], self.cGroup), dtype=np.int64)
+		for iGroup in range(self.cGroup):
+			aCUnplayed[:, iGroup] = aFUnplayed[:, self.aIGroupMatch == iGroup].sum(axis=1)
+
+		return aCUnplayed == 0
+
+class CStandings: # tag = standings
+	""" group tables for one set of results """
+
+	def __init__(self, gtable: CGroupTable, aScoreHome: np.ndarray, aScoreAway: np.ndarray) -> None:
+		self.gtable = gtable
+
+		gstats = gtable.GstatsFromScores(aScoreHome, aScoreAway)
+		aFGroupComplete = gtable.AFGroupComplete(aScoreHome, aScoreAway)[0]
+
+		self.mpStrTeamStanding: dict[str, SStanding] = {}
+
+		for iTeam, strTeam in enumerate(gtable.lStrTeam):
+			self.mpStrTeamStanding[strTeam] = SStanding(
+												strTeam,
+												gtable.lStrGroup[gtable.aIGroupTeam[iTeam]],
+												int(gstats.aIPlace[0, iTeam]),
+												int(gstats.aCPlayed[0, iTeam]),
+												int(gstats.aCWin[0, iTeam]),
+												int(gstats.aCDraw[0, iTeam]),
+												int(gstats.aCLoss[0, iTeam]),
+												int(gstats.aCGoalFor[0, iTeam]),
+												int(gstats.aCGoalAgainst[0, iTeam]),
+												int(gstats.aCPoint[0, iTeam]),
+												bool(gstats.aFTied[0, iTeam]))
+
+		self.setStrGroupComplete: set[str] = {strGroup for strGroup, fComplete in zip(gtable.lStrGroup, aFGroupComplete) if fComplete}
+		self.fComplete: bool = len(self.setStrGroupComplete) == gtable.cGroup
+
+		aIRankThird = gstats.aIRankThird[0]
+		lITeamThird = sorted(np.flatnonzero(aIRankThird).tolist(), key=lambda iTeam: aIRankThird[iTeam])
+		self.lStrTeamThird: list[str] = [gtable.lStrTeam[iTeam] for iTeam in lITeamThird]
+
+	def LStandingGroup(self, strGroup: str) -> list[SStanding]:
+		""" a group's table, in place order """
+		return sorted(
+				(standing for standing in self.mpStrTeamStanding.values() if standing.strGroup == strGroup),
+				key=lambda standing: standing.iPlace)
+
+	def StrPlace(self, strTeam: str) -> str:
+		""" a team's final place in its group, or '' while the group is still being played or if the
+		place came down to criteria we don't have (fair play, lots) """
+
+		standing = self.mpStrTeamStanding.get(strTeam)
+		if standing is None or standing.strGroup not in self.setStrGroupComplete or standing.fTied:
+			return ''
+
+		return str(standing.iPlace)
+
+	def StrTeamFromStrSeed(self, strSeed: str) -> str:
+		""" the team a finished group sends to a knockout seed like '1A' or '2B' (unless its place came down
+		to seed order). third place seeds
+		(eg '3ABCD') depend on which thirds go through, so they aren't resolved here. """
+
+		if len(strSeed) != 2 or not strSeed[0].isdigit() or strSeed[1] not in self.setStrGroupComplete:
+			return ''
+
+		iPlace = int(strSeed[0])
+		for standing in self.LStandingGroup(strSeed[1]):
+			if standing.iPlace == iPlace:
+				return '' if standing.fTied else standing.strTeam
+
+		return ''
+
+	def SetStrTeamThirdQualified(self) -> set[str]:
+		""" third placed teams that go through. empty until every group is done. """
+
+		if not self.fComplete:
+			return set()
+
+		return set(self.lStrTeamThird[:self.gtable.cThirdQualify])
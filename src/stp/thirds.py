@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import itertools
+
+from typing import NamedTuple, Optional
+
+# when the best third placed teams go through to the knockouts, which group winner each of them plays
+# depends on which groups they came from. competitions publish a table with a row for every combination
+# of groups; brackets we don't have a table for fall back to the first assignment that fits the seeds.
+
+class SThirdSlot(NamedTuple): # tag = tslot
+	""" a knockout side that takes a third placed team """
+
+	strSeedVs: str		# the group winner it plays, eg 1A
+	strGroups: str		# groups its team can come from, eg CEFHI
+
+# tables are keyed by their slots. each row is the (sorted) groups the qualifying thirds come from, then
+# the group whose third goes to each slot, in slot order.
+
+g_mpTuTslotStrTable: dict[tuple[SThirdSlot, ...], str] = {
+
+	# uefa euro, 24 teams (euro 2024 regulations)
+
+	(
+		SThirdSlot('1B', 'ADEF'),
+		SThirdSlot('1C', 'DEF'),
+		SThirdSlot('1E', 'ABCD'),
+		SThirdSlot('1F', 'ABC'),
+	): """
+ABCD ADBC
+ABCE AEBC
+ABCF AFBC
+ABDE DEAB
+ABDF DFAB
+ABEF EFBA
+ACDE EDCA
+ACDF FDCA
+ACEF EFCA
+ADEF EFDA
+BCDE EDBC
+BCDF FDCB
+BCEF FECB
+BDEF FEDB
+CDEF FEDC
+""",
+
+	# fifa world cup, 48 teams (fifa, 23.06.2025)
+
+	(
+		SThirdSlot('1A', 'CEFHI'),
+		SThirdSlot('1B', 'EFGIJ'),
+		SThirdSlot('1D', 'BEFIJ'),
+		SThirdSlot('1E', 'ABCDF'),
+		SThirdSlot('1G', 'AEHIJ'),
+		SThirdSlot('1I', 'CDFGH'),
+		SThirdSlot('1K', 'DEIJL'),
+		SThirdSlot('1L', 'EHIJK'),
+	): """
+ABCDEFGH HGBCAFDE
+ABCDEFGI CGBDAFEI
+ABCDEFGJ CGBDAFEJ
+ABCDEFGK CGBDAFEK
+ABCDEFGL CGBDAFLE
+ABCDEFHI HEBCAFDI
+ABCDEFHJ HJBCAFDE
+ABCDEFHK HEBCAFDK
+ABCDEFHL HFBCADLE
+ABCDEFIJ CJBDAFEI
+ABCDEFIK CEBDAFIK
+ABCDEFIL CEBDAFLI
+ABCDEFJK CJBDAFEK
+ABCDEFJL CJBDAFLE
+ABCDEFKL CEBDAFLK
+ABCDEGHI HGBCADEI
+ABCDEGHJ HGBCADEJ
+ABCDEGHK HGBCADEK
+ABCDEGHL HGBCADLE
+ABCDEGIJ EGBCADIJ
+ABCDEGIK EGBCADIK
+ABCDEGIL EGBCADLI
+ABCDEGJK EGBCADJK
+ABCDEGJL EGBCADLJ
+ABCDEGKL EGBCADLK
+ABCDEHIJ HJBCADEI
+ABCDEHIK HEBCADIK
+ABCDEHIL HEBCADLI
+ABCDEHJK HJBCADEK
+ABCDEHJL HJBCADLE
+ABCDEHKL HEBCADLK
+ABCDEIJK EJBCADIK
+ABCDEIJL EJBCADLI
+ABCDEIKL EIBCADLK
+ABCDEJKL EJBCADLK
+ABCDFGHI HGBCAFDI
+ABCDFGHJ HGBCAFDJ
+ABCDFGHK HGBCAFDK
+ABCDFGHL CGBDAFLH
+ABCDFGIJ CGBDAFIJ
+ABCDFGIK CGBDAFIK
+ABCDFGIL CGBDAFLI
+ABCDFGJK CGBDAFJK
+ABCDFGJL CGBDAFLJ
+ABCDFGKL CGBDAFLK
+ABCDFHIJ HJBCAFDI
+ABCDFHIK HFBCADIK
+ABCDFHIL HFBCADLI
+ABCDFHJK HJBCAFDK
+ABCDFHJL CJBDAFLH
+ABCDFHKL HFBCADLK
+ABCDFIJK CJBDAFIK
+ABCDFIJL CJBDAFLI
+ABCDFIKL CIBDAFLK
+ABCDFJKL CJBDAFLK
+ABCDGHIJ HGBCADIJ
+ABCDGHIK HGBCADIK
+ABCDGHIL HGBCADLI
+ABCDGHJK HGBCADJK
+ABCDGHJL HGBCADLJ
+ABCDGHKL HGBCADLK
+ABCDGIJK CJBDAGIK
+ABCDGIJL CJBDAGLI
+ABCDGIKL IGBCADLK
+ABCDGJKL CJBDAGLK
+ABCDHIJK HJBCADIK
+ABCDHIJL HJBCADLI
+ABCDHIKL HIBCADLK
+ABCDHJKL HJBCADLK
+ABCDIJKL IJBCADLK
+ABCEFGHI HGBCAFEI
+ABCEFGHJ HGBCAFEJ
+ABCEFGHK HGBCAFEK
+ABCEFGHL HGBCAFLE
+ABCEFGIJ EGBCAFIJ
+ABCEFGIK EGBCAFIK
+ABCEFGIL EGBCAFLI
+ABCEFGJK EGBCAFJK
+ABCEFGJL EGBCAFLJ
+ABCEFGKL EGBCAFLK
+ABCEFHIJ HJBCAFEI
+ABCEFHIK HEBCAFIK
+ABCEFHIL HEBCAFLI
+ABCEFHJK HJBCAFEK
+ABCEFHJL HJBCAFLE
+ABCEFHKL HEBCAFLK
+ABCEFIJK EJBCAFIK
+ABCEFIJL EJBCAFLI
+ABCEFIKL EIBCAFLK
+ABCEFJKL EJBCAFLK
+ABCEGHIJ HJBCAGEI
+ABCEGHIK EGBCAHIK
+ABCEGHIL EGBCAHLI
+ABCEGHJK HJBCAGEK
+ABCEGHJL HJBCAGLE
+ABCEGHKL EGBCAHLK
+ABCEGIJK EJBCAGIK
+ABCEGIJL EJBCAGLI
+ABCEGIKL EGBAICLK
+ABCEGJKL EJBCAGLK
+ABCEHIJK EJBCAHIK
+ABCEHIJL EJBCAHLI
+ABCEHIKL EIBCAHLK
+ABCEHJKL EJBCAHLK
+ABCEIJKL EJBAICLK
+ABCFGHIJ HGBCAFIJ
+ABCFGHIK HGBCAFIK
+ABCFGHIL HGBCAFLI
+ABCFGHJK HGBCAFJK
+ABCFGHJL HGBCAFLJ
+ABCFGHKL HGBCAFLK
+ABCFGIJK CJBFAGIK
+ABCFGIJL CJBFAGLI
+ABCFGIKL IGBCAFLK
+ABCFGJKL CJBFAGLK
+ABCFHIJK HJBCAFIK
+ABCFHIJL HJBCAFLI
+ABCFHIKL HIBCAFLK
+ABCFHJKL HJBCAFLK
+ABCFIJKL IJBCAFLK
+ABCGHIJK HJBCAGIK
+ABCGHIJL HJBCAGLI
+ABCGHIKL IGBCAHLK
+ABCGHJKL HJBCAGLK
+ABCGIJKL IJBCAGLK
+ABCHIJKL IJBCAHLK
+ABDEFGHI HGBDAFEI
+ABDEFGHJ HGBDAFEJ
+ABDEFGHK HGBDAFEK
+ABDEFGHL HGBDAFLE
+ABDEFGIJ EGBDAFIJ
+ABDEFGIK EGBDAFIK
+ABDEFGIL EGBDAFLI
+ABDEFGJK EGBDAFJK
+ABDEFGJL EGBDAFLJ
+ABDEFGKL EGBDAFLK
+ABDEFHIJ HJBDAFEI
+ABDEFHIK HEBDAFIK
+ABDEFHIL HEBDAFLI
+ABDEFHJK HJBDAFEK
+ABDEFHJL HJBDAFLE
+ABDEFHKL HEBDAFLK
+ABDEFIJK EJBDAFIK
+ABDEFIJL EJBDAFLI
+ABDEFIKL EIBDAFLK
+ABDEFJKL EJBDAFLK
+ABDEGHIJ HJBDAGEI
+ABDEGHIK EGBDAHIK
+ABDEGHIL EGBDAHLI
+ABDEGHJK HJBDAGEK
+ABDEGHJL HJBDAGLE
+ABDEGHKL EGBDAHLK
+ABDEGIJK EJBDAGIK
+ABDEGIJL EJBDAGLI
+ABDEGIKL EGBAIDLK
+ABDEGJKL EJBDAGLK
+ABDEHIJK EJBDAHIK
+ABDEHIJL EJBDAHLI
+ABDEHIKL EIBDAHLK
+ABDEHJKL EJBDAHLK
+ABDEIJKL EJBAIDLK
+ABDFGHIJ HGBDAFIJ
+ABDFGHIK HGBDAFIK
+ABDFGHIL HGBDAFLI
+ABDFGHJK HGBDAFJK
+ABDFGHJL HGBDAFLJ
+ABDFGHKL HGBDAFLK
+ABDFGIJK FJBDAGIK
+ABDFGIJL FJBDAGLI
+ABDFGIKL IGBDAFLK
+ABDFGJKL FJBDAGLK
+ABDFHIJK HJBDAFIK
+ABDFHIJL HJBDAFLI
+ABDFHIKL HIBDAFLK
+ABDFHJKL HJBDAFLK
+ABDFIJKL IJBDAFLK
+ABDGHIJK HJBDAGIK
+ABDGHIJL HJBDAGLI
+ABDGHIKL IGBDAHLK
+ABDGHJKL HJBDAGLK
+ABDGIJKL IJBDAGLK
+ABDHIJKL IJBDAHLK
+ABEFGHIJ HJBFAGEI
+ABEFGHIK EGBFAHIK
+ABEFGHIL EGBFAHLI
+ABEFGHJK HJBFAGEK
+ABEFGHJL HJBFAGLE
+ABEFGHKL EGBFAHLK
+ABEFGIJK EJBFAGIK
+ABEFGIJL EJBFAGLI
+ABEFGIKL EGBAIFLK
+ABEFGJKL EJBFAGLK
+ABEFHIJK EJBFAHIK
+ABEFHIJL EJBFAHLI
+ABEFHIKL EIBFAHLK
+ABEFHJKL EJBFAHLK
+ABEFIJKL EJBAIFLK
+ABEGHIJK EJBAHGIK
+ABEGHIJL EJBAHGLI
+ABEGHIKL EGBAIHLK
+ABEGHJKL EJBAHGLK
+ABEGIJKL EJBAIGLK
+ABEHIJKL EJBAIHLK
+ABFGHIJK HJBFAGIK
+ABFGHIJL HJBFAGLI
+ABFGHIKL HGBAIFLK
+ABFGHJKL HJBFAGLK
+ABFGIJKL IJBFAGLK
+ABFHIJKL HJBAIFLK
+ABGHIJKL HJBAIGLK
+ACDEFGHI HGECAFDI
+ACDEFGHJ HGJCAFDE
+ACDEFGHK HGECAFDK
+ACDEFGHL HGFCADLE
+ACDEFGIJ CGJDAFEI
+ACDEFGIK CGEDAFIK
+ACDEFGIL CGEDAFLI
+ACDEFGJK CGJDAFEK
+ACDEFGJL CGJDAFLE
+ACDEFGKL CGEDAFLK
+ACDEFHIJ HJECAFDI
+ACDEFHIK HEFCADIK
+ACDEFHIL HEFCADLI
+ACDEFHJK HJECAFDK
+ACDEFHJL HJFCADLE
+ACDEFHKL HEFCADLK
+ACDEFIJK CJEDAFIK
+ACDEFIJL CJEDAFLI
+ACDEFIKL CEIDAFLK
+ACDEFJKL CJEDAFLK
+ACDEGHIJ HGJCADEI
+ACDEGHIK HGECADIK
+ACDEGHIL HGECADLI
+ACDEGHJK HGJCADEK
+ACDEGHJL HGJCADLE
+ACDEGHKL HGECADLK
+ACDEGIJK EGJCADIK
+ACDEGIJL EGJCADLI
+ACDEGIKL EGICADLK
+ACDEGJKL EGJCADLK
+ACDEHIJK HJECADIK
+ACDEHIJL HJECADLI
+ACDEHIKL HEICADLK
+ACDEHJKL HJECADLK
+ACDEIJKL EJICADLK
+ACDFGHIJ HGJCAFDI
+ACDFGHIK HGFCADIK
+ACDFGHIL HGFCADLI
+ACDFGHJK HGJCAFDK
+ACDFGHJL CGJDAFLH
+ACDFGHKL HGFCADLK
+ACDFGIJK CGJDAFIK
+ACDFGIJL CGJDAFLI
+ACDFGIKL CGIDAFLK
+ACDFGJKL CGJDAFLK
+ACDFHIJK HJFCADIK
+ACDFHIJL HJFCADLI
+ACDFHIKL HFICADLK
+ACDFHJKL HJFCADLK
+ACDFIJKL CJIDAFLK
+ACDGHIJK HGJCADIK
+ACDGHIJL HGJCADLI
+ACDGHIKL HGICADLK
+ACDGHJKL HGJCADLK
+ACDGIJKL IGJCADLK
+ACDHIJKL HJICADLK
+ACEFGHIJ HGJCAFEI
+ACEFGHIK HGECAFIK
+ACEFGHIL HGECAFLI
+ACEFGHJK HGJCAFEK
+ACEFGHJL HGJCAFLE
+ACEFGHKL HGECAFLK
+ACEFGIJK EGJCAFIK
+ACEFGIJL EGJCAFLI
+ACEFGIKL EGICAFLK
+ACEFGJKL EGJCAFLK
+ACEFHIJK HJECAFIK
+ACEFHIJL HJECAFLI
+ACEFHIKL HEICAFLK
+ACEFHJKL HJECAFLK
+ACEFIJKL EJICAFLK
+ACEGHIJK EGJCAHIK
+ACEGHIJL EGJCAHLI
+ACEGHIKL EGICAHLK
+ACEGHJKL EGJCAHLK
+ACEGIJKL EJICAGLK
+ACEHIJKL EJICAHLK
+ACFGHIJK HGJCAFIK
+ACFGHIJL HGJCAFLI
+ACFGHIKL HGICAFLK
+ACFGHJKL HGJCAFLK
+ACFGIJKL IGJCAFLK
+ACFHIJKL HJICAFLK
+ACGHIJKL HJICAGLK
+ADEFGHIJ HGJDAFEI
+ADEFGHIK HGEDAFIK
+ADEFGHIL HGEDAFLI
+ADEFGHJK HGJDAFEK
+ADEFGHJL HGJDAFLE
+ADEFGHKL HGEDAFLK
+ADEFGIJK EGJDAFIK
+ADEFGIJL EGJDAFLI
+ADEFGIKL EGIDAFLK
+ADEFGJKL EGJDAFLK
+ADEFHIJK HJEDAFIK
+ADEFHIJL HJEDAFLI
+ADEFHIKL HEIDAFLK
+ADEFHJKL HJEDAFLK
+ADEFIJKL EJIDAFLK
+ADEGHIJK EGJDAHIK
+ADEGHIJL EGJDAHLI
+ADEGHIKL EGIDAHLK
+ADEGHJKL EGJDAHLK
+ADEGIJKL EJIDAGLK
+ADEHIJKL EJIDAHLK
+ADFGHIJK HGJDAFIK
+ADFGHIJL HGJDAFLI
+ADFGHIKL HGIDAFLK
+ADFGHJKL HGJDAFLK
+ADFGIJKL IGJDAFLK
+ADFHIJKL HJIDAFLK
+ADGHIJKL HJIDAGLK
+AEFGHIJK EGJFAHIK
+AEFGHIJL EGJFAHLI
+AEFGHIKL EGIFAHLK
+AEFGHJKL EGJFAHLK
+AEFGIJKL EJIFAGLK
+AEFHIJKL EJIFAHLK
+AEGHIJKL EJIAHGLK
+AFGHIJKL HJIFAGLK
+BCDEFGHI CGBDHFEI
+BCDEFGHJ HGBCJFDE
+BCDEFGHK CGBDHFEK
+BCDEFGHL CGBDHFLE
+BCDEFGIJ CGBDJFEI
+BCDEFGIK CGBDEFIK
+BCDEFGIL CGBDEFLI
+BCDEFGJK CGBDJFEK
+BCDEFGJL CGBDJFLE
+BCDEFGKL CGBDEFLK
+BCDEFHIJ CJBDHFEI
+BCDEFHIK CEBDHFIK
+BCDEFHIL CEBDHFLI
+BCDEFHJK CJBDHFEK
+BCDEFHJL CJBDHFLE
+BCDEFHKL CEBDHFLK
+BCDEFIJK CJBDEFIK
+BCDEFIJL CJBDEFLI
+BCDEFIKL CEBDIFLK
+BCDEFJKL CJBDEFLK
+BCDEGHIJ HGBCJDEI
+BCDEGHIK EGBCHDIK
+BCDEGHIL EGBCHDLI
+BCDEGHJK HGBCJDEK
+BCDEGHJL HGBCJDLE
+BCDEGHKL EGBCHDLK
+BCDEGIJK EGBCJDIK
+BCDEGIJL EGBCJDLI
+BCDEGIKL EGBCIDLK
+BCDEGJKL EGBCJDLK
+BCDEHIJK EJBCHDIK
+BCDEHIJL EJBCHDLI
+BCDEHIKL EIBCHDLK
+BCDEHJKL EJBCHDLK
+BCDEIJKL EJBCIDLK
+BCDFGHIJ HGBCJFDI
+BCDFGHIK CGBDHFIK
+BCDFGHIL CGBDHFLI
+BCDFGHJK HGBCJFDK
+BCDFGHJL CGBDHFLJ
+BCDFGHKL CGBDHFLK
+BCDFGIJK CGBDJFIK
+BCDFGIJL CGBDJFLI
+BCDFGIKL CGBDIFLK
+BCDFGJKL CGBDJFLK
+BCDFHIJK CJBDHFIK
+BCDFHIJL CJBDHFLI
+BCDFHIKL CIBDHFLK
+BCDFHJKL CJBDHFLK
+BCDFIJKL CJBDIFLK
+BCDGHIJK HGBCJDIK
+BCDGHIJL HGBCJDLI
+BCDGHIKL HGBCIDLK
+BCDGHJKL HGBCJDLK
+BCDGIJKL IGBCJDLK
+BCDHIJKL HJBCIDLK
+BCEFGHIJ HGBCJFEI
+BCEFGHIK EGBCHFIK
+BCEFGHIL EGBCHFLI
+BCEFGHJK HGBCJFEK
+BCEFGHJL HGBCJFLE
+BCEFGHKL EGBCHFLK
+BCEFGIJK EGBCJFIK
+BCEFGIJL EGBCJFLI
+BCEFGIKL EGBCIFLK
+BCEFGJKL EGBCJFLK
+BCEFHIJK EJBCHFIK
+BCEFHIJL EJBCHFLI
+BCEFHIKL EIBCHFLK
+BCEFHJKL EJBCHFLK
+BCEFIJKL EJBCIFLK
+BCEGHIJK EJBCHGIK
+BCEGHIJL EJBCHGLI
+BCEGHIKL EGBCIHLK
+BCEGHJKL EJBCHGLK
+BCEGIJKL EJBCIGLK
+BCEHIJKL EJBCIHLK
+BCFGHIJK HGBCJFIK
+BCFGHIJL HGBCJFLI
+BCFGHIKL HGBCIFLK
+BCFGHJKL HGBCJFLK
+BCFGIJKL IGBCJFLK
+BCFHIJKL HJBCIFLK
+BCGHIJKL HJBCIGLK
+BDEFGHIJ HGBDJFEI
+BDEFGHIK EGBDHFIK
+BDEFGHIL EGBDHFLI
+BDEFGHJK HGBDJFEK
+BDEFGHJL HGBDJFLE
+BDEFGHKL EGBDHFLK
+BDEFGIJK EGBDJFIK
+BDEFGIJL EGBDJFLI
+BDEFGIKL EGBDIFLK
+BDEFGJKL EGBDJFLK
+BDEFHIJK EJBDHFIK
+BDEFHIJL EJBDHFLI
+BDEFHIKL EIBDHFLK
+BDEFHJKL EJBDHFLK
+BDEFIJKL EJBDIFLK
+BDEGHIJK EJBDHGIK
+BDEGHIJL EJBDHGLI
+BDEGHIKL EGBDIHLK
+BDEGHJKL EJBDHGLK
+BDEGIJKL EJBDIGLK
+BDEHIJKL EJBDIHLK
+BDFGHIJK HGBDJFIK
+BDFGHIJL HGBDJFLI
+BDFGHIKL HGBDIFLK
+BDFGHJKL HGBDJFLK
+BDFGIJKL IGBDJFLK
+BDFHIJKL HJBDIFLK
+BDGHIJKL HJBDIGLK
+BEFGHIJK EJBFHGIK
+BEFGHIJL EJBFHGLI
+BEFGHIKL EGBFIHLK
+BEFGHJKL EJBFHGLK
+BEFGIJKL EJBFIGLK
+BEFHIJKL EJBFIHLK
+BEGHIJKL EJIBHGLK
+BFGHIJKL HJBFIGLK
+CDEFGHIJ CGJDHFEI
+CDEFGHIK CGEDHFIK
+CDEFGHIL CGEDHFLI
+CDEFGHJK CGJDHFEK
+CDEFGHJL CGJDHFLE
+CDEFGHKL CGEDHFLK
+CDEFGIJK CGEDJFIK
+CDEFGIJL CGEDJFLI
+CDEFGIKL CGEDIFLK
+CDEFGJKL CGEDJFLK
+CDEFHIJK CJEDHFIK
+CDEFHIJL CJEDHFLI
+CDEFHIKL CEIDHFLK
+CDEFHJKL CJEDHFLK
+CDEFIJKL CJEDIFLK
+CDEGHIJK EGJCHDIK
+CDEGHIJL EGJCHDLI
+CDEGHIKL EGICHDLK
+CDEGHJKL EGJCHDLK
+CDEGIJKL EGICJDLK
+CDEHIJKL EJICHDLK
+CDFGHIJK CGJDHFIK
+CDFGHIJL CGJDHFLI
+CDFGHIKL CGIDHFLK
+CDFGHJKL CGJDHFLK
+CDFGIJKL CGIDJFLK
+CDFHIJKL CJIDHFLK
+CDGHIJKL HGICJDLK
+CEFGHIJK EGJCHFIK
+CEFGHIJL EGJCHFLI
+CEFGHIKL EGICHFLK
+CEFGHJKL EGJCHFLK
+CEFGIJKL EGICJFLK
+CEFHIJKL EJICHFLK
+CEGHIJKL EJICHGLK
+CFGHIJKL HGICJFLK
+DEFGHIJK EGJDHFIK
+DEFGHIJL EGJDHFLI
+DEFGHIKL EGIDHFLK
+DEFGHJKL EGJDHFLK
+DEFGIJKL EGIDJFLK
+DEFHIJKL EJIDHFLK
+DEGHIJKL EJIDHGLK
+DFGHIJKL HGIDJFLK
+EFGHIJKL EJIFHGLK
+""",
+}
+
+def MpStrGroupsStrRouteOfficial(lTslot: list[SThirdSlot]) -> Optional[dict[str, str]]:
+	""" the published table for these slots (in any order), as qualifying groups -> the group routed to
+	each of lTslot, or None if we don't have one """
+
+	tuTslotSorted = tuple(sorted(lTslot))
+
+	for tuTslot, strTable in g_mpTuTslotStrTable.items():
+		if tuple(sorted(tuTslot)) != tuTslotSorted:
+			continue
+
+		lISlot = [tuTslot.index(tslot) for tslot in lTslot]
+		mpStrGroupsStrRoute: dict[str, str] = {}
+
+		for strLine in strTable.splitlines():
+			if not strLine:
+				continue
+			strGroups, strRoute = strLine.split()
+			mpStrGroupsStrRoute[strGroups] = ''.join(strRoute[iSlot] for iSlot in lISlot)
+
+		return mpStrGroupsStrRoute
+
+	return None
+
+def StrRouteFirstFit(lTslot: list[SThirdSlot], strGroups: str) -> str:
+	""" the first assignment of the thirds from strGroups to lTslot that fits every slot's seed, filling the
+	pickiest slots first. if nothing fits, they're just handed out in order. """
+
+	lISlotOrder = sorted(range(len(lTslot)), key=lambda iSlot: (len(lTslot[iSlot].strGroups), iSlot))
+	lStrGroupRoute: list[str] = [''] * len(lTslot)
+
+	def FAssign(iOrder: int, strGroupsLeft: str) -> bool:
+		if iOrder == len(lTslot):
+			return True
+
+		iSlot = lISlotOrder[iOrder]
+
+		for strGroup in strGroupsLeft:
+			if strGroup not in lTslot[iSlot].strGroups:
+				continue
+			lStrGroupRoute[iSlot] = strGroup
+			if FAssign(iOrder + 1, strGroupsLeft.replace(strGroup, '')):
+				return True
+
+		return False
+
+	if not FAssign(0, strGroups):
+		return strGroups
+
+	return ''.join(lStrGroupRoute)
+
+def MpStrGroupsStrRoute(lStrGroup: list[str], lTslot: list[SThirdSlot]) -> tuple[dict[str, str], bool]:
+	""" the group routed to each of lTslot for every combination of lStrGroup the thirds can come from,
+	and whether that's the published table """
+
+	if (mpStrGroupsStrRoute := MpStrGroupsStrRouteOfficial(lTslot)) is not None:
+		return mpStrGroupsStrRoute, True
+
+	return {
+		''.join(tuStrGroup): StrRouteFirstFit(lTslot, ''.join(tuStrGroup))
+			for tuStrGroup in itertools.combinations(sorted(lStrGroup), len(lTslot))
+	}, False
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import datetime
+import numpy as np
+
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+g_cSecMinute = 60
+g_cSecHour = 60 * g_cSecMinute
+g_cSecDay = 24 * g_cSecHour
+
+class STzSpan(NamedTuple): # tag = tzspan
+	""" a stretch of time where a timezone keeps the same utc offset, dst-ness and abbreviation """
+
+	secUtcMin: int		# utc epoch second the span starts at
+	cSecOffset: int
+	fDst: bool
+	strAbbrev: str
+
+	def TuKey(self) -> tuple[int, bool, str]:
+		return (self.cSecOffset, self.fDst, self.strAbbrev)
+
+class CZoneSpans: # tag = zspans
+	""" the utc offset transitions of a timezone over a window of time.
+
+	zoneinfo does not expose its transition table, so we probe the zone once a day across the window
+	and bisect down to the second wherever consecutive probes disagree. tournaments last weeks, so this
+	is a few dozen tzinfo calls per zone instead of one (or several) arrow conversions per match. """
+
+	def __init__(self, zoneinfo: ZoneInfo, secUtcMin: int, secUtcMax: int) -> None:
+		self.zoneinfo = zoneinfo
+
+		lTzspan: list[STzSpan] = [self.TzspanProbe(secUtcMin)]
+		secPrev = secUtcMin
+
+		for secProbe in range(secUtcMin + g_cSecDay, secUtcMax + g_cSecDay, g_cSecDay):
+			tzspanProbe = self.TzspanProbe(secProbe)
+
+			# loop in case a single day holds more than one transition
+
+			while tzspanProbe.TuKey() != lTzspan[-1].TuKey():
+				secLo = max(secPrev, lTzspan[-1].secUtcMin)
+				secHi = secProbe
+
+				while secHi - secLo > 1:
+					secMid = (secLo + secHi) // 2
+					if self.TzspanProbe(secMid).TuKey() == lTzspan[-1].TuKey():
+						secLo = secMid
+					else:
+						secHi = secMid
+
+				lTzspan.append(self.TzspanProbe(secHi))
+
+			secPrev = secProbe
+
+		self.lTzspan: list[STzSpan] = lTzspan
+		self.aSecUtcMin: np.ndarray = np.array([tzspan.secUtcMin for tzspan in lTzspan], dtype=np.int64)
+		self.aCSecOffset: np.ndarray = np.array([tzspan.cSecOffset for tzspan in lTzspan], dtype=np.int64)
+		self.aFDst: np.ndarray = np.array([tzspan.fDst for tzspan in lTzspan], dtype=bool)
+
+	def TzspanProbe(self, secUtc: int) -> STzSpan:
+		dtTz = datetime.datetime.fromtimestamp(secUtc, tz=self.zoneinfo)
+
+		dTOffset = dtTz.utcoffset()
+		assert isinstance(dTOffset, datetime.timedelta)
+
+		dTDst = dtTz.dst()
+		fDst = bool(dTDst and dTDst.total_seconds() > 0)
+
+		return STzSpan(secUtc, int(dTOffset.total_seconds()), fDst, dtTz.tzname() or '')
+
+	def AISpanFromASecUtc(self, aSecUtc: np.ndarray) -> np.ndarray:
+		""" index of the span holding each utc time. times before the window get the first span. """
+		aISpan = np.searchsorted(self.aSecUtcMin, aSecUtc, side='right') - 1
+		return np.maximum(aISpan, 0)
+
+	def TzspanFromSecUtc(self, secUtc: int) -> STzSpan:
+		iSpan = int(self.AISpanFromASecUtc(np.array([secUtc], dtype=np.int64))[0])
+		return self.lTzspan[iSpan]
+
+class CLocalTimes: # tag = loct
+	""" local dates, times and dst flags for an array of utc times, all converted at once. """
+
+	def __init__(self, zspans: CZoneSpans, aSecUtc: np.ndarray) -> None:
+		self.zspans = zspans
+
+		self.aISpan: np.ndarray = zspans.AISpanFromASecUtc(aSecUtc)
+		self.aCSecOffset: np.ndarray = zspans.aCSecOffset[self.aISpan]
+		self.aFDst: np.ndarray = zspans.aFDst[self.aISpan]
+
+		aSecLocal = aSecUtc + self.aCSecOffset
+		aDay, aSecOfDay = np.divmod(aSecLocal, g_cSecDay)
+		aHour, aSecOfHour = np.divmod(aSecOfDay, g_cSecHour)
+		aMinute, aSecond = np.divmod(aSecOfHour, g_cSecMinute)
+
+		self.aDate: np.ndarray = aDay.astype('datetime64[D]')
+		self.aHour: np.ndarray = aHour
+		self.aMinute: np.ndarray = aMinute
+		self.aSecond: np.ndarray = aSecond
+
+class CMatchTimes: # tag = mtimes
+	""" a tournament's match start times as a utc epoch array. local times are computed a zone at a time
+	(rather than a match at a time) and cached, since every page in a process shares the tournament. """
+
+	# pad the window so page-level lookups (e.g. midnight utc of the first display date) stay inside it
+
+	s_cSecWindowPad = 7 * g_cSecDay
+
+	def __init__(self, lId: list[int], aSecUtc: np.ndarray, aFGroup: np.ndarray) -> None:
+		self.lId: list[int] = lId
+		self.mpIdI: dict[int, int] = {id: i for i, id in enumerate(self.lId)}
+		self.aSecUtc: np.ndarray = aSecUtc.astype(np.int64)
+		self.aFGroup: np.ndarray = aFGroup.astype(bool)
+
+		self.secUtcMin: int = int(self.aSecUtc.min()) - self.s_cSecWindowPad
+		self.secUtcMax: int = int(self.aSecUtc.max()) + self.s_cSecWindowPad
+
+		self.mpStrTzLoct: dict[str, CLocalTimes] = {}
+
+	def LoctFromZoneinfo(self, zoneinfo: ZoneInfo) -> CLocalTimes:
+		loct = self.mpStrTzLoct.get(zoneinfo.key)
+
+		if loct is None:
+			zspans = CZoneSpans(zoneinfo, self.secUtcMin, self.secUtcMax)
+			loct = CLocalTimes(zspans, self.aSecUtc)
+			self.mpStrTzLoct[zoneinfo.key] = loct
+
+		return loct
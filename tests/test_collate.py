@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import fpdf
+import io
+import tempfile
+import unittest
+
+from pathlib import Path
+from PIL import Image
+from pypdf import PdfReader
+
+from stp.collate import CCollatedPdf
+
+def WritePdf(path: Path, lStrText: list[str], bPng: bytes) -> None:
+	""" a page per string, each with the same font and image """
+
+	pdf = fpdf.FPDF()
+	pdf.set_font('helvetica', size=24)
+	for strText in lStrText:
+		pdf.add_page()
+		pdf.image(io.BytesIO(bPng), x=10, y=10, w=20)
+		pdf.text(10, 50, strText)
+	pdf.output(str(path))
+
+def LStrTextFromPath(path: Path) -> list[str]:
+	return [page.extract_text().strip() for page in PdfReader(path).pages]
+
+class TestCollate(unittest.TestCase):
+
+	def setUp(self) -> None:
+		self.tempdir = tempfile.TemporaryDirectory()
+		self.pathDir = Path(self.tempdir.name)
+
+		bytesio = io.BytesIO()
+		Image.new('RGB', (8, 8), (200, 30, 30)).save(bytesio, format='PNG')
+
+		self.pathA = self.pathDir / 'a.pdf'
+		self.pathB = self.pathDir / 'b.pdf'
+		WritePdf(self.pathA, ['alpha'], bytesio.getvalue())
+		WritePdf(self.pathB, ['bravo', 'charlie'], bytesio.getvalue())
+
+		self.pathOutput = self.pathDir / 'out' / 'all.pdf'
+
+	def tearDown(self) -> None:
+		self.tempdir.cleanup()
+
+	def test_collate(self) -> None:
+		colpdf = CCollatedPdf(self.pathOutput)
+
+		# a is appended twice, the way CollateDocr does for zones that share a page
+
+		for path in (self.pathA, self.pathB, self.pathA):
+			colpdf.Append(path)
+
+		self.assertFalse(self.pathOutput.exists())
+
+		colpdf.Close()
+
+		self.assertFalse(colpdf.pathTemp.exists())
+		self.assertEqual(LStrTextFromPath(self.pathOutput), ['alpha', 'bravo', 'charlie', 'alpha'])
+		self.assertGreater(colpdf.cDedup, 0)
+
+		# the font and image are written once and shared by every page
+
+		lPage = PdfReader(self.pathOutput).pages
+		setIdImage = {page['/Resources'].raw_get('/XObject').get_object().raw_get('/I1').idnum for page in lPage}
+		self.assertEqual(len(setIdImage), 1)
+
+	def test_abort(self) -> None:
+		colpdf = CCollatedPdf(self.pathOutput)
+		colpdf.Append(self.pathA)
+		colpdf.Close()
+
+		bOutput = self.pathOutput.read_bytes()
+
+		colpdf = CCollatedPdf(self.pathOutput)
+		colpdf.Append(self.pathB)
+		colpdf.Abort()
+
+		self.assertFalse(colpdf.pathTemp.exists())
+		self.assertEqual(self.pathOutput.read_bytes(), bOutput)
+
+if __name__ == '__main__':
+	unittest.main()
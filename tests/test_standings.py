@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import unittest
+
+import numpy as np
+
+from stp.standings import CGroupTable, CStandings
+
+# one group where A1 and A2 finish level on points: A1 has the better goal difference, but A2 won
+# their match. A4 is third and A3 last either way.
+
+g_mpStrSeedStrTeam = {'A1': 'AAA', 'A2': 'BBB', 'A3': 'CCC', 'A4': 'DDD'}
+
+g_lTuMatch = [
+	('A1', 'A2', 0, 1),
+	('A1', 'A3', 5, 0),
+	('A1', 'A4', 5, 0),
+	('A2', 'A3', 1, 0),
+	('A2', 'A4', 0, 1),
+	('A3', 'A4', 0, 0),
+]
+
+def StandingsFromLTuMatch(lTuMatch: list[tuple[str, str, int, int]], fHeadToHeadFirst: bool) -> CStandings:
+	gtable = CGroupTable(
+				g_mpStrSeedStrTeam,
+				[tu[0] for tu in lTuMatch],
+				[tu[1] for tu in lTuMatch],
+				['1A', '2A'],
+				fHeadToHeadFirst)
+
+	return CStandings(gtable, np.array([tu[2] for tu in lTuMatch]), np.array([tu[3] for tu in lTuMatch]))
+
+class TestStandings(unittest.TestCase):
+
+	def LStrTeam(self, standings: CStandings) -> list[str]:
+		return [standing.strTeam for standing in standings.LStandingGroup('A')]
+
+	def test_overall_first(self) -> None:
+		standings = StandingsFromLTuMatch(g_lTuMatch, fHeadToHeadFirst=False)
+		self.assertEqual(self.LStrTeam(standings), ['AAA', 'BBB', 'DDD', 'CCC'])
+		self.assertEqual(standings.StrTeamFromStrSeed('1A'), 'AAA')
+
+	def test_head_to_head_first(self) -> None:
+		standings = StandingsFromLTuMatch(g_lTuMatch, fHeadToHeadFirst=True)
+		self.assertEqual(self.LStrTeam(standings), ['BBB', 'AAA', 'DDD', 'CCC'])
+		self.assertEqual(standings.StrTeamFromStrSeed('1A'), 'BBB')
+		self.assertEqual(standings.StrPlace('AAA'), '2')
+
+	def test_unbroken_tie(self) -> None:
+		# A1 and A2 draw and match each other everywhere else, so only fair play or lots could split them
+
+		lTuMatch = [
+			('A1', 'A2', 1, 1),
+			('A1', 'A3', 1, 0),
+			('A1', 'A4', 2, 0),
+			('A2', 'A3', 1, 0),
+			('A2', 'A4', 2, 0),
+			('A3', 'A4', 0, 0),
+		]
+
+		for fHeadToHeadFirst in (False, True):
+			standings = StandingsFromLTuMatch(lTuMatch, fHeadToHeadFirst)
+			self.assertEqual(standings.StrPlace('AAA'), '')
+			self.assertEqual(standings.StrPlace('BBB'), '')
+			self.assertEqual(standings.StrTeamFromStrSeed('1A'), '')
+			self.assertEqual(standings.StrPlace('CCC'), '3')
+
+	def test_group_in_progress(self) -> None:
+		lTuMatch = g_lTuMatch[:-1] + [('A3', 'A4', -1, -1)]
+		standings = StandingsFromLTuMatch(lTuMatch, fHeadToHeadFirst=False)
+		self.assertEqual(standings.StrPlace('AAA'), '')
+		self.assertEqual(standings.StrTeamFromStrSeed('1A'), '')
+
+if __name__ == '__main__':
+	unittest.main()
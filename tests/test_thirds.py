@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations  # Forward refs without quotes (eg foo: CFoo, not foo: 'CFoo')
+
+import itertools
+import unittest
+
+from stp.thirds import SThirdSlot, MpStrGroupsStrRoute, StrRouteFirstFit, g_mpTuTslotStrTable
+
+# euro 2024's round of 16 third place slots, in match order (39, 40, 41, 43)
+
+g_lTslotEuro24 = [
+	SThirdSlot('1B', 'ADEF'),
+	SThirdSlot('1C', 'DEF'),
+	SThirdSlot('1F', 'ABC'),
+	SThirdSlot('1E', 'ABCD'),
+]
+
+class TestThirds(unittest.TestCase):
+
+	def test_euro_2024(self) -> None:
+		# thirds went through from C, D, E and F: ESP v GEO (3F), ENG v SVK (3E), POR v SVN (3C), ROU v NED (3D)
+
+		mpStrGroupsStrRoute, fOfficial = MpStrGroupsStrRoute(list('ABCDEF'), g_lTslotEuro24)
+		self.assertTrue(fOfficial)
+		self.assertEqual(len(mpStrGroupsStrRoute), 15)
+		self.assertEqual(mpStrGroupsStrRoute['CDEF'], 'FECD')
+		self.assertEqual(mpStrGroupsStrRoute['ABCD'], 'ADCB')
+
+	def test_tables_fit_their_seeds(self) -> None:
+		for tuTslot in g_mpTuTslotStrTable:
+			lStrGroup = sorted(set(''.join(tslot.strGroups for tslot in tuTslot)))
+			mpStrGroupsStrRoute, fOfficial = MpStrGroupsStrRoute(lStrGroup, list(tuTslot))
+			self.assertTrue(fOfficial)
+			self.assertEqual(set(mpStrGroupsStrRoute), {''.join(tu) for tu in itertools.combinations(lStrGroup, len(tuTslot))})
+
+			for strGroups, strRoute in mpStrGroupsStrRoute.items():
+				self.assertEqual(''.join(sorted(strRoute)), strGroups)
+				for strGroup, tslot in zip(strRoute, tuTslot):
+					self.assertIn(strGroup, tslot.strGroups)
+
+	def test_first_fit(self) -> None:
+		lTslot = [SThirdSlot('1A', 'CDE'), SThirdSlot('1B', 'AB'), SThirdSlot('1C', 'ABE')]
+		_, fOfficial = MpStrGroupsStrRoute(list('ABCDE'), lTslot)
+		self.assertFalse(fOfficial)
+		self.assertEqual(StrRouteFirstFit(lTslot, 'ABC'), 'CAB')
+		self.assertEqual(StrRouteFirstFit(lTslot, 'CDE'), 'CDE')		# nothing fits
+
+if __name__ == '__main__':
+	unittest.main()